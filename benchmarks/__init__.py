@@ -0,0 +1 @@
+# Skrip benchmark & load test (jalankan dengan python -m benchmarks.<nama>)
@@ -0,0 +1,102 @@
+import argparse
+import time
+
+import numpy as np
+
+from jaga.anomaly import TreeBudget
+from jaga.compiled import CompiledModel
+from jaga.pipeline import load_pipeline
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK ENGINE ANOMALY SCORE
+# ==========================================
+# python -m benchmarks.bench_anomaly --versions v1_2 --rows 100000
+#
+#   parity     : anomaly_score & probabilitas XGBoost hilir dibanding sklearn
+#                (decision_function + predict_proba), termasuk keputusan
+#                allow/review/block yang berubah, untuk FlatForest (compiled lama),
+#                IsolationEngine lengkap & mode pohon terbatas (TreeBudget)
+#   throughput : us/baris lapisan anomaly saja untuk batch 1 .. 100k baris
+
+BATCH_SIZES = (1, 10, 100, 1000, 10_000, 100_000)
+
+
+def _timed(fn, rows):
+    # Ulang sampai ~0.3 detik, ambil waktu terbaik dari 3 putaran
+    fn()
+    repeat = max(1, int(0.1 / max(_once(fn), 1e-6)))
+    return min(_loop(fn, repeat) for _ in range(3)) / rows
+
+
+def _once(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _loop(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parity & throughput engine Isolation Forest")
+    parser.add_argument('--versions', nargs='+', default=['v0', 'v1', 'v1_2'])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--min-trees', type=int, nargs='+', default=[10, 20, 40])
+    args = parser.parse_args(argv)
+
+    df = make_transactions(max(args.rows, max(BATCH_SIZES)), seed=13, fraud_scale=20)
+    for version in args.versions:
+        assets = load_pipeline(f'models/{version}')
+        compiled = CompiledModel.from_assets(assets)
+        engine = compiled.iso_engine
+        n_pre = assets['features'].n_preprocessed
+        X = assets['features'].from_frame(df)
+        X32 = X[:, :n_pre].astype(np.float32)
+        parity = X32[:args.rows]
+
+        ref_anomaly = assets['iso_forest'].decision_function(X[:args.rows, :n_pre])
+        X[:args.rows, n_pre] = ref_anomaly
+        ref_proba = assets['xgb_model'].predict_proba(X[:args.rows])[:, 1]
+        ref_band = assets['policy'].band_index(ref_proba)
+
+        def downstream(anomaly):
+            X_model = X[:args.rows].astype(np.float32)
+            X_model[:, n_pre] = anomaly
+            return compiled.xgb_proba(X_model)
+
+        flat = -(2.0 ** (-compiled.iso_forest.leaf_sum(parity) / compiled.iso_denominator)) - compiled.iso_offset
+        modes = [('FlatForest', flat, np.full(len(parity), engine.n_trees)),
+                 ('engine lengkap', engine.score(parity), np.full(len(parity), engine.n_trees))]
+        for min_trees in args.min_trees:
+            modes.append((f'engine min {min_trees}', *engine.score_budget(parity, TreeBudget(min_trees))))
+
+        print(f"{version}: {engine.n_trees} pohon, depth {engine.depth}, {args.rows:,} baris")
+        print(f"{'mode':<18}{'rata2 pohon':>12}{'max |skor|':>12}{'max |proba|':>13}{'p99 |proba|':>13}"
+              f"{'keputusan beda':>16}")
+        for name, anomaly, used in modes:
+            proba_diff = np.abs(downstream(anomaly) - ref_proba)
+            changed = int((assets['policy'].band_index(downstream(anomaly)) != ref_band).sum())
+            print(f"{name:<18}{used.mean():>12.1f}{np.abs(anomaly - ref_anomaly).max():>12.2e}"
+                  f"{proba_diff.max():>13.2e}{np.quantile(proba_diff, 0.99):>13.2e}{changed:>16,}")
+
+        budget = TreeBudget(args.min_trees[len(args.min_trees) // 2])
+        print(f"\n{'batch':>8}{'sklearn us':>12}{'Flat us':>10}{'engine us':>11}"
+              f"{f'min {budget.min_trees} us':>11}{'x lengkap':>11}{'x terbatas':>12}")
+        for batch in BATCH_SIZES:
+            Xb, X32b = X[:batch, :n_pre], X32[:batch]
+            sk = _timed(lambda: assets['iso_forest'].decision_function(Xb), batch)
+            fl = _timed(lambda: compiled.iso_forest.leaf_sum(X32b), batch)
+            en = _timed(lambda: engine.score(X32b), batch)
+            bu = _timed(lambda: engine.score_budget(X32b, budget), batch)
+            print(f"{batch:>8,}{sk * 1e6:>12.2f}{fl * 1e6:>10.2f}{en * 1e6:>11.2f}{bu * 1e6:>11.2f}"
+                  f"{sk / en:>10.1f}x{sk / bu:>11.1f}x")
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# ==========================================
+# BENCHMARK START DASHBOARD STREAMLIT
+# ==========================================
+# python -m benchmarks.bench_app_startup
+#
+# Setiap halaman dijalankan di proses Python baru lewat streamlit AppTest
+# (option_menu diganti agar langsung memilih halaman tersebut):
+#
+#   cold_start_s   : proses baru -> script selesai dijalankan pertama kali
+#   first_paint_s  : proses baru -> elemen pertama dikirim ke browser
+#   rerun_s        : rerun kedua di proses yang sama (cache sudah hangat)
+#   modules        : modul berat yang ikut ter-import oleh halaman
+
+PAGES = ["Deteksi Fraud", "Batch Scoring", "Penjelasan Model", "Tentang Dataset", "About Me"]
+HEAVY_MODULES = ['pandas', 'numpy', 'joblib', 'sklearn', 'xgboost', 'matplotlib', 'seaborn', 'pyarrow']
+
+
+def measure_worker(page):
+    start = time.perf_counter()
+    import streamlit_option_menu
+    from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+    from streamlit.testing.v1 import AppTest
+
+    streamlit_option_menu.option_menu = lambda *args, **kwargs: page
+
+    first_paint = []
+    enqueue = ScriptRunContext.enqueue
+
+    def record_enqueue(self, msg):
+        if not first_paint and msg.HasField('delta'):
+            first_paint.append(time.perf_counter() - start)
+        return enqueue(self, msg)
+
+    ScriptRunContext.enqueue = record_enqueue
+
+    at = AppTest.from_file(os.path.abspath('app.py'), default_timeout=300).run()
+    cold_start = time.perf_counter() - start
+    rerun_start = time.perf_counter()
+    at.run()
+    rerun = time.perf_counter() - rerun_start
+    return {
+        'page': page,
+        'cold_start_s': cold_start,
+        'first_paint_s': first_paint[0] if first_paint else None,
+        'rerun_s': rerun,
+        'exception': [e.value for e in at.exception],
+        'modules': [m for m in HEAVY_MODULES if m in sys.modules],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Waktu cold start & first paint tiap halaman dashboard")
+    parser.add_argument('--pages', nargs='*', default=PAGES)
+    parser.add_argument('--repeat', type=int, default=3, help="Ambil median dari beberapa proses")
+    parser.add_argument('--output', help="Simpan hasil ke file JSON")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(measure_worker(args.worker)))
+        return
+
+    results = []
+    print(f"{'halaman':<18}{'cold start s':>14}{'first paint s':>15}{'rerun s':>9}  modul berat")
+    for page in args.pages:
+        runs = []
+        for _ in range(args.repeat):
+            proc = subprocess.run([sys.executable, '-m', 'benchmarks.bench_app_startup', '--worker', page],
+                                  capture_output=True, text=True)
+            if proc.returncode != 0:
+                raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+            runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        runs.sort(key=lambda r: r['cold_start_s'])
+        result = runs[len(runs) // 2]
+        results.append(result)
+        paint = f"{result['first_paint_s']:.2f}" if result['first_paint_s'] is not None else '-'
+        print(f"{page:<18}{result['cold_start_s']:>14.2f}{paint:>15}{result['rerun_s']:>9.3f}  "
+              f"{', '.join(result['modules']) or '-'}" + (f"  ERROR {result['exception']}" if result['exception'] else ''))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == '__main__':
+    main()
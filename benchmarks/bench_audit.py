@@ -0,0 +1,141 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from jaga.audit import AuditLog, _RotatingWriter, query, to_table
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK AUDIT LOG
+# ==========================================
+# python -m benchmarks.bench_audit --rows 1000000 --days 7
+#
+#   record     : biaya AuditLog.record() di thread scoring per panggilan (payload
+#                API 1 / 32 / 256 record) dibanding menulis Parquet sinkron per
+#                panggilan (pq.write_table satu file per request)
+#   throughput : baris/detik thread latar untuk --rows baris (chunk 10k, block=True
+#                seperti jaga/batch.py), termasuk close()
+#   query      : jendela 1 jam + type + decision pada log --days hari (file dirotasi
+#                per jam) dibanding baca seluruh folder dengan pandas lalu filter
+
+BATCH_SIZES = (1, 32, 256)
+DECISIONS = np.array(['allow', 'review', 'block'], dtype=object)
+
+
+def _scores(n, rng):
+    proba = rng.random(n) ** 8
+    anomaly = rng.normal(0.1, 0.05, n)
+    decision = DECISIONS[np.searchsorted([0.5, 0.9], proba)]
+    return anomaly, proba, decision
+
+
+def bench_record(folder, df, rng):
+    import pyarrow.parquet as pq
+
+    print(f"{'record':>8}{'record() us':>13}{'sinkron us':>12}{'x':>8}")
+    for batch in BATCH_SIZES:
+        records = df.iloc[:batch].to_dict('records')
+        anomaly, proba, decision = _scores(batch, rng)
+        repeat = max(20, 20_000 // batch)
+
+        log = AuditLog(os.path.join(folder, f'record{batch}'))
+        start = time.perf_counter()
+        for _ in range(repeat):
+            log.record('api', 'v1_2', records, anomaly, proba, decision)
+        async_us = (time.perf_counter() - start) / repeat * 1e6
+        log.close()
+
+        sync_folder = os.path.join(folder, f'sync{batch}')
+        os.makedirs(sync_folder)
+        sync_repeat = min(repeat, 200)
+        start = time.perf_counter()
+        for i in range(sync_repeat):
+            table = to_table(time.time(), 'api', 'v1_2', records, anomaly, proba, decision)
+            pq.write_table(table, os.path.join(sync_folder, f'{i}.parquet'), compression='zstd')
+        sync_us = (time.perf_counter() - start) / sync_repeat * 1e6
+        print(f"{batch:>8,}{async_us:>13.1f}{sync_us:>12.1f}{sync_us / async_us:>7.0f}x")
+
+
+def bench_throughput(folder, df, rng, rows, chunk=10_000):
+    log = AuditLog(os.path.join(folder, 'throughput'), max_pending=2)
+    frames = [df.iloc[i:i + chunk] for i in range(0, len(df), chunk)]
+    scores = [_scores(len(f), rng) for f in frames]
+    start = time.perf_counter()
+    written = 0
+    while written < rows:
+        for frame, (anomaly, proba, decision) in zip(frames, scores):
+            log.record('batch', 'v1_2', frame, anomaly, proba, decision, block=True)
+            written += len(frame)
+            if written >= rows:
+                break
+    log.close()
+    elapsed = time.perf_counter() - start
+    size = sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(log.folder) for f in files)
+    print(f"\nThroughput: {log.rows_written:,} baris dalam {elapsed:.1f} detik "
+          f"({log.rows_written / elapsed:,.0f} baris/detik), {size / log.rows_written:.1f} byte/baris, "
+          f"{log.stats()['files_closed']} file, drop {log.dropped_rows:,}")
+
+
+def bench_query(folder, df, rng, days, rows_per_hour):
+    # Log beberapa hari ditulis langsung dengan cap waktu sintetis (rotasi per jam)
+    path = os.path.join(folder, 'query')
+    writer = _RotatingWriter(path, rotate_rows=10 ** 9, rotate_seconds=3600)
+    t0 = pd.Timestamp('2026-10-01', tz='UTC').timestamp()
+    chunk = 5_000
+    for hour in range(days * 24):
+        for i in range(0, rows_per_hour, chunk):
+            offset = rng.integers(0, len(df) - chunk)
+            anomaly, proba, decision = _scores(chunk, rng)
+            ts = t0 + hour * 3600 + i / rows_per_hour * 3600
+            writer.write(to_table(ts, 'api', 'v1_2', df.iloc[offset:offset + chunk], anomaly, proba, decision), ts)
+    writer.close()
+    total = days * 24 * rows_per_hour
+
+    start_ts = pd.Timestamp('2026-10-03 08:00', tz='UTC')
+    end_ts = start_ts + pd.Timedelta(hours=1)
+
+    def arrow():
+        return query(path, start_ts, end_ts, types=['TRANSFER'], decisions=['block'])
+
+    def full_scan():
+        frame = pd.read_parquet(path)
+        return frame[(frame['ts'] >= start_ts) & (frame['ts'] < end_ts)
+                     & (frame['type'] == 'TRANSFER') & (frame['decision'] == 'block')]
+
+    results = {}
+    for name, fn in (('query (pruning)', arrow), ('pandas baca semua', full_scan)):
+        fn()
+        start = time.perf_counter()
+        n = len(fn())
+        results[name] = time.perf_counter() - start
+        print(f"{name:<20}{n:>8,} baris{results[name] * 1000:>10.0f} ms")
+    print(f"Log {total:,} baris / {days} hari; query 1 jam "
+          f"{results['pandas baca semua'] / results['query (pruning)']:.0f}x lebih cepat")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Overhead & query audit log Parquet")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--days', type=int, default=7)
+    parser.add_argument('--rows-per-hour', type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(5)
+    df = make_transactions(200_000, seed=5, fraud_scale=20)
+    folder = tempfile.mkdtemp(prefix='jaga-audit-')
+    try:
+        bench_record(folder, df, rng)
+        bench_throughput(folder, df, rng, args.rows)
+        print()
+        bench_query(folder, df, rng, args.days, args.rows_per_hour)
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    main()
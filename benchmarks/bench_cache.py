@@ -0,0 +1,99 @@
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from jaga.cache import ScoreCache, SharedScoreCache
+from jaga.pipeline import RAW_COLUMNS
+from jaga.registry import ModelRegistry
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK CACHE SCORING
+# ==========================================
+# python -m benchmarks.bench_cache --requests 20000 --retry-rate 0.3
+#
+# Simulasi trafik gateway: tiap request berisi 1 transaksi, sebagian (retry_rate)
+# adalah kiriman ulang transaksi yang identik. Dibandingkan: tanpa cache, cache
+# di dalam proses, dan cache SQLite. Baris "shared" menjalankan dua proses:
+# proses kedua hanya mengirim retry dan mendapat hit dari skor proses pertama.
+
+
+def make_traffic(n_requests, retry_rate, seed=0):
+    rng = np.random.default_rng(seed)
+    n_unique = max(1, int(n_requests * (1 - retry_rate)))
+    unique = make_transactions(n_unique, seed=seed)[RAW_COLUMNS].to_dict('records')
+    traffic = list(unique)
+    # Retry datang tidak lama setelah aslinya
+    for _ in range(n_requests - n_unique):
+        i = rng.integers(0, len(traffic))
+        traffic.insert(min(len(traffic), i + rng.integers(1, 50)), dict(traffic[i]))
+    return traffic
+
+
+def run(registry, traffic):
+    latencies = np.empty(len(traffic))
+    for i, record in enumerate(traffic):
+        start = time.perf_counter()
+        registry.score_records([record])
+        latencies[i] = time.perf_counter() - start
+    return latencies * 1000
+
+
+def report(name, latencies, cache):
+    stats = cache.stats() if cache is not None else {}
+    print(f"{name:<10}{np.percentile(latencies, 50):>9.3f}{np.percentile(latencies, 99):>9.3f}"
+          f"{len(latencies) / (latencies.sum() / 1000):>12,.0f}{stats.get('hit_rate', 0.0):>10.1%}")
+
+
+def _replay_retries(path, traffic, prefer_native, out):
+    # Proses kedua: hanya retry, registry & koneksi SQLite sendiri
+    cache = SharedScoreCache(path)
+    registry = ModelRegistry(prefer_native=prefer_native, cache=cache)
+    latencies = run(registry, traffic)
+    out.put((float(np.percentile(latencies, 50)), cache.stats()['hit_rate']))
+    registry.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark cache hasil scoring")
+    parser.add_argument('--requests', type=int, default=20_000)
+    parser.add_argument('--retry-rate', type=float, default=0.3)
+    parser.add_argument('--format', choices=['native', 'pickle'], default='native')
+    args = parser.parse_args(argv)
+    native = args.format == 'native'
+
+    traffic = make_traffic(args.requests, args.retry_rate)
+    print(f"{len(traffic):,} request 1 transaksi, retry {args.retry_rate:.0%}, format {args.format}\n")
+    print(f"{'cache':<10}{'p50 ms':>9}{'p99 ms':>9}{'req/detik':>12}{'hit rate':>10}")
+
+    registry = ModelRegistry(prefer_native=native)
+    report('tanpa', run(registry, traffic), None)
+    registry.close()
+
+    cache = ScoreCache()
+    registry = ModelRegistry(prefer_native=native, cache=cache)
+    report('memory', run(registry, traffic), cache)
+    registry.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite')
+        cache = SharedScoreCache(path)
+        registry = ModelRegistry(prefer_native=native, cache=cache)
+        report('sqlite', run(registry, traffic), cache)
+
+        # Cache SQLite sudah berisi skor proses ini; proses lain langsung mendapat hit
+        out = mp.get_context('spawn').Queue()
+        proc = mp.get_context('spawn').Process(target=_replay_retries, args=(path, traffic[:2000], native, out))
+        proc.start()
+        p50, hit_rate = out.get()
+        proc.join()
+        registry.close()
+        print(f"{'shared':<10}{p50:>9.3f}{'-':>9}{'-':>12}{hit_rate:>10.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+import argparse
+import time
+
+from jaga.artifacts import load_native
+from jaga.cascade import CascadePolicy, attach_cascade
+from jaga.pipeline import score_matrix, score_model
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK CASCADE SCORING
+# ==========================================
+# python -m benchmarks.bench_cascade --versions v1 v1_2 --rows 100000
+#
+# Biaya per baris model lengkap vs cascade (dengan / tanpa prefilter) untuk dua
+# komposisi trafik:
+#   paysim         : komposisi tipe PaySim (TRANSFER + CASH_OUT ~44%)
+#   transfer_cash  : hanya TRANSFER & CASH_OUT (kasus terburuk type gate)
+# pada batch besar dan request 1 transaksi. Keputusan prefilter dicek sama
+# dengan model lengkap (selisih keputusan hanya boleh berasal dari type gate).
+
+
+def _timed(fn, repeat):
+    fn()  # pemanasan
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Biaya scoring model lengkap vs cascade")
+    parser.add_argument('--versions', nargs='+', default=['v0', 'v1', 'v1_2'])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--single', type=int, default=500, help="Jumlah request 1 transaksi")
+    args = parser.parse_args(argv)
+
+    paysim = make_transactions(args.rows, seed=21)
+    mixes = {
+        'paysim': paysim,
+        'transfer_cash': paysim[paysim['type'].isin(['TRANSFER', 'CASH_OUT'])].reset_index(drop=True),
+    }
+
+    print(f"{'versi':<7}{'trafik':<15}{'mode':<18}{'us/baris':>10}{'biaya':>8}{'ke model':>10}"
+          f"{'1 trx us':>10}{'keputusan beda':>16}")
+    for version in args.versions:
+        assets = load_native(f'models/{version}')
+        band_index = assets['policy'].band_index
+        for mix, df in mixes.items():
+            X = assets['features'].from_frame(df)
+            full_proba, _ = score_model(assets, X.copy())
+            full = _timed(lambda: score_model(assets, X.copy()), 2) / len(X)
+            singles = [X[i:i + 1] for i in range(min(args.single, len(X)))]
+            full_single = _timed(lambda: [score_model(assets, x.copy()) for x in singles], 1) / len(singles)
+            print(f"{version:<7}{mix:<15}{'model lengkap':<18}{full * 1e6:>10.2f}{'100%':>8}{'100%':>10}"
+                  f"{full_single * 1e6:>10.1f}{'-':>16}")
+
+            for name, policy in [
+                ('gate+prefilter', CascadePolicy(list(assets['features'].categories), prefilter=True)),
+                ('gate saja', CascadePolicy(list(assets['features'].categories), prefilter=False)),
+                ('prefilter saja', CascadePolicy(None, prefilter=True)),
+            ]:
+                attach_cascade(assets, f'models/{version}', policy)
+                proba, _ = score_matrix(assets, X.copy())
+                changed = int((band_index(proba) != band_index(full_proba)).sum())
+                cost = _timed(lambda: score_matrix(assets, X.copy()), 2) / len(X)
+                single = _timed(lambda: [score_matrix(assets, x.copy()) for x in singles], 1) / len(singles)
+                model_rate = assets['cascade'].stats()['model_rate']
+                print(f"{'':<7}{'':<15}{name:<18}{cost * 1e6:>10.2f}{cost / full:>8.0%}{model_rate:>10.1%}"
+                      f"{single * 1e6:>10.1f}{changed:>16,}")
+                del assets['cascade']
+        print()
+
+
+if __name__ == '__main__':
+    main()
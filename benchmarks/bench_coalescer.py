@@ -0,0 +1,88 @@
+import argparse
+import json
+import threading
+import time
+
+import numpy as np
+
+from jaga.coalescer import MicroBatcher
+from jaga.pipeline import RAW_COLUMNS, load_pipeline, score_records
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK MICRO-BATCHING
+# ==========================================
+# python -m benchmarks.bench_coalescer --clients 32 --duration 5
+#
+# Membandingkan throughput vs latensi tambahan untuk beberapa nilai max_wait_ms.
+# Baris "direct" = tanpa coalescer (tiap request memanggil model sendiri).
+
+
+def client(score, records, deadline, latencies):
+    i = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        score([records[i % len(records)]])
+        latencies.append(time.perf_counter() - start)
+        i += 1
+
+
+def measure(score, records, clients, duration):
+    latencies = []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=client, args=(score, records[k::clients], deadline, latencies))
+        for k in range(clients)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    lat_ms = np.array(latencies) * 1000
+    return {
+        'rows_per_sec': len(lat_ms) / elapsed,
+        'p50_ms': float(np.percentile(lat_ms, 50)),
+        'p99_ms': float(np.percentile(lat_ms, 99)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark throughput vs latensi micro-batching")
+    parser.add_argument('--clients', type=int, default=32, help="Jumlah pemanggil bersamaan")
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--max-batch', type=int, default=256)
+    parser.add_argument('--waits', default='0.5,1,2,5,10', help="Daftar max_wait_ms")
+    args = parser.parse_args(argv)
+
+    assets = load_pipeline()
+    records = make_transactions(5000)[RAW_COLUMNS].to_dict('records')
+    score_fn = lambda recs: score_records(assets, recs)
+
+    results = []
+    # Lock meniru satu worker yang memproses request satu per satu
+    lock = threading.Lock()
+
+    def direct(recs):
+        with lock:
+            return score_fn(recs)
+
+    results.append({'mode': 'direct', **measure(direct, records, args.clients, args.duration)})
+
+    for wait in [float(w) for w in args.waits.split(',')]:
+        batcher = MicroBatcher(score_fn, max_wait_ms=wait, max_batch=args.max_batch)
+        stats = measure(batcher.score, records, args.clients, args.duration)
+        stats['avg_batch'] = batcher.rows / max(batcher.batches, 1)
+        batcher.close()
+        results.append({'mode': f'max_wait_ms={wait}', **stats})
+
+    print(f"{'mode':<18}{'rows/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'avg batch':>11}")
+    for r in results:
+        print(f"{r['mode']:<18}{r['rows_per_sec']:>10.0f}{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}"
+              f"{r.get('avg_batch', 1):>11.1f}")
+    print(json.dumps(results))
+
+
+if __name__ == '__main__':
+    main()
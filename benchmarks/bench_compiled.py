@@ -0,0 +1,61 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from jaga.compiled import CompiledModel
+from jaga.pipeline import RAW_COLUMNS, add_features, decide, load_pipeline, score_frame, score_records
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# PARITY & LATENSI ARTEFAK TERKOMPILASI
+# ==========================================
+# python -m benchmarks.bench_compiled --model-dir models/v1_2/
+#
+# Membandingkan pickle asli (FastFeatures + sklearn + xgboost) dengan
+# CompiledModel (satu panggilan NumPy) pada data sintetis PaySim.
+
+
+def timeit(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parity & latensi CompiledModel")
+    parser.add_argument('--model-dir', default='models/v1_2/')
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    assets = load_pipeline(args.model_dir)
+    compiled = CompiledModel.from_assets(assets)
+
+    df = add_features(make_transactions(args.rows, seed=5, fraud_scale=20))
+    proba_ref, anom_ref = score_frame(assets, df)
+    proba_new, anom_new = compiled.predict_frame(df)
+    decision_match = np.mean(decide(assets, proba_ref) == decide(assets, proba_new))
+
+    print(f"Parity ({args.rows:,} baris)")
+    print(f"  max |anomaly_score diff| : {np.abs(anom_ref - anom_new).max():.3e}")
+    print(f"  max |probability diff|   : {np.abs(proba_ref - proba_new).max():.3e}")
+    print(f"  keputusan sama           : {decision_match:.4%}")
+
+    print(f"\n{'batch':>8}{'pickle ms':>12}{'compiled ms':>14}{'speedup':>10}")
+    for batch in (1, 10, 100, 1000, 10_000):
+        records = df[RAW_COLUMNS].head(batch).to_dict('records')
+        repeat = max(3, 2000 // batch)
+        ref_ms = timeit(lambda: score_records(assets, records), repeat)
+        new_ms = timeit(lambda: compiled.predict_records(records), repeat)
+        print(f"{batch:>8}{ref_ms:>12.2f}{new_ms:>14.2f}{ref_ms / new_ms:>9.1f}x")
+
+    ok = np.abs(proba_ref - proba_new).max() < 1e-5 and decision_match == 1.0
+    print("\nParity:", "LULUS" if ok else "GAGAL")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+import argparse
+import time
+
+import numpy as np
+
+from jaga.artifacts import load_native
+from jaga.drift import DriftMonitor, DriftStats
+from jaga.pipeline import RAW_COLUMNS, score_matrix
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK MONITOR DRIFT
+# ==========================================
+# python -m benchmarks.bench_drift --rows 200000
+#
+#   update   : throughput DriftStats.update (thread monitor) per ukuran batch
+#   overhead : latensi scoring 1 transaksi tanpa / dengan DriftMonitor.submit
+#   memori   : ukuran akumulator (konstan, tidak bergantung jumlah baris)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Throughput & overhead monitor drift")
+    parser.add_argument('--model-dir', default='models/v1_2')
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--requests', type=int, default=5_000)
+    args = parser.parse_args(argv)
+
+    assets = load_native(args.model_dir)
+    features = assets['features']
+    df = make_transactions(args.rows, seed=11)
+    X = features.from_frame(df)
+    proba, _ = score_matrix(assets, X)
+
+    print(f"{'batch':>8}{'baris/detik':>14}{'us/baris':>10}")
+    for size in (1, 100, 1_024, 100_000):
+        stats = DriftStats.for_features(features)
+        n = min(args.rows, max(size * 200, 100_000))
+        start = time.perf_counter()
+        for i in range(0, n, size):
+            stats.update(features, X[i:i + size], proba[i:i + size])
+        elapsed = time.perf_counter() - start
+        print(f"{size:>8,}{n / elapsed:>14,.0f}{elapsed / n * 1e6:>10.2f}")
+    print(f"\nMemori akumulator: {stats.sketches.counts.nbytes / 1024:,.0f} KB "
+          f"({stats.sketches.n_buckets:,} bucket x {len(stats.columns)} kolom), {stats.rows:,} baris")
+
+    records = df[RAW_COLUMNS].head(args.requests).to_dict('records')
+
+    def latencies(monitor):
+        out = np.empty(len(records))
+        for i, record in enumerate(records):
+            start = time.perf_counter()
+            X_one = features.from_records([record])
+            p, _ = score_matrix(assets, X_one)
+            if monitor is not None:
+                monitor.submit(X_one, p)
+            out[i] = time.perf_counter() - start
+        return out * 1e6
+
+    base = latencies(None)
+    monitor = DriftMonitor(interval=1.0)
+    monitor.bind('bench', features)
+    with_monitor = latencies(monitor)
+    monitor.flush()
+    print(f"\nScoring 1 transaksi (us)   p50 {np.percentile(base, 50):.1f} -> {np.percentile(with_monitor, 50):.1f}"
+          f" | p99 {np.percentile(base, 99):.1f} -> {np.percentile(with_monitor, 99):.1f}"
+          f" | batch dilewati {monitor.dropped_batches}")
+    monitor.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from jaga.eda import DatasetStats, collect, load_stats, save_stats
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK STATISTIK EDA DATASET
+# ==========================================
+# python -m benchmarks.bench_eda --rows 1000000
+#
+#   throughput : python -m jaga.eda atas CSV sintetis per ukuran chunk
+#   merge      : statistik 4 potongan yang di-merge == statistik satu kali baca
+#   artifact   : ukuran dataset_stats.json & waktu baca + ringkasan (biaya halaman)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Throughput & ukuran artifact statistik EDA")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunksizes', type=int, nargs='+', default=[50_000, 200_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    df = make_transactions(args.rows, seed=5, fraud_scale=5)
+    with tempfile.TemporaryDirectory() as folder:
+        csv_path = os.path.join(folder, 'transaksi.csv')
+        df.to_csv(csv_path, index=False)
+        print(f"CSV sintetis {args.rows:,} baris, {os.path.getsize(csv_path) / 2**20:,.0f} MB\n")
+
+        print(f"{'chunk':>10}{'detik':>8}{'baris/detik':>14}")
+        for chunksize in args.chunksizes:
+            start = time.perf_counter()
+            stats = collect(csv_path, chunksize)
+            elapsed = time.perf_counter() - start
+            print(f"{chunksize:>10,}{elapsed:>8.2f}{stats.rows / elapsed:>14,.0f}")
+
+        start = time.perf_counter()
+        DatasetStats().update(df)
+        elapsed = time.perf_counter() - start
+        print(f"{'tanpa CSV':>10}{elapsed:>8.2f}{len(df) / elapsed:>14,.0f}")
+
+        merged = DatasetStats()
+        for part in np.array_split(np.arange(len(df)), 4):
+            piece = DatasetStats()
+            piece.update(df.iloc[part])
+            merged.merge(piece)
+        same = (merged.type_table() == stats.type_table() and merged.hour_table() == stats.hour_table()
+                and np.allclose(merged.balance.mean, stats.balance.mean)
+                and np.allclose(merged.balance.std(), stats.balance.std())
+                and np.array_equal(merged.amount.counts, stats.amount.counts))
+        print(f"\nMerge 4 potongan == satu kali baca: {same}")
+
+        path = save_stats(stats, folder)
+        runs = []
+        for _ in range(20):
+            start = time.perf_counter()
+            load_stats(folder).summary()
+            runs.append(time.perf_counter() - start)
+        print(f"Artifact {os.path.getsize(path) / 1024:,.1f} KB, baca + ringkasan {np.median(runs) * 1e3:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import time
+
+import numpy as np
+
+from jaga.artifacts import has_native, load_native
+from jaga.explain import EXPLAIN_DECISIONS, explain_records
+from jaga.pipeline import RAW_COLUMNS, load_pipeline, score_records
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK BIAYA PENJELASAN (TREESHAP)
+# ==========================================
+# python -m benchmarks.bench_explain --versions v0 v1_2 --rows 5000
+#
+# Per versi model:
+#   - scoring saja vs scoring + kontribusi exact (TreeSHAP) / approximate (Saabas)
+#     untuk beberapa ukuran batch, dalam us per baris
+#   - "review/block saja": trafik sintetis PaySim, penjelasan hanya untuk baris
+#     dengan keputusan di EXPLAIN_DECISIONS (mode produksi), biaya dirata-rata
+#     ke seluruh baris
+
+
+def _timed(fn, repeat):
+    fn()  # pemanasan
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def load(version, fmt):
+    model_dir = f'models/{version}'
+    if fmt == 'native' and has_native(model_dir):
+        return load_native(model_dir, with_booster=True)
+    return load_pipeline(model_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Biaya kontribusi TreeSHAP per versi model")
+    parser.add_argument('--versions', nargs='+', default=['v0', 'v1', 'v1_2'])
+    parser.add_argument('--format', choices=['native', 'pickle'], default='native')
+    parser.add_argument('--rows', type=int, default=5_000)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 100, 5_000])
+    args = parser.parse_args(argv)
+
+    records = make_transactions(args.rows, seed=7)[RAW_COLUMNS].to_dict('records')
+
+    print(f"{'versi':<8}{'batch':>7}{'skor us/baris':>15}{'exact us/baris':>16}{'approx us/baris':>17}"
+          f"{'exact x':>9}{'approx x':>10}")
+    for version in args.versions:
+        assets = load(version, args.format)
+        for size in args.batch_sizes:
+            chunk = records[:size]
+            repeat = max(1, 2_000 // size)
+            _, anomaly_score, _ = score_records(assets, chunk)
+            score = _timed(lambda: score_records(assets, chunk), repeat) / size
+            exact = _timed(lambda: explain_records(assets, chunk, anomaly_score), repeat) / size
+            approx = _timed(lambda: explain_records(assets, chunk, anomaly_score, approximate=True), repeat) / size
+            print(f"{version:<8}{size:>7,}{score * 1e6:>15.1f}{exact * 1e6:>16.1f}{approx * 1e6:>17.1f}"
+                  f"{exact / score:>9.1f}{approx / score:>10.1f}")
+
+        # Mode produksi: hanya baris review/block yang dijelaskan
+        def score_and_explain():
+            proba, anomaly_score, decision = score_records(assets, records)
+            rows = np.flatnonzero(np.isin(decision, EXPLAIN_DECISIONS))
+            if len(rows):
+                explain_records(assets, [records[i] for i in rows], anomaly_score[rows]).top(3)
+            return len(rows)
+
+        explained = score_and_explain()
+        total = _timed(score_and_explain, 3) / len(records)
+        score = _timed(lambda: score_records(assets, records), 3) / len(records)
+        print(f"{version:<8}review/block saja ({explained / len(records):.1%} baris dijelaskan): "
+              f"{score * 1e6:.1f} -> {total * 1e6:.1f} us/baris (+{total / score - 1:.0%})\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from jaga.pipeline import RAW_COLUMNS, add_features, load_pipeline, score_frame
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# PARITY & MICROBENCHMARK FEATURE ENGINEERING
+# ==========================================
+# python -m benchmarks.bench_features --model-dir models/v1_2/
+#
+# 1. Parity: FastFeatures vs preprocessor.pkl (harus identik) dan probabilitas
+#    akhir vs jalur lama DataFrame -> preprocessor -> iso_forest -> xgboost.
+# 2. Biaya per baris: membangun DataFrame 1 baris + add_features +
+#    preprocessor.transform vs FastFeatures.from_records.
+
+
+def legacy_features(assets, records):
+    df = add_features(pd.DataFrame.from_records(records, columns=RAW_COLUMNS))
+    return assets['preprocessor'].transform(df)
+
+
+def legacy_score(assets, df):
+    X_preped = assets['preprocessor'].transform(df)
+    anomaly_score = assets['iso_forest'].decision_function(X_preped)
+    X_hybrid = np.column_stack((X_preped, anomaly_score))
+    return assets['xgb_model'].predict_proba(X_hybrid)[:, 1], anomaly_score
+
+
+def check_parity(assets, n=100_000):
+    df = add_features(make_transactions(n, seed=1))
+    expected = assets['preprocessor'].transform(df)
+    fast = assets['features'].from_frame(df)
+    n_pre = assets['features'].n_preprocessed
+
+    proba_old, anom_old = legacy_score(assets, df)
+    proba_new, anom_new = score_frame(assets, df)
+    return {
+        'rows': n,
+        'features_identical': bool(np.array_equal(expected, fast[:, :n_pre])),
+        'max_abs_feature_diff': float(np.abs(expected - fast[:, :n_pre]).max()),
+        'max_abs_anomaly_diff': float(np.abs(anom_old - anom_new).max()),
+        'max_abs_proba_diff': float(np.abs(proba_old - proba_new).max()),
+    }
+
+
+def per_row_cost(fn, records, repeat):
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn([records[i % len(records)]])
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parity & microbenchmark FastFeatures")
+    parser.add_argument('--model-dir', default='models/v1_2/')
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    assets = load_pipeline(args.model_dir)
+    parity = check_parity(assets)
+    for key, value in parity.items():
+        print(f"{key:<24}{value}")
+
+    records = make_transactions(1000, seed=2)[RAW_COLUMNS].to_dict('records')
+    features = assets['features']
+    buf = features.allocate(1)
+    legacy_us = per_row_cost(lambda r: legacy_features(assets, r), records, args.repeat)
+    fast_us = per_row_cost(lambda r: features.from_records(r, out=buf), records, args.repeat)
+    print(f"{'DataFrame + preprocessor':<28}{legacy_us:>10.1f} us/baris")
+    print(f"{'FastFeatures (prealokasi)':<28}{fast_us:>10.1f} us/baris")
+    print(f"{'Penghematan':<28}{legacy_us - fast_us:>10.1f} us/baris ({legacy_us / fast_us:.0f}x)")
+
+    ok = parity['features_identical'] and parity['max_abs_proba_diff'] < 1e-6
+    print("Parity:", "LULUS" if ok else "GAGAL")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
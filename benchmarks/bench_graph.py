@@ -0,0 +1,88 @@
+import argparse
+import resource
+import time
+
+import numpy as np
+
+from jaga.graph import AccountGraph
+from jaga.velocity import hash_accounts
+
+# ==========================================
+# BENCHMARK GRAF AKUN
+# ==========================================
+# python -m benchmarks.bench_graph --rows 30000000 --accounts 20000000
+#
+# Edge sintetis dibuat per batch (tidak disimpan, agar RSS = graf): pengirim acak
+# dari ruang --accounts, penerima condong ke akun "populer" (zipf) di 1/4 ruang
+# akun, seperti bench_velocity. Dilaporkan per ~1/10 jalan: us/edge batch terakhir
+# (harus datar saat graf membesar), akun, edge berbeda, byte/edge & peak RSS.
+# Hash ID string (hash_accounts) diukur terpisah karena sama untuk semua store.
+
+
+def make_batch(rng, n, accounts):
+    orig = rng.integers(0, accounts, n).astype(np.uint64)
+    dest = (rng.zipf(1.3, n) % (accounts // 4)).astype(np.uint64) + np.uint64(accounts)
+    # Hash 64-bit acak seperti hasil hash_accounts
+    mix = np.uint64(0xBF58476D1CE4E5B9)
+    return orig * mix, dest * mix
+
+
+def _rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Biaya update & memori AccountGraph")
+    parser.add_argument('--rows', type=int, default=30_000_000, help="Jumlah transaksi (edge)")
+    parser.add_argument('--accounts', type=int, default=20_000_000, help="Ruang ID akun pengirim")
+    parser.add_argument('--batch', type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    ids = np.char.add('C', rng.integers(0, args.accounts, args.batch).astype(str)).astype(object)
+    start = time.perf_counter()
+    hash_accounts(ids)
+    hash_us = (time.perf_counter() - start) / len(ids) * 1e6
+
+    rss_before = _rss_mb()
+    graph = AccountGraph()
+    print(f"{args.rows:,} transaksi, ruang akun {args.accounts:,}, batch {args.batch:,}\n")
+    print(f"{'edge':>12}{'akun':>12}{'edge beda':>12}{'us/edge':>9}{'komponen max':>14}"
+          f"{'graf MB':>9}{'B/edge':>8}{'RSS MB':>8}")
+
+    batch_seconds = []
+    total = 0.0
+    report_every = max(1, args.rows // args.batch // 10)
+    interval, interval_rows = 0.0, 0
+    for k, offset in enumerate(range(0, args.rows, args.batch)):
+        n = min(args.batch, args.rows - offset)
+        orig, dest = make_batch(rng, n, args.accounts)
+        t = time.perf_counter()
+        graph.update_keys(orig, dest)
+        elapsed = time.perf_counter() - t
+        batch_seconds.append(elapsed / n)
+        total += elapsed
+        interval += elapsed
+        interval_rows += n
+        if (k + 1) % report_every == 0 or offset + n >= args.rows:
+            s = graph.stats()
+            print(f"{offset + n:>12,}{s['accounts']:>12,}{s['edges']:>12,}{interval / interval_rows * 1e6:>9.2f}"
+                  f"{s['largest_component']:>14,}{s['memory_mb']:>9,.0f}{graph.nbytes / s['edges']:>8.0f}"
+                  f"{_rss_mb() - rss_before:>8,.0f}")
+            interval, interval_rows = 0.0, 0
+
+    per_edge = np.array(batch_seconds) * 1e6
+    start = time.perf_counter()
+    indptr, _ = graph.adjacency()
+    adjacency_seconds = time.perf_counter() - start
+    print(f"\nRata-rata update   : {args.rows / total:,.0f} edge/detik "
+          f"(batch p50 {np.median(per_edge):.2f} us/edge, p99 {np.percentile(per_edge, 99):.2f})")
+    print(f"Hash ID string     : {hash_us:.2f} us/ID (2 ID per transaksi, di luar angka di atas)")
+    print(f"Graf               : {graph.nbytes / 2**20:,.0f} MB, {graph.nbytes / len(graph):.0f} B/akun, "
+          f"{graph.nbytes / graph.n_edges:.0f} B/edge berbeda")
+    print(f"Peak RSS           : ~{_rss_mb() - rss_before:,.0f} MB di atas awal (termasuk salinan saat tabel tumbuh)")
+    print(f"CSR adjacency      : {adjacency_seconds:.1f} detik, {indptr[-1]:,} edge")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import json
+import os
+import time
+import warnings
+
+import numpy as np
+
+from benchmarks.bench_startup import read_smaps
+from jaga.parallel import ParallelScorer
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# SKALABILITAS SCORING MULTI-PROSES
+# ==========================================
+# python -m benchmarks.bench_parallel --rows 1000000 --workers 1 2 4 8
+#
+# Throughput score_frame pada data sintetis PaySim untuk tiap jumlah worker,
+# speedup relatif terhadap 1 worker, dan memori worker (PSS membagi halaman
+# bersama: model yang diwarisi lewat fork / mmap dihitung sekali).
+# Speedup dibatasi jumlah core fisik; angka di atas os.cpu_count() tidak berarti.
+
+
+def measure(df, model_dir, workers, prefer_native, repeat):
+    with ParallelScorer(model_dir, workers, prefer_native) as scorer:
+        scorer.score_frame(df.head(50_000))  # pemanasan: shared memory & cache
+        start = time.perf_counter()
+        for _ in range(repeat):
+            proba, _ = scorer.score_frame(df)
+        seconds = (time.perf_counter() - start) / repeat
+
+        worker_mem = []
+        if scorer._pool is not None:
+            worker_mem = [m for m in (read_smaps(pid) for pid in scorer._pool._processes) if m]
+
+    return proba, {
+        'workers': workers,
+        'start_method': scorer.start_method if workers > 1 else None,
+        'seconds': seconds,
+        'rows_per_sec': len(df) / seconds,
+        'worker_pss_mb': np.mean([m['pss_mb'] for m in worker_mem]) if worker_mem else None,
+        'worker_private_mb': np.mean([m['private_mb'] for m in worker_mem]) if worker_mem else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Skalabilitas ParallelScorer")
+    parser.add_argument('--model-dir', default='models/v1_2/')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--format', choices=['native', 'pickle'], default='native')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help="Simpan hasil ke file JSON")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings('ignore', category=UserWarning)
+    df = make_transactions(args.rows, seed=11)
+    print(f"{args.rows:,} baris, format {args.format}, {os.cpu_count()} core\n")
+    print(f"{'workers':>8}{'start':>7}{'detik':>9}{'baris/detik':>14}{'speedup':>9}{'PSS MB':>9}{'priv MB':>9}")
+
+    results = []
+    baseline = None
+    reference = None
+    for workers in args.workers:
+        proba, r = measure(df, args.model_dir, workers, args.format == 'native', args.repeat)
+        if reference is None:
+            reference, baseline = proba, r['seconds']
+        r['speedup'] = baseline / r['seconds']
+        r['max_abs_diff'] = float(np.abs(proba - reference).max())
+        results.append(r)
+
+        pss = f"{r['worker_pss_mb']:>9.1f}" if r['worker_pss_mb'] is not None else f"{'-':>9}"
+        priv = f"{r['worker_private_mb']:>9.1f}" if r['worker_private_mb'] is not None else f"{'-':>9}"
+        print(f"{workers:>8}{r['start_method'] or '-':>7}{r['seconds']:>9.2f}{r['rows_per_sec']:>14,.0f}"
+              f"{r['speedup']:>8.2f}x{pss}{priv}")
+
+    print("\nmax |proba diff| vs 1 worker:", max(r['max_abs_diff'] for r in results))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'rows': args.rows, 'format': args.format, 'cpu_count': os.cpu_count(),
+                       'results': results}, f, indent=4)
+
+
+if __name__ == '__main__':
+    main()
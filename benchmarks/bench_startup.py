@@ -0,0 +1,89 @@
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+# ==========================================
+# STARTUP TIME & RSS PER WORKER
+# ==========================================
+# python -m benchmarks.bench_startup --model-dir models/v1_2/ --workers 4
+#
+# Menjalankan N proses worker bersamaan untuk tiap format (pickle vs native
+# mmap), mengukur waktu import+load model, lalu membaca /proc/<pid>/smaps_rollup
+# (Linux). PSS membagi halaman bersama (page cache mmap, library) antar worker.
+
+WORKER_CODE = '''
+import json, sys, time
+start = time.perf_counter()
+from jaga.pipeline import load_scoring_assets
+assets = load_scoring_assets(sys.argv[1], prefer_native=sys.argv[2] == 'native')
+print(json.dumps({'load_seconds': time.perf_counter() - start}), flush=True)
+sys.stdin.read()
+'''
+
+
+def read_smaps(pid):
+    stats = {}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == 'kB':
+                    stats[parts[0].rstrip(':')] = int(parts[1])
+    except FileNotFoundError:
+        return None
+    return {
+        'rss_mb': stats.get('Rss', 0) / 1024,
+        'pss_mb': stats.get('Pss', 0) / 1024,
+        'private_mb': (stats.get('Private_Clean', 0) + stats.get('Private_Dirty', 0)) / 1024,
+    }
+
+
+def measure(model_dir, fmt, workers):
+    start = time.perf_counter()
+    procs = [
+        subprocess.Popen([sys.executable, '-c', WORKER_CODE, model_dir, fmt],
+                         stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        for _ in range(workers)
+    ]
+    loads = [json.loads(p.stdout.readline())['load_seconds'] for p in procs]
+    all_ready = time.perf_counter() - start
+    mem = [read_smaps(p.pid) for p in procs]
+    for p in procs:
+        p.stdin.close()
+        p.wait()
+
+    result = {
+        'format': fmt,
+        'workers': workers,
+        'load_seconds_avg': sum(loads) / len(loads),
+        'all_ready_seconds': all_ready,
+    }
+    if all(mem):
+        for key in ('rss_mb', 'pss_mb', 'private_mb'):
+            result[f'{key}_avg'] = sum(m[key] for m in mem) / len(mem)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark startup & memori worker (pickle vs native)")
+    parser.add_argument('--model-dir', default='models/v1_2/')
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args(argv)
+
+    from jaga.artifacts import has_native
+    if not has_native(args.model_dir):
+        parser.error(f"Format native belum ada. Jalankan: python -m jaga.artifacts {args.model_dir}")
+
+    results = [measure(args.model_dir, fmt, args.workers) for fmt in ('pickle', 'native')]
+    print(f"{'format':<8}{'load s':>9}{'ready s':>10}{'RSS MB':>9}{'PSS MB':>9}{'priv MB':>9}")
+    for r in results:
+        print(f"{r['format']:<8}{r['load_seconds_avg']:>9.3f}{r['all_ready_seconds']:>10.3f}"
+              f"{r.get('rss_mb_avg', float('nan')):>9.1f}{r.get('pss_mb_avg', float('nan')):>9.1f}"
+              f"{r.get('private_mb_avg', float('nan')):>9.1f}")
+    print(json.dumps(results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import json
+import threading
+import time
+
+from jaga.pipeline import RAW_COLUMNS, load_scoring_assets
+from jaga.stream import StreamScorer
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK STREAMING SCORER
+# ==========================================
+# python -m benchmarks.bench_stream --rows 200000
+#
+# Tiga skenario: input jenuh (throughput maksimum), input dengan laju tetap
+# (lag end-to-end pada beban wajar), dan downstream lambat (backpressure:
+# antrean tidak pernah melebihi max_pending).
+
+
+def run(assets, lines, rate=None, write_delay=0.0, window_rows=512, window_ms=50.0, max_pending=10_000):
+    peak = {'inbox': 0}
+
+    def write(text):
+        if write_delay:
+            time.sleep(write_delay)
+
+    scorer = StreamScorer(assets, write, window_rows, window_ms, max_pending)
+    scorer.start()
+
+    stop = threading.Event()
+
+    def watch():
+        while not stop.wait(0.01):
+            peak['inbox'] = max(peak['inbox'], scorer.inbox.qsize())
+
+    threading.Thread(target=watch, daemon=True).start()
+
+    def paced():
+        start = time.perf_counter()
+        for i, line in enumerate(lines):
+            if rate:
+                delay = start + i / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            yield line
+
+    scorer.feed(paced())
+    scorer.finish()
+    scorer.join()
+    stop.set()
+    return {**scorer.stats.snapshot(), 'peak_inbox': peak['inbox'], 'max_pending': max_pending}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark throughput & lag streaming scorer")
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--rate', type=float, default=5000, help="Laju input skenario beban tetap (baris/detik)")
+    parser.add_argument('--model-dir', default='models/v1_2/')
+    args = parser.parse_args(argv)
+
+    assets = load_scoring_assets(args.model_dir)
+    df = make_transactions(args.rows, seed=9)[RAW_COLUMNS]
+    lines = [json.dumps(r) + '\n' for r in df.to_dict('records')]
+
+    scenarios = {
+        'jenuh': run(assets, lines),
+        f'laju {args.rate:.0f}/s': run(assets, lines[: int(args.rate * 10)], rate=args.rate, window_ms=10.0),
+        'downstream lambat': run(assets, lines[:50_000], write_delay=0.05, max_pending=2_000),
+    }
+    print(f"{'skenario':<20}{'rows/s':>10}{'lag p50':>10}{'lag p99':>10}{'peak inbox':>12}")
+    for name, r in scenarios.items():
+        print(f"{name:<20}{r['rows_per_sec']:>10.0f}{r['lag_p50_ms']:>9.1f}ms{r['lag_p99_ms']:>8.1f}ms"
+              f"{r['peak_inbox']:>7}/{r['max_pending']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# BENCHMARK RETRAINING OUT-OF-CORE
+# ==========================================
+# python -m benchmarks.bench_train --rows 500000 1000000 2000000
+#
+# Per ukuran file: jaga.train dijalankan di proses terpisah dan dicatat memori
+# puncaknya (ru_maxrss) + waktu per pass. Memori puncak harus ~rata walau input
+# berlipat (dibatasi chunksize/reservoir, bukan jumlah baris). Folder hasil dicek
+# bisa di-load (load_pipeline, load_native, ModelRegistry) & feature_names sama
+# dengan models/v1_2.
+
+WRITE_CHUNK = 250_000
+
+CHILD = """
+import json, resource, sys
+from jaga.train import train
+metadata = train(sys.argv[1], sys.argv[2], chunksize=int(sys.argv[3]), log=None)
+print(json.dumps({'maxrss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                  'seconds': metadata['training']['seconds'], 'metrics': metadata['metrics']}))
+"""
+
+
+def write_csv(path, rows, seed):
+    # Ditulis bertahap agar proses benchmark sendiri tidak memegang seluruh file
+    for i, start in enumerate(range(0, rows, WRITE_CHUNK)):
+        part = make_transactions(min(WRITE_CHUNK, rows - start), seed=seed + i, fraud_scale=5)
+        part.to_csv(path, mode='a', header=i == 0, index=False)
+
+
+def check_output(folder):
+    from jaga.artifacts import load_native
+    from jaga.pipeline import load_pipeline, score_frame
+    from jaga.registry import ModelRegistry
+
+    df = make_transactions(20_000, seed=99, fraud_scale=5)
+    proba, _ = score_frame(load_pipeline(folder), df)
+    native, _ = score_frame(load_native(folder), df)
+    root, version = os.path.split(folder)
+    registry = ModelRegistry(root=root, active_version=version)
+    with open(os.path.join(folder, 'model_metadata.json')) as f, open('models/v1_2/model_metadata.json') as g:
+        same_names = json.load(f)['feature_names'] == json.load(g)['feature_names']
+    return {
+        'native_max_diff': float(np.abs(proba - native).max()),
+        'registry_threshold': registry.status()['policy']['block_threshold'],
+        'feature_names_v1_2': same_names,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memori puncak & waktu retraining vs ukuran input")
+    parser.add_argument('--rows', type=int, nargs='+', default=[500_000, 1_000_000, 2_000_000])
+    parser.add_argument('--chunksize', type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'baris':>11}{'CSV MB':>8}{'RSS MB':>8}{'stats s':>9}{'xgb s':>7}{'valid s':>9}{'total s':>9}{'F1':>7}")
+    with tempfile.TemporaryDirectory() as folder:
+        for rows in args.rows:
+            csv_path = os.path.join(folder, f'transaksi_{rows}.csv')
+            write_csv(csv_path, rows, seed=rows)
+            output = os.path.join(folder, f'v_{rows}')
+            result = subprocess.run([sys.executable, '-c', CHILD, csv_path, output, str(args.chunksize)],
+                                    capture_output=True, text=True, check=True)
+            report = json.loads(result.stdout.strip().splitlines()[-1])
+            seconds = report['seconds']
+            print(f"{rows:>11,}{os.path.getsize(csv_path) / 2**20:>8,.0f}{report['maxrss_mb']:>8,.0f}"
+                  f"{seconds['stats']:>9.1f}{seconds['xgboost']:>7.1f}{seconds['validation']:>9.1f}"
+                  f"{seconds['total']:>9.1f}{report['metrics']['f1_score']:>7.3f}")
+            os.remove(csv_path)
+        print(f"\nCek folder hasil: {check_output(output)}")
+
+
+if __name__ == '__main__':
+    main()
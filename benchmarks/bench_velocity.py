@@ -0,0 +1,70 @@
+import argparse
+import resource
+import time
+
+import numpy as np
+
+from jaga.velocity import VelocityStore
+
+# ==========================================
+# BENCHMARK VELOCITY STORE
+# ==========================================
+# python -m benchmarks.bench_velocity --accounts 2000000 --rows 10000000
+#
+# Transaksi sintetis dengan jumlah akun unik yang besar (mirip PaySim: hampir
+# semua nameOrig unik, nameDest lebih sering berulang), diproses per batch
+# berurutan step. Throughput per batch harus tetap datar saat jumlah akun di
+# store bertambah (lookup/update O(1)); memori store konstan = capacity.
+
+
+def make_stream(rows, accounts, steps, seed=0):
+    rng = np.random.default_rng(seed)
+    step = np.sort(rng.integers(0, steps, rows))
+    orig = np.char.add('C', rng.integers(0, accounts, rows).astype(str)).astype(object)
+    # Penerima: 1/4 dari ruang akun, sebagian besar transaksi ke akun "populer"
+    dest = np.char.add('C', (rng.zipf(1.3, rows) % (accounts // 4)).astype(str)).astype(object)
+    amount = rng.lognormal(10, 1.5, rows)
+    drained = amount * (rng.random(rows) < 0.3)
+    return step, orig, dest, amount, drained
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Throughput & memori VelocityStore")
+    parser.add_argument('--accounts', type=int, default=2_000_000, help="Ruang ID akun pengirim")
+    parser.add_argument('--rows', type=int, default=5_000_000)
+    parser.add_argument('--steps', type=int, default=744)
+    parser.add_argument('--batch', type=int, default=50_000)
+    parser.add_argument('--capacity', type=int, default=2_000_000)
+    parser.add_argument('--window-steps', type=int, default=24)
+    args = parser.parse_args(argv)
+
+    step, orig, dest, amount, drained = make_stream(args.rows, args.accounts, args.steps)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    store = VelocityStore(window_steps=args.window_steps, capacity=args.capacity)
+
+    print(f"{args.rows:,} transaksi, ruang akun {args.accounts:,}, capacity {args.capacity:,}, "
+          f"batch {args.batch:,}\n")
+    print(f"{'baris':>12}{'akun di store':>15}{'baris/detik':>13}{'us/baris':>10}{'evict exp':>11}{'evict lru':>11}")
+
+    total = 0.0
+    report_every = max(1, args.rows // args.batch // 10)
+    for k, start in enumerate(range(0, args.rows, args.batch)):
+        stop = start + args.batch
+        t = time.perf_counter()
+        store.update(step[start:stop], orig[start:stop], dest[start:stop], amount[start:stop], drained[start:stop])
+        elapsed = time.perf_counter() - t
+        total += elapsed
+        if k % report_every == 0:
+            n = min(stop, args.rows) - start
+            s = store.stats()
+            print(f"{min(stop, args.rows):>12,}{s['accounts']:>15,}{n / elapsed:>13,.0f}{elapsed / n * 1e6:>10.2f}"
+                  f"{s['evicted_expired']:>11,}{s['evicted_lru']:>11,}")
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"\nRata-rata          : {args.rows / total:,.0f} transaksi/detik")
+    print(f"Array store        : {store.nbytes / 2**20:,.0f} MB ({store.nbytes / args.capacity:.0f} B/akun)")
+    print(f"Peak RSS store+idx : ~{rss_after - rss_before:,.0f} MB di atas data input")
+
+
+if __name__ == '__main__':
+    main()
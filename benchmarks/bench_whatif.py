@@ -0,0 +1,80 @@
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from jaga.pipeline import load_scoring_assets, score_frame
+from jaga.whatif import build_grid, risk_surface
+
+# ==========================================
+# BENCHMARK SIMULASI WHAT-IF
+# ==========================================
+# python -m benchmarks.bench_whatif --model-dir models/v1_2/
+#
+# Waktu satu permukaan risiko (grid nominal x jam & dua sumbu saldo, ~10k titik):
+#   grid    : skor seluruh grid dalam satu panggilan (jaga/whatif.py)
+#   chart   : heatmap altair + serialisasi spec (dashboard/deteksi.py)
+#   cache   : grid yang sama diminta lagi (st.cache_data)
+#   per baris : perkiraan biaya jika tiap titik diskor sendiri-sendiri (cara lama:
+#               submit form berulang), dari rata-rata 200 panggilan 1 baris
+
+BASE = {
+    'step': 12, 'type': 'TRANSFER', 'amount': 1500.0,
+    'oldbalanceOrg': 5000.0, 'newbalanceOrig': 3500.0,
+    'oldbalanceDest': 0.0, 'newbalanceDest': 1500.0,
+}
+GRIDS = [('amount', 'hour'), ('amount', 'oldbalanceOrg'), ('oldbalanceDest', 'newbalanceDest')]
+
+
+def _ms(fn, repeat=5):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latensi permukaan risiko what-if")
+    parser.add_argument('--model-dir', default='models/v1_2/')
+    parser.add_argument('--points', type=int, default=100, help="Titik per sumbu uang")
+    args = parser.parse_args(argv)
+
+    import altair as alt
+
+    # Streamlit mengirim data chart sebagai Arrow, tanpa batas baris altair
+    alt.data_transformers.disable_max_rows()
+    with warnings.catch_warnings():
+        # cache_data di luar runtime Streamlit memberi peringatan, tetap berfungsi
+        warnings.simplefilter('ignore')
+        from dashboard.deteksi import cached_surface, risk_heatmap
+
+    assets = load_scoring_assets(args.model_dir)
+    single = pd.DataFrame([BASE])
+    per_row_ms = _ms(lambda: score_frame(assets, single), 200)
+
+    print(f"{'grid':<32}{'titik':>7}{'grid ms':>9}{'chart ms':>10}{'cache ms':>10}{'per baris ms':>14}")
+    for x_axis, y_axis in GRIDS:
+        n = len(build_grid(BASE, x_axis, y_axis, args.points)[0])
+        grid_ms = _ms(lambda: risk_surface(assets, BASE, x_axis, y_axis, args.points, True))
+        surface = risk_surface(assets, BASE, x_axis, y_axis, args.points, True)
+        chart_ms = _ms(lambda: risk_heatmap(surface, BASE).to_dict())
+        key = tuple(sorted(BASE.items()))
+        cached_surface(key, x_axis, y_axis, True)
+        cache_ms = _ms(lambda: cached_surface(key, x_axis, y_axis, True))
+        print(f"{x_axis + ' x ' + y_axis:<32}{n:>7,}{grid_ms:>9.1f}{chart_ms:>10.1f}{cache_ms:>10.2f}"
+              f"{per_row_ms * n:>14,.0f}")
+
+    surface = risk_surface(assets, BASE, 'amount', 'hour', args.points, True)
+    raw, types, _, _ = build_grid(BASE, 'amount', 'hour', args.points, True)
+    frame = pd.DataFrame(raw, columns=['step', 'amount', 'oldbalanceOrg', 'newbalanceOrig',
+                                       'oldbalanceDest', 'newbalanceDest'])
+    frame['type'] = types
+    proba, _ = score_frame(assets, frame)
+    print(f"\nGrid == score_frame per DataFrame: {np.allclose(surface['proba'].ravel(), proba)}")
+
+
+if __name__ == '__main__':
+    main()
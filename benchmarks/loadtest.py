@@ -0,0 +1,114 @@
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+
+from jaga.pipeline import RAW_COLUMNS
+from jaga.server import P50_TARGET_MS, P99_TARGET_MS
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# LOAD TEST SCORING SERVICE
+# ==========================================
+# 1. Jalankan server:  uvicorn jaga.server:app --port 8000 --workers 4
+# 2. Jalankan:         python -m benchmarks.loadtest --url http://127.0.0.1:8000 --concurrency 8
+#
+# Tiap thread klien memakai koneksi keep-alive sendiri dan mengirim transaksi
+# sintetis PaySim. Exit code 1 jika p50/p99 melewati target di jaga/server.py.
+
+
+def make_payloads(n, batch_size, seed=0):
+    df = make_transactions(n * batch_size, seed=seed)[RAW_COLUMNS]
+    records = df.to_dict('records')
+    if batch_size == 1:
+        return [json.dumps(r).encode() for r in records]
+    return [json.dumps(records[i:i + batch_size]).encode() for i in range(0, len(records), batch_size)]
+
+
+def worker(url, payloads, deadline, latencies, errors):
+    conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=10)
+    headers = {'Content-Type': 'application/json'}
+    i = 0
+    while time.perf_counter() < deadline:
+        body = payloads[i % len(payloads)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            conn.request('POST', '/score', body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(response.status)
+                continue
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(repr(e))
+            conn.close()
+            conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def run(url, concurrency, duration, batch_size, warmup=1.0):
+    url = urlparse(url)
+    payloads = make_payloads(2000, batch_size)
+
+    # Warm-up singkat agar cache/JIT di server tidak ikut terukur
+    worker(url, payloads, time.perf_counter() + warmup, [], [])
+
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=worker, args=(url, payloads[k::concurrency], deadline, latencies, errors))
+        for k in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    lat_ms = np.array(latencies) * 1000
+    return {
+        'requests': len(lat_ms),
+        'errors': len(errors),
+        'concurrency': concurrency,
+        'batch_size': batch_size,
+        'requests_per_sec': len(lat_ms) / elapsed,
+        'rows_per_sec': len(lat_ms) * batch_size / elapsed,
+        'p50_ms': float(np.percentile(lat_ms, 50)) if len(lat_ms) else None,
+        'p95_ms': float(np.percentile(lat_ms, 95)) if len(lat_ms) else None,
+        'p99_ms': float(np.percentile(lat_ms, 99)) if len(lat_ms) else None,
+        'max_ms': float(lat_ms.max()) if len(lat_ms) else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test untuk jaga.server")
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10.0, help="Durasi pengukuran (detik)")
+    parser.add_argument('--batch-size', type=int, default=1, help="Jumlah transaksi per request")
+    args = parser.parse_args(argv)
+
+    result = run(args.url, args.concurrency, args.duration, args.batch_size)
+    print(json.dumps(result, indent=2))
+
+    if result['p50_ms'] is None:
+        print("Tidak ada request yang berhasil.", file=sys.stderr)
+        return 1
+    if args.batch_size == 1:
+        ok = result['p50_ms'] <= P50_TARGET_MS and result['p99_ms'] <= P99_TARGET_MS
+        print(f"Target p50 <= {P50_TARGET_MS} ms, p99 <= {P99_TARGET_MS} ms: {'LULUS' if ok else 'GAGAL'}")
+        return 0 if ok else 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
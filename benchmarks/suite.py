@@ -0,0 +1,254 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# ==========================================
+# BENCHMARK SUITE LINTAS VERSI MODEL
+# ==========================================
+# python -m benchmarks.suite --output benchmarks/results/hasil.json
+# python -m benchmarks.suite --output baru.json --compare lama.json
+#
+# Untuk setiap folder models/vX (dan tiap format: pickle, native jika ada):
+#   - load_seconds     : import + load model di proses baru
+#   - rss_loaded_mb    : RSS setelah model dimuat
+#   - single_row       : latensi p50/p99 score_records([1 transaksi])
+#   - batch            : throughput (baris/detik) untuk beberapa ukuran batch
+#   - peak_rss_mb      : RSS puncak proses selama seluruh pengukuran
+#   - artifact_bytes   : ukuran file model di disk
+#
+# Tiap kombinasi dijalankan di subprocess terpisah agar waktu load & memori
+# tidak saling memengaruhi. Dataset sintetis PaySim (jaga/synthetic.py, seed
+# tetap) dibuat sekali di benchmarks/data/ lalu dipakai ulang antar run.
+# --compare menandai metrik yang memburuk lebih dari --tolerance (exit code 1).
+
+DATA_DIR = os.path.join('benchmarks', 'data')
+BATCH_SIZES = [1, 10, 100, 1_000, 10_000, 100_000]
+SINGLE_ROW_REQUESTS = 2_000
+SEED = 2024
+
+
+def build_dataset(rows, seed=SEED, data_dir=DATA_DIR):
+    from jaga.synthetic import make_transactions
+
+    path = os.path.join(data_dir, f'paysim_synthetic_{rows}_{seed}.parquet')
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        make_transactions(rows, seed=seed).to_parquet(path, index=False)
+    return path
+
+
+def artifact_bytes(model_dir, fmt):
+    if fmt == 'native':
+        model_dir = os.path.join(model_dir, 'native')
+    total = 0
+    for root, _, files in os.walk(model_dir):
+        if fmt == 'pickle' and os.path.basename(root) == 'native':
+            continue
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+def _rss_mb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return None
+
+
+def measure_worker(model_dir, fmt, data_path, batch_sizes, single_requests):
+    # Dijalankan di subprocess: satu versi x satu format
+    start = time.perf_counter()
+    from jaga.pipeline import RAW_COLUMNS, load_scoring_assets, score_records
+
+    assets = load_scoring_assets(model_dir, prefer_native=fmt == 'native')
+    load_seconds = time.perf_counter() - start
+    rss_loaded = _rss_mb()
+
+    import pandas as pd
+
+    df = pd.read_parquet(data_path, columns=RAW_COLUMNS)
+    records = df.head(max(max(batch_sizes), single_requests)).to_dict('records')
+
+    score_records(assets, records[:10])  # pemanasan
+    latencies = np.empty(single_requests)
+    for i in range(single_requests):
+        t = time.perf_counter()
+        score_records(assets, [records[i]])
+        latencies[i] = time.perf_counter() - t
+    latencies *= 1000
+
+    batch = {}
+    for size in batch_sizes:
+        chunk = records[:size]
+        repeat = max(3, 20_000 // size)
+        t = time.perf_counter()
+        for _ in range(repeat):
+            score_records(assets, chunk)
+        seconds = (time.perf_counter() - t) / repeat
+        batch[str(size)] = {'ms_per_batch': seconds * 1000, 'rows_per_sec': size / seconds}
+
+    return {
+        'load_seconds': load_seconds,
+        'rss_loaded_mb': rss_loaded,
+        'single_row': {
+            'requests': single_requests,
+            'p50_ms': float(np.percentile(latencies, 50)),
+            'p99_ms': float(np.percentile(latencies, 99)),
+            'mean_ms': float(latencies.mean()),
+        },
+        'batch': batch,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_case(model_dir, fmt, data_path, batch_sizes, single_requests):
+    cmd = [sys.executable, '-m', 'benchmarks.suite', '--worker', model_dir, fmt, data_path,
+           '--batch-sizes', *map(str, batch_sizes), '--single-requests', str(single_requests)]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return {'error': proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'gagal'}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def environment():
+    versions = {}
+    for module in ('numpy', 'pandas', 'sklearn', 'xgboost'):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit,
+        'packages': versions,
+    }
+
+
+# ------------------------------------------
+# Perbandingan antar run
+# ------------------------------------------
+# (path metrik, True jika lebih besar = lebih baik)
+def _metrics(case):
+    yield ('load_seconds',), False
+    yield ('peak_rss_mb',), False
+    yield ('single_row', 'p50_ms'), False
+    yield ('single_row', 'p99_ms'), False
+    for size in case.get('batch', {}):
+        yield ('batch', size, 'rows_per_sec'), True
+
+
+def _get(case, path):
+    for key in path:
+        case = case.get(key) if isinstance(case, dict) else None
+    return case
+
+
+def compare(current, baseline, tolerance):
+    base_cases = {(c['version'], c['format']): c for c in baseline['cases']}
+    regressions = []
+    print(f"\nPerbandingan dengan {baseline.get('created')} (toleransi {tolerance:.0%})")
+    print(f"{'versi':<8}{'format':<8}{'metrik':<28}{'lama':>12}{'baru':>12}{'ubah':>9}")
+    for case in current['cases']:
+        base = base_cases.get((case['version'], case['format']))
+        if base is None or 'error' in case or 'error' in base:
+            continue
+        for path, higher_is_better in _metrics(case):
+            old, new = _get(base, path), _get(case, path)
+            if not old or new is None:
+                continue
+            change = new / old - 1
+            worse = -change if higher_is_better else change
+            flag = '  <-- REGRESI' if worse > tolerance else ''
+            if flag:
+                regressions.append((case['version'], case['format'], '.'.join(path)))
+            print(f"{case['version']:<8}{case['format']:<8}{'.'.join(path):<28}{old:>12.4g}{new:>12.4g}"
+                  f"{change:>+8.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite JAGA lintas versi model")
+    parser.add_argument('--models-root', default='models')
+    parser.add_argument('--versions', nargs='*', help="Default: semua versi di models/")
+    parser.add_argument('--formats', nargs='*', default=['pickle', 'native'])
+    parser.add_argument('--rows', type=int, default=max(BATCH_SIZES))
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=BATCH_SIZES)
+    parser.add_argument('--single-requests', type=int, default=SINGLE_ROW_REQUESTS)
+    parser.add_argument('--output', default=None, help="File JSON hasil (default benchmarks/results/<waktu>.json)")
+    parser.add_argument('--compare', help="File JSON hasil run sebelumnya")
+    parser.add_argument('--tolerance', type=float, default=0.10)
+    parser.add_argument('--worker', nargs=3, metavar=('MODEL_DIR', 'FORMAT', 'DATA'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        model_dir, fmt, data_path = args.worker
+        print(json.dumps(measure_worker(model_dir, fmt, data_path, args.batch_sizes, args.single_requests)))
+        return 0
+
+    from jaga.artifacts import has_native
+    from jaga.registry import version_key
+
+    # Proses utama tidak memuat model; semua pengukuran di subprocess
+    versions = args.versions or sorted(
+        (d for d in os.listdir(args.models_root) if os.path.isdir(os.path.join(args.models_root, d))),
+        key=version_key,
+    )
+    data_path = build_dataset(max(args.rows, max(args.batch_sizes), args.single_requests))
+
+    created = time.strftime('%Y-%m-%dT%H:%M:%S')
+    result = {'created': created, 'dataset': data_path, 'seed': SEED,
+              'environment': environment(), 'cases': []}
+    print(f"Dataset: {data_path}\n")
+    print(f"{'versi':<8}{'format':<8}{'load s':>8}{'artefak KB':>12}{'p50 ms':>9}{'p99 ms':>9}"
+          f"{'1k baris/s':>12}{'100k baris/s':>14}{'peak MB':>9}")
+    for version in versions:
+        model_dir = os.path.join(args.models_root, version)
+        for fmt in args.formats:
+            if fmt == 'native' and not has_native(model_dir):
+                continue
+            case = {'version': version, 'format': fmt, 'artifact_bytes': artifact_bytes(model_dir, fmt)}
+            case.update(run_case(model_dir, fmt, data_path, args.batch_sizes, args.single_requests))
+            result['cases'].append(case)
+            if 'error' in case:
+                print(f"{version:<8}{fmt:<8}GAGAL: {case['error']}")
+                continue
+            batch = case['batch']
+            print(f"{version:<8}{fmt:<8}{case['load_seconds']:>8.2f}{case['artifact_bytes'] / 1024:>12,.0f}"
+                  f"{case['single_row']['p50_ms']:>9.3f}{case['single_row']['p99_ms']:>9.3f}"
+                  f"{batch.get('1000', {}).get('rows_per_sec', float('nan')):>12,.0f}"
+                  f"{batch.get('100000', {}).get('rows_per_sec', float('nan')):>14,.0f}"
+                  f"{case['peak_rss_mb']:>9.0f}")
+
+    output = args.output or os.path.join('benchmarks', 'results', f"{created.replace(':', '')}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(result, f, indent=4)
+    print(f"\nHasil: {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} metrik memburuk di atas toleransi.")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# Halaman dashboard Streamlit JAGA (satu modul per menu di sidebar).
+# Modul halaman di-import oleh app.py hanya saat halamannya dibuka.
@@ -0,0 +1,169 @@
+import streamlit as st
+
+from dashboard.common import PROFILE_PATH, image_base64
+
+# ==========================================
+# HALAMAN: ABOUT ME (PROFILE PAGE)
+# ==========================================
+
+
+def render():
+    img_profile_base64 = image_base64(PROFILE_PATH)
+
+    # Header Section dengan Gradient Background
+    st.markdown("""
+        <div style='background: linear-gradient(120deg, #1e3a8a, #3b82f6); padding: 30px; border-radius: 15px; color: white; text-align: center; margin-bottom: 30px;'>
+            <h1 style='margin:0; font-size: 32px;'>👨‍💻 Creator Profile</h1>
+            <p style='margin-top:5px; opacity:0.9;'>Meet the mind behind JAGA System</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # Layout Kolom: Foto di Kiri, Bio di Kanan
+    col_profile, col_desc = st.columns([1, 2.5], gap="large")
+    
+    with col_profile:
+        # Menampilkan foto profil menggunakan variabel img_profile_base64
+        # Pastikan ada huruf 'f' sebelum tanda kutip triple agar variabel terbaca
+        st.markdown(f"""
+            <style>
+            .profile-container {{
+                display: flex;
+                justify-content: center;
+                align-items: center;
+            }}
+            .profile-img {{
+                width: 220px;
+                height: 220px;
+                object-fit: cover; /* Memastikan wajah tetap di tengah dan tidak gepeng */
+                border-radius: 50%;
+                border: 5px solid #ffffff;
+                box-shadow: 0 10px 20px rgba(0,0,0,0.15);
+                transition: transform 0.3s ease;
+            }}
+            .profile-img:hover {{
+                transform: scale(1.05);
+            }}
+            </style>
+            <div class="profile-container">
+                <img src="data:image/jpeg;base64,{img_profile_base64}" class="profile-img">
+            </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+
+    with col_desc:
+        # Kartu Bio Utama
+        st.markdown("""
+            <div style="background-color: white; padding: 30px; border-radius: 15px; border: 1px solid #f1f5f9; box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.05);">
+                <h2 style="color: #1e293b; margin-bottom: 5px; font-weight: 800;">Alvat Taupik Hidayat</h2>
+                <p style="color: #3b82f6; font-weight: 600; font-size: 16px; margin-top:0;">🚀 System Analyst, Data Scientist & AI Researcher</p>
+                <hr style="border: 0; border-top: 1px solid #e2e8f0; margin: 15px 0;">
+                
+            
+            <div data-testid="stMarkdownContainer" class="st-emotion-cache-2fgyt4 e1t8ru6f0"><div style="background-color: rgb(241, 245, 249); padding: 20px; border-radius: 15px; border: 1px solid rgb(226, 232, 240);">
+                <p style="color: rgb(71, 85, 105); font-size: 14px;">
+                  Halo! Saya adalah Sistem Analis di balik Arsitektur JAGA.
+                  Fokus utama saya adalah menerjemahkan kebutuhan bisnis dan risiko operasional menjadi rancangan sistem teknologi yang terstruktur,
+                  terukur, dan berkelanjutan. 
+                  Dengan pendekatan analitis dan berbasis data, saya merancang solusi yang mampu mengolah data mentah menjadi sistem cerdas yang dapat diandalkan 
+                  dalam pengambilan keputusan—khususnya pada ranah Financial Fraud Detection.
+                </p>
+            </div></div>
+
+
+
+                   
+        
+            </div>
+        """, unsafe_allow_html=True)
+
+        # Tech Stack Section (Tampilan Badges Keren)
+        st.markdown("### 🛠️ Tech Stack & Tools")
+        st.markdown("""
+            <div style="display: flex; flex-wrap: wrap; gap: 10px;">
+                <span style="background-color: #e0f2fe; color: #0369a1; padding: 6px 14px; border-radius: 20px; font-weight: 600; font-size: 14px;">🐍 Python</span>
+                <span style="background-color: #f0fdf4; color: #15803d; padding: 6px 14px; border-radius: 20px; font-weight: 600; font-size: 14px;">🤖 Scikit-Learn</span>
+                <span style="background-color: #fff7ed; color: #c2410c; padding: 6px 14px; border-radius: 20px; font-weight: 600; font-size: 14px;">⚡ XGBoost</span>
+                <span style="background-color: #fef2f2; color: #b91c1c; padding: 6px 14px; border-radius: 20px; font-weight: 600; font-size: 14px;">🎈 Streamlit</span>
+                <span style="background-color: #faf5ff; color: #7e22ce; padding: 6px 14px; border-radius: 20px; font-weight: 600; font-size: 14px;">🐼 Pandas</span>
+                <span style="background-color: #f8fafc; color: #475569; padding: 6px 14px; border-radius: 20px; font-weight: 600; font-size: 14px;">📊 Matplotlib</span>
+            </div>
+        """, unsafe_allow_html=True)
+
+    st.write("")
+    st.write("")
+    
+    # Contact Section dengan Kartu Hover
+    st.subheader("📬 Let's Connect")
+    st.markdown("Tertarik diskusi tentang Data Science atau kolaborasi? Hubungi saya di:")
+    
+    # Custom CSS untuk kartu kontak
+    st.markdown("""
+    <style>
+    .contact-card {
+        background-color: white;
+        padding: 20px;
+        border-radius: 12px;
+        border: 1px solid #e2e8f0;
+        text-align: center;
+        transition: transform 0.2s, box-shadow 0.2s;
+        text-decoration: none;
+        color: inherit;
+        display: block;
+    }
+    .contact-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1);
+        border-color: #3b82f6;
+    }
+    .icon {
+        font-size: 24px;
+        margin-bottom: 10px;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Grid Kontak
+    c1, c2, c3 = st.columns(3)
+    
+    with c1:
+        st.markdown("""
+            <a href="https://www.linkedin.com/in/alvattaupik/" target="_blank" style="text-decoration:none;">
+                <div class="contact-card">
+                    <div class="icon" style="color:#0077b5;">💼</div>
+                    <div style="font-weight:bold; color:#1e293b;">LinkedIn</div>
+                    <div style="font-size:12px; color:#64748b;">Connect Professionally</div>
+                </div>
+            </a>
+        """, unsafe_allow_html=True)
+        
+    with c2:
+        st.markdown("""
+            <a href="https://github.com/alvattaupik" target="_blank" style="text-decoration:none;">
+                <div class="contact-card">
+                    <div class="icon" style="color:#333;">💻</div>
+                    <div style="font-weight:bold; color:#1e293b;">GitHub</div>
+                    <div style="font-size:12px; color:#64748b;">Check My Code</div>
+                </div>
+            </a>
+        """, unsafe_allow_html=True)
+        
+    with c3:
+        st.markdown("""
+            <a href="mailto:alvattaufik@gmail.com" target="_blank" style="text-decoration:none;">
+                <div class="contact-card">
+                    <div class="icon" style="color:#ea4335;">📧</div>
+                    <div style="font-weight:bold; color:#1e293b;">Email</div>
+                    <div style="font-size:12px; color:#64748b;">alvattaufik@gmail.com</div>
+                </div>
+            </a>
+        """, unsafe_allow_html=True)
+
+    st.divider()
+    st.markdown(
+        "<div style='text-align: center; color: #94a3b8; font-size: 14px;'>"
+        "© 2026 JAGA System. Built with ❤️ by Alvat Taupik Hidayat."
+        "</div>", 
+        unsafe_allow_html=True
+    )
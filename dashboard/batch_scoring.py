@@ -0,0 +1,170 @@
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.common import audit_log, load_assets, model_version
+from jaga.batch import ChunkWriter, iter_scored
+from jaga.pipeline import RAW_COLUMNS
+
+# ==========================================
+# HALAMAN: BATCH SCORING (UPLOAD CSV)
+# ==========================================
+# File hasil ditulis ke RESULT_ROOT/<id sesi>/. Direktori sesi yang tidak
+# disentuh selama RESULT_TTL_SECONDS (tab ditutup / sesi ditinggal) dihapus saat
+# halaman ini dirender oleh sesi mana pun.
+#
+# Batas unduhan: st.download_button selalu memuat seluruh file ke memori server
+# saat tombol diklik (juga jika diberi file handle). Hasil di atas
+# DOWNLOAD_MAX_MB tidak ditawarkan lewat browser; gunakan python -m jaga.batch
+# input.csv hasil.csv.
+
+RESULT_ROOT = os.path.join(tempfile.gettempdir(), 'jaga_batch')
+RESULT_TTL_SECONDS = 3600
+DOWNLOAD_MAX_MB = 256
+
+
+def purge_stale_results(keep=None):
+    if not os.path.isdir(RESULT_ROOT):
+        return
+    cutoff = time.time() - RESULT_TTL_SECONDS
+    for name in os.listdir(RESULT_ROOT):
+        path = os.path.join(RESULT_ROOT, name)
+        try:
+            if name != keep and os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            # Sudah dihapus proses/sesi lain
+            pass
+
+
+def session_result_dir():
+    # Satu direktori per sesi browser; mtime diperbarui tiap render agar sesi aktif tidak dibersihkan
+    session_id = st.session_state.setdefault('batch_session_id', uuid.uuid4().hex)
+    purge_stale_results(keep=session_id)
+    path = os.path.join(RESULT_ROOT, session_id)
+    os.makedirs(path, exist_ok=True)
+    os.utime(path)
+    return path
+
+
+def render():
+    assets = load_assets()
+    result_dir = session_result_dir()
+
+    st.title("📂 Batch Scoring Transaksi")
+    st.markdown("Unggah file CSV berisi transaksi (kolom sama dengan dataset PaySim) untuk diskor sekaligus.")
+
+    # File dibaca & diskor per chunk (jaga/batch.py); hasil ditulis ke file
+    # sementara di disk, jadi memori tidak ikut membesar sesuai ukuran upload.
+    # Ringkasan disimpan di session_state: interaksi widget lain (mis. pindah
+    # halaman, tombol download) tidak menjalankan scoring ulang.
+    BATCH_CHUNKSIZE = 50_000
+    TOP_N = 20
+
+    with st.form("batch_form"):
+        uploaded = st.file_uploader("File transaksi (.csv)", type=["csv"])
+        st.caption(f"Kolom wajib: {', '.join(RAW_COLUMNS)}. Kolom lain (mis. nameOrig, isFraud) ikut disalin ke hasil.")
+        run_scoring = st.form_submit_button("🚀 MULAI SCORING", use_container_width=True)
+
+    result = st.session_state.get('batch_result')
+
+    if run_scoring and uploaded is None:
+        st.warning("Pilih file CSV terlebih dahulu.")
+    elif run_scoring and assets and (result is None or result['file_id'] != uploaded.file_id):
+        header = pd.read_csv(uploaded, nrows=0).columns
+        missing = [c for c in RAW_COLUMNS if c not in header]
+        uploaded.seek(0)
+        if missing:
+            st.error(f"Kolom berikut tidak ditemukan di file: {', '.join(missing)}")
+        else:
+            # Hasil lama (file sementara) diganti
+            if result is not None and os.path.exists(result['path']):
+                os.remove(result['path'])
+            st.session_state.pop('batch_result', None)
+
+            output = tempfile.NamedTemporaryFile(prefix='jaga_batch_', suffix='.csv', delete=False,
+                                                 dir=result_dir)
+            output.close()
+            writer = ChunkWriter(output.name)
+
+            progress = st.progress(0.0, text="Memulai scoring...")
+            counter_cols = st.columns(3)
+            rows_box, block_box, review_box = (c.empty() for c in counter_cols)
+
+            top_risk = None
+            totals = {'rows': 0, 'blocked': 0, 'review': 0}
+            start = time.perf_counter()
+            try:
+                chunks = pd.read_csv(uploaded, chunksize=BATCH_CHUNKSIZE)
+                for scored, totals in iter_scored(assets, chunks, writer, audit=audit_log(), version=model_version()):
+                    # Hanya TOP_N baris berisiko tertinggi yang disimpan untuk pratinjau
+                    candidates = scored.nlargest(TOP_N, 'fraud_probability')
+                    top_risk = candidates if top_risk is None else (
+                        pd.concat([top_risk, candidates]).nlargest(TOP_N, 'fraud_probability'))
+
+                    elapsed = time.perf_counter() - start
+                    done = min(uploaded.tell() / max(uploaded.size, 1), 1.0)
+                    progress.progress(done, text=f"{totals['rows']:,} baris diskor · "
+                                                 f"{totals['rows'] / elapsed:,.0f} baris/detik")
+                    rows_box.metric("Baris Diskor", f"{totals['rows']:,}")
+                    block_box.metric("Diblokir", f"{totals['blocked']:,}")
+                    review_box.metric("Perlu Review", f"{totals['review']:,}")
+            except Exception as e:
+                writer.close()
+                os.remove(output.name)
+                progress.empty()
+                st.error(f"Gagal memproses file: {e}")
+            else:
+                writer.close()
+                progress.progress(1.0, text="Scoring selesai!")
+                st.session_state['batch_result'] = {
+                    'file_id': uploaded.file_id,
+                    'name': uploaded.name,
+                    'path': output.name,
+                    'seconds': time.perf_counter() - start,
+                    'top_risk': top_risk,
+                    **totals,
+                }
+        result = st.session_state.get('batch_result')
+
+    if result is not None:
+        st.divider()
+        st.subheader(f"📊 Hasil: {result['name']}")
+        rows = max(result['rows'], 1)
+        cols = st.columns(4)
+        cols[0].metric("Total Transaksi", f"{result['rows']:,}")
+        cols[1].metric("Diblokir", f"{result['blocked']:,}", f"{result['blocked'] / rows:.2%}", delta_color="inverse")
+        cols[2].metric("Perlu Review", f"{result['review']:,}", f"{result['review'] / rows:.2%}", delta_color="off")
+        cols[3].metric("Waktu Proses", f"{result['seconds']:.1f} detik",
+                       f"{result['rows'] / max(result['seconds'], 1e-9):,.0f} baris/detik", delta_color="off")
+
+        if result['top_risk'] is not None:
+            st.markdown(f"##### 🔎 {len(result['top_risk'])} Transaksi dengan Probabilitas Fraud Tertinggi")
+            st.dataframe(result['top_risk'], use_container_width=True, hide_index=True)
+
+        if not os.path.exists(result['path']):
+            st.info("File hasil sudah dibersihkan (sesi lama). Jalankan scoring ulang untuk mengunduh.")
+        elif os.path.getsize(result['path']) > DOWNLOAD_MAX_MB * 2**20:
+            st.warning(f"Hasil {os.path.getsize(result['path']) / 2**20:,.0f} MB melebihi batas unduhan "
+                       f"browser ({DOWNLOAD_MAX_MB} MB): Streamlit memuat seluruh file ke memori saat "
+                       f"diunduh. Skor file ini dengan `python -m jaga.batch {result['name']} "
+                       f"hasil.csv`.")
+        else:
+            # File dibuka saat tombol diklik (callable), bukan di setiap rerun. Streamlit
+            # tetap membaca isinya ke memori sekali per klik (lihat DOWNLOAD_MAX_MB)
+            path = result['path']
+
+            st.download_button(
+                "⬇️ Unduh Hasil Scoring (CSV)",
+                data=lambda: open(path, 'rb'),
+                file_name=f"{os.path.splitext(result['name'])[0]}_scored.csv",
+                mime="text/csv",
+                on_click="ignore",
+                use_container_width=True,
+            )
+            st.caption(f"{os.path.getsize(path) / 2**20:,.1f} MB; dimuat ke memori server saat diunduh.")
@@ -0,0 +1,146 @@
+import base64
+import os
+
+import streamlit as st
+
+# ==========================================
+# UTILITAS BERSAMA DASHBOARD
+# ==========================================
+# Modul ini sengaja ringan (hanya streamlit & base64): dipakai app.py sebelum
+# halaman dipilih. pandas/numpy/jaga/model baru di-import oleh modul halaman
+# yang membutuhkannya.
+
+LOGO_PATH = 'assets/images/jaga logo.jpg'
+PROFILE_PATH = 'assets/images/profile.jpg'
+
+# Custom CSS
+CSS = """
+    <style>
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;600;800&display=swap');
+    
+    html, body, [class*="css"]  {
+        font-family: 'Inter', sans-serif;
+    }
+
+    .main {
+        background-color: #fcfcfd;
+    }
+
+    div[data-testid="metric-container"] {
+        background-color: #ffffff;
+        border: 1px solid #f0f0f5;
+        padding: 20px;
+        border-radius: 15px;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.02);
+        transition: transform 0.2s ease;
+    }
+    div[data-testid="metric-container"]:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 10px 15px rgba(0,0,0,0.05);
+    }
+
+    [data-testid="stSidebar"] {
+        background-color: #111827;
+        color: white;
+    }
+    [data-testid="stSidebar"] * {
+        color: white !important;
+    }
+
+    .stButton>button {
+        width: 100%;
+        background: linear-gradient(90deg, #4F46E5 0%, #3B82F6 100%);
+        color: white;
+        border: none;
+        padding: 12px 24px;
+        border-radius: 12px;
+        font-weight: 600;
+        letter-spacing: 0.5px;
+        transition: all 0.3s ease;
+    }
+    .stButton>button:hover {
+        opacity: 0.9;
+        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4);
+    }
+
+    .status-card {
+        padding: 25px;
+        border-radius: 15px;
+        margin: 20px 0;
+        border: 1px solid rgba(0,0,0,0.05);
+    }
+    .fraud-bg {
+        background: linear-gradient(135deg, #fff5f5 0%, #fed7d7 100%);
+        border-left: 8px solid #e53e3e;
+    }
+    .safe-bg {
+        background: linear-gradient(135deg, #f0fff4 0%, #c6f6d5 100%);
+        border-left: 8px solid #38a169;
+    }
+    </style>
+    """
+
+
+def inject_css():
+    st.markdown(CSS, unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
+def image_base64(path):
+    # Gambar statis dibaca & di-encode sekali per proses, bukan di setiap rerun
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        return base64.b64encode(data).decode()
+    except FileNotFoundError:
+        return ""
+
+
+@st.cache_resource(show_spinner="Memuat model...")
+def load_assets():
+    # Hanya dipanggil halaman yang melakukan scoring. Format native (jaga/artifacts.py)
+    # dipakai jika tersedia: tanpa unpickle sklearn/xgboost saat start
+    from jaga.pipeline import DEFAULT_MODEL_DIR, load_scoring_assets
+
+    folder_path = DEFAULT_MODEL_DIR
+    try:
+        return load_scoring_assets(folder_path)
+    except Exception as e:
+        # Menampilkan pesan error spesifik ke UI Streamlit agar tidak bingung
+        st.error(f"⚠️ Kritis: Gagal memuat file model di {folder_path}")
+        st.info(f"Detail Error: {e}")
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def audit_log():
+    # Satu AuditLog (jaga/audit.py) per proses Streamlit, hanya jika diaktifkan:
+    #   JAGA_AUDIT_DIR=audit streamlit run app.py
+    # Tanpa JAGA_AUDIT_DIR -> None (tidak ada file yang ditulis). File berjalan
+    # ditutup saat proses selesai
+    folder = os.environ.get('JAGA_AUDIT_DIR')
+    if not folder:
+        return None
+
+    import atexit
+
+    from jaga.audit import AuditLog
+
+    log = AuditLog(folder)
+    atexit.register(log.close)
+    return log
+
+
+def model_version():
+    from jaga.pipeline import DEFAULT_MODEL_DIR
+
+    return os.path.basename(os.path.normpath(DEFAULT_MODEL_DIR))
+
+
+@st.cache_resource(show_spinner=False)
+def load_booster():
+    # Booster XGBoost untuk TreeSHAP (jaga/explain.py); baru dimuat saat analisis pertama
+    from jaga.artifacts import load_booster as load_native_booster
+    from jaga.pipeline import DEFAULT_MODEL_DIR
+
+    return load_native_booster(DEFAULT_MODEL_DIR)
@@ -0,0 +1,184 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from jaga.eda import STATS_FILENAME, load_stats
+from jaga.pipeline import DEFAULT_MODEL_DIR
+from jaga.synthetic import PAYSIM_FRAUD_COUNTS, PAYSIM_STEPS, PAYSIM_TYPE_COUNTS
+
+# ==========================================
+# HALAMAN: TENTANG DATASET
+# ==========================================
+# Angka & grafik dibaca dari statistik offline versi model aktif
+# (models/vX/dataset_stats.json, dibuat `python -m jaga.eda`), tanpa memuat
+# model maupun CSV. Jika file belum ada, dipakai ringkasan PaySim publik
+# (jaga/synthetic.py) tanpa histogram jam & statistik saldo.
+
+
+def paysim_summary():
+    return {
+        'rows': sum(PAYSIM_TYPE_COUNTS.values()),
+        'fraud': sum(PAYSIM_FRAUD_COUNTS.values()),
+        'step_min': 1,
+        'step_max': PAYSIM_STEPS,
+        'types': sorted(
+            ({'type': t, 'count': c, 'fraud': PAYSIM_FRAUD_COUNTS[t], 'fraud_rate': PAYSIM_FRAUD_COUNTS[t] / c}
+             for t, c in PAYSIM_TYPE_COUNTS.items()),
+            key=lambda row: -row['count'],
+        ),
+        'hours': None,
+        'balance': None,
+        'drained': None,
+        'amount': None,
+        'sources': [],
+    }
+
+
+@st.cache_data(show_spinner=False)
+def dataset_summary(folder_path, mtime):
+    # mtime ikut jadi kunci cache: file statistik baru langsung terbaca tanpa restart
+    stats = load_stats(folder_path)
+    return stats.summary() if stats is not None else paysim_summary()
+
+
+def render():
+    st.title("📂 Dataset & Transparansi")
+    
+    # 1. HEADER & SUMBER DATA
+    st.markdown("""
+        <div style="background-color: white; padding: 20px; border-radius: 15px; border-left: 5px solid #3b82f6; box-shadow: 0 2px 5px rgba(0,0,0,0.05);">
+            <h4 style="margin-top:0;">📌 PaySim: Synthetic Financial Datasets</h4>
+            <p style="color: #64748b; margin-bottom: 10px;">
+                Model ini dilatih menggunakan dataset <b>PaySim</b>, sebuah simulasi transaksi uang seluler yang dibuat berdasarkan log transaksi nyata dari layanan keuangan di Afrika. 
+                Tujuannya adalah untuk mengisi kekosongan dataset publik terkait penipuan keuangan.
+            </p>
+            <a href="https://www.kaggle.com/datasets/ealaxi/paysim1" target="_blank" style="text-decoration: none;">
+                <button style="background-color: #f1f5f9; color: #334155; border: none; padding: 8px 15px; border-radius: 5px; cursor: pointer; font-size: 12px;">
+                    🔗 Lihat Sumber Data (Kaggle)
+                </button>
+            </a>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    st.write("")
+
+    stats_path = os.path.join(DEFAULT_MODEL_DIR, STATS_FILENAME)
+    from_artifact = os.path.exists(stats_path)
+    summary = dataset_summary(DEFAULT_MODEL_DIR, os.path.getmtime(stats_path) if from_artifact else None)
+
+    # 2. KEY METRICS (STATISTIK DATASET)
+    st.subheader("📊 Statistik Dataset")
+    if from_artifact:
+        st.caption(f"Dihitung dari {', '.join(summary['sources']) or 'data training'} ({stats_path}).")
+    else:
+        st.caption(f"Ringkasan PaySim publik. Jalankan `python -m jaga.eda <file> --model-dir {DEFAULT_MODEL_DIR}` "
+                   "untuk statistik dari data Anda sendiri.")
+    col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+    total_trx = summary['rows']
+    total_fraud = summary['fraud']
+    steps = summary['step_max'] - summary['step_min'] + 1 if summary['step_min'] is not None else 0
+
+    with col_m1:
+        st.metric("Total Transaksi", f"{total_trx:,}", help="Jumlah baris total dalam dataset.")
+    with col_m2:
+        st.metric("Total Fraud", f"{total_fraud:,}" if total_fraud is not None else "-",
+                  help="Jumlah transaksi yang dilabeli sebagai penipuan.")
+    with col_m3:
+        st.metric("Rasio Fraud", f"{total_fraud / max(total_trx, 1):.2%}" if total_fraud is not None else "-",
+                  help="Sangat tidak seimbang (Imbalanced Data).")
+    with col_m4:
+        st.metric("Durasi Simulasi", f"{steps / 24:.0f} Hari", help=f"{steps} steps (jam).")
+
+    st.divider()
+
+    # 3. VISUALISASI DISTRIBUSI
+    c1, c2 = st.columns([1.5, 1])
+    
+    with c1:
+        st.subheader("🔍 Dimana Fraud Bersembunyi?")
+        st.caption("Distribusi Tipe Transaksi vs Kejadian Fraud")
+        
+        fraud_dist_data = pd.DataFrame({
+            "Tipe Transaksi": [row['type'] for row in summary['types']],
+            "Jumlah Transaksi": [row['count'] for row in summary['types']],
+            "Jumlah Fraud": [row['fraud'] for row in summary['types']],
+        })
+        
+        # Menggunakan Bar Chart Streamlit
+        st.bar_chart(
+            fraud_dist_data.set_index("Tipe Transaksi")[["Jumlah Fraud"]],
+            color="#ef4444" # Warna merah untuk fraud
+        )
+        fraud_types = [row['type'] for row in summary['types'] if row['fraud'] > 0]
+        if fraud_types:
+            st.info(f"💡 **Insight:** Fraud hanya ditemukan pada tipe transaksi **{'** dan **'.join(fraud_types)}**.")
+
+    with c2:
+        st.subheader("📖 Kamus Data (Feature Dictionary)")
+        # Tabel Data yang lebih lengkap
+        df_desc = pd.DataFrame([
+            {"Fitur": "step", "Deskripsi": "Unit waktu (1 step = 1 jam). Total 744 steps (30 hari)."},
+            {"Fitur": "type", "Deskripsi": "Jenis transaksi (CASH-IN, OUT, DEBIT, PAYMENT, TRANSFER)."},
+            {"Fitur": "amount", "Deskripsi": "Jumlah uang yang ditransaksikan dalam mata uang lokal."},
+            {"Fitur": "oldbalanceOrg", "Deskripsi": "Saldo pengirim sebelum transaksi dimulai."},
+            {"Fitur": "newbalanceOrig", "Deskripsi": "Saldo pengirim setelah transaksi selesai."},
+            {"Fitur": "oldbalanceDest", "Deskripsi": "Saldo penerima sebelum transaksi."},
+            {"Fitur": "isFraud", "Deskripsi": "Target variable (1 = Fraud, 0 = Aman)."}
+        ])
+        st.dataframe(
+            df_desc, 
+            hide_index=True, 
+            use_container_width=True,
+            column_config={
+                "Fitur": st.column_config.TextColumn("Nama Fitur", width="medium"),
+                "Deskripsi": st.column_config.TextColumn("Penjelasan", width="large"),
+            }
+        )
+
+    # 4. POLA WAKTU & SALDO (hanya dari statistik offline)
+    if summary['hours'] is not None:
+        st.divider()
+        c3, c4 = st.columns([1.5, 1])
+        with c3:
+            st.subheader("🕒 Fraud per Jam")
+            st.caption("Persentase transaksi fraud untuk tiap jam (hour = step % 24)")
+            hour_data = pd.DataFrame(summary['hours']).set_index('hour')
+            st.line_chart(hour_data['fraud_rate'] * 100, color="#ef4444")
+        with c4:
+            st.subheader("⚖️ Selisih Saldo")
+            st.caption("errorBalance = saldo setelah + nominal - saldo sebelum (per kelas)")
+            balance_data = pd.DataFrame(summary['balance'])
+            if not balance_data.empty:
+                st.dataframe(
+                    balance_data[['column', 'class', 'mean', 'std', 'nonzero_rate']],
+                    hide_index=True,
+                    use_container_width=True,
+                    column_config={
+                        "column": "Fitur",
+                        "class": "Kelas",
+                        "mean": st.column_config.NumberColumn("Rata-rata", format="%.0f"),
+                        "std": st.column_config.NumberColumn("Std", format="%.0f"),
+                        "nonzero_rate": st.column_config.NumberColumn("Tidak nol", format="percent"),
+                    }
+                )
+            if summary['drained'] is not None:
+                st.info(f"💡 Saldo pengirim habis setelah transaksi: **{summary['drained']['fraud']:.0%}** "
+                        f"pada fraud vs **{summary['drained']['normal']:.0%}** pada transaksi normal.")
+
+    # 5. PENJELASAN TANTANGAN
+    st.write("")
+    # Tanpa label isFraud: pakai rasio PaySim publik
+    fraud_ratio = (total_fraud / max(total_trx, 1) if total_fraud is not None
+                   else sum(PAYSIM_FRAUD_COUNTS.values()) / sum(PAYSIM_TYPE_COUNTS.values()))
+    with st.expander("🧐 Mengapa Dataset ini Menantang?", expanded=False):
+        st.markdown(f"""
+        1.  **Imbalanced Class (Ketimpangan Data):**
+            Hanya **{fraud_ratio:.2%}** data yang merupakan Fraud. Jika model menebak semua transaksi "Aman", akurasinya tetap {1 - fraud_ratio:.2%}, tapi gagal mendeteksi penjahat. Oleh karena itu, kami menggunakan metrik **F1-Score** dan **Recall**, bukan hanya Akurasi.
+        
+        2.  **Pola Pengurasan Saldo:**
+            Banyak fraudster melakukan pemindahan dana dan segera melakukan *Cash Out*. Fitur `newbalanceOrig` seringkali menjadi **0** pada kasus fraud.
+        
+        3.  **Jumlah Uang:**
+            Fraud tidak selalu bernilai besar. Namun, dalam dataset ini, transaksi fraud cenderung mengosongkan rekening korban.
+        """)
@@ -0,0 +1,273 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from dashboard.common import audit_log, load_assets, load_booster, model_version
+from jaga.explain import FEATURE_LABELS, explain_frame
+from jaga.features import ANOMALY_FEATURE
+from jaga.metrics import StageTrace
+from jaga.pipeline import add_features, score_frame
+from jaga.whatif import AXES, DEFAULT_POINTS, risk_surface
+
+# ==========================================
+# HALAMAN: DETEKSI FRAUD (DASHBOARD)
+# ==========================================
+# Satu-satunya halaman (bersama Batch Scoring) yang memuat model; booster
+# XGBoost untuk penjelasan baru dimuat saat tombol analisis pertama ditekan.
+# Simulasi what-if (jaga/whatif.py) adalah st.fragment: mengganti sumbu hanya
+# menjalankan ulang bagian heatmap, grid ~10k titik diskor sekali & di-cache.
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def cached_surface(base_items, x_axis, y_axis, follow_balances):
+    # Key cache = isi transaksi + sumbu; grid yang sama tidak diskor ulang
+    return risk_surface(load_assets(), dict(base_items), x_axis, y_axis, DEFAULT_POINTS, follow_balances)
+
+
+def _axis_labels(axis, values):
+    if axis == 'hour':
+        return [f"{v:02.0f}:00" for v in values]
+    return [f"${v:,.0f}" for v in values]
+
+
+def _nearest(values, value):
+    return int(np.abs(values - value).argmin())
+
+
+def risk_heatmap(surface, base):
+    import altair as alt
+
+    x_axis, y_axis = surface['x_axis'], surface['y_axis']
+    x_labels = _axis_labels(x_axis, surface['x_values'])
+    y_labels = _axis_labels(y_axis, surface['y_values'])
+    ny, nx = surface['proba'].shape
+    grid = pd.DataFrame({
+        'x': np.tile(x_labels, ny),
+        'y': np.repeat(y_labels, nx),
+        'proba': surface['proba'].ravel(),
+    })
+    current = {'hour': base['step'] % 24}
+    marker = pd.DataFrame({
+        'x': [x_labels[_nearest(surface['x_values'], current.get(x_axis, base.get(x_axis, 0)))]],
+        'y': [y_labels[_nearest(surface['y_values'], current.get(y_axis, base.get(y_axis, 0)))]],
+    })
+
+    x_enc = alt.X('x:O', sort=x_labels, title=AXES[x_axis], axis=alt.Axis(labelOverlap=True, labelAngle=-45))
+    y_enc = alt.Y('y:O', sort=y_labels[::-1], title=AXES[y_axis], axis=alt.Axis(labelOverlap=True))
+    heat = alt.Chart(grid).mark_rect().encode(
+        x=x_enc, y=y_enc,
+        color=alt.Color('proba:Q', title="Prob. Fraud",
+                        scale=alt.Scale(scheme='redyellowgreen', reverse=True, domain=[0, 1])),
+        tooltip=[alt.Tooltip('x:O', title=AXES[x_axis]), alt.Tooltip('y:O', title=AXES[y_axis]),
+                 alt.Tooltip('proba:Q', title="Prob. Fraud", format='.1%')],
+    )
+    point = alt.Chart(marker).mark_point(shape='diamond', size=140, filled=True, color='black').encode(
+        x=x_enc, y=y_enc,
+    )
+    return (heat + point).properties(height=420)
+
+
+@st.fragment
+def whatif_section(base):
+    st.markdown("### 🧭 Simulasi What-If")
+    st.caption("Transaksi di atas diubah pada dua sumbu sekaligus; seluruh grid diskor dalam satu panggilan model.")
+    axes = list(AXES)
+    c_x, c_y, c_follow = st.columns([1, 1, 1])
+    x_axis = c_x.selectbox("Sumbu X", axes, index=axes.index('amount'), format_func=AXES.get, key='whatif_x')
+    y_options = [a for a in axes if a != x_axis]
+    y_axis = c_y.selectbox("Sumbu Y", y_options, index=y_options.index('hour') if 'hour' in y_options else 0,
+                           format_func=AXES.get, key='whatif_y')
+    with c_follow:
+        st.write("")
+        follow_balances = st.toggle("Saldo mengikuti nominal", value=True, key='whatif_follow',
+                                    help="Saldo akhir = saldo awal ∓ nominal, sehingga selisih saldo tetap nol.")
+
+    surface = cached_surface(tuple(sorted(base.items())), x_axis, y_axis, follow_balances)
+    st.altair_chart(risk_heatmap(surface, base), width='stretch')
+
+    band = surface['band']
+    st.caption(f"{band.size:,} titik · {np.mean(band == 2):.1%} masuk band blokir, "
+               f"{np.mean(band == 1):.1%} review · ◆ = transaksi saat ini")
+
+
+def render():
+    assets = load_assets()
+
+    st.title("🛡️ Dashboard Deteksi Fraud")
+    st.markdown("Simulasikan transaksi di bawah ini untuk melihat prediksi keamanan secara *real-time*.")
+    
+    # Grid untuk Metrics Utama
+    if assets and 'metrics' in assets:
+        full_metadata = assets['metrics']
+        m = full_metadata['metrics']
+        cols = st.columns(3)
+        cols[0].metric("Precision", f"{m['precision']:.1%}", "High")
+        cols[1].metric("Recall", f"{m['recall']:.1%}", "Sensitivity")
+        cols[2].metric("F1-Score", f"{m['f1_score']:.1%}", "Balanced")
+    
+    st.divider()
+
+    # --- INPUT FORM DI HALAMAN UTAMA (GRID SYSTEM) ---
+    with st.container(border=True):
+        st.subheader("📝 Input Parameter Transaksi")
+        
+        with st.form("transaction_form"):
+            # Baris 1: Informasi Umum (3 Kolom)
+            col_info1, col_info2, col_info3 = st.columns(3)
+            
+            with col_info1:
+                st.markdown("##### 🕒 Waktu & Jenis")
+                hour_val = st.slider("Jam Transaksi", 0, 23, 12, help="Jam berapa transaksi dilakukan?")
+                type_trans = st.selectbox("Tipe Transaksi", ["CASH_OUT", "TRANSFER", "PAYMENT", "CASH_IN", "DEBIT"])
+            
+            with col_info2:
+                st.markdown("##### 📤 Detail Pengirim")
+                old_org = st.number_input("Saldo Awal Pengirim", min_value=0.0, value=5000.0, format="%.2f")
+                new_org = st.number_input("Saldo Akhir Pengirim", min_value=0.0, value=3500.0, format="%.2f")
+            
+            with col_info3:
+                st.markdown("##### 📥 Detail Penerima")
+                old_dest = st.number_input("Saldo Awal Penerima", min_value=0.0, value=0.0, format="%.2f")
+                new_dest = st.number_input("Saldo Akhir Penerima", min_value=0.0, value=1500.0, format="%.2f")
+
+            st.markdown("---")
+            
+            # Baris 2: Nominal & Tombol (Layout Asimetris)
+            c_amount, c_button = st.columns([2, 1])
+            
+            with c_amount:
+                 amount = st.number_input("💵 Nominal Transaksi (USD)", min_value=0.0, value=1500.0, step=100.0, format="%.2f")
+            
+            with c_button:
+                st.write("") # Spacer layout
+                st.write("") 
+                submit = st.form_submit_button("🔍 ANALISIS RISIKO", use_container_width=True)
+
+    # Logika Prediksi
+    if submit and assets:
+        with st.status("Melakukan pemindaian keamanan...", expanded=True) as status:
+            # Data Prep
+            input_df = pd.DataFrame({
+                'step': [hour_val], 'type': [type_trans], 'amount': [amount],
+                'oldbalanceOrg': [old_org], 'newbalanceOrig': [new_org],
+                'oldbalanceDest': [old_dest], 'newbalanceDest': [new_dest]
+            })
+            
+            # Feature Engineering sederhana
+            input_df = add_features(input_df)
+
+            # Predict (durasi tiap tahap dicatat oleh jaga/metrics.py)
+            with StageTrace() as trace:
+                proba, anomaly_score = score_frame(assets, input_df)
+            xgb_proba = proba[0]
+            audit = audit_log()
+            if audit is not None:
+                audit.record('dashboard', model_version(), input_df, anomaly_score, proba,
+                             assets['policy'].decide(proba))
+
+            stage_ms = {k: v * 1000 for k, v in trace.totals().items()}
+            st.write(f"Mengekstrak fitur transaksi... "
+                     f"{stage_ms.get('feature_engineering', 0) + stage_ms.get('preprocess', 0):.2f} ms")
+            st.write(f"Menghitung skor anomali (Isolation Forest)... {stage_ms.get('iso_forest', 0):.2f} ms")
+            st.write(f"Klasifikasi risiko final (XGBoost)... {stage_ms.get('xgboost', 0):.2f} ms")
+
+            status.update(label="Analisis Selesai!", state="complete", expanded=False)
+
+       # --- HASIL VISUAL ---
+        # Threshold mengikuti versi model (optimal_threshold / decision_policy.json)
+        policy = assets['policy']
+        decision = policy.decide(xgb_proba)
+        if decision == 'block':
+            status_title = "🚨 BAHAYA: Transaksi Fraud Terdeteksi"
+            status_desc = "Sistem mendeteksi indikator penipuan yang sangat kuat."
+            css_class = "fraud-bg"
+            text_color = "#c53030"
+            recommendation = "⛔ REKOMENDASI: BLOKIR TRANSAKSI OTOMATIS"
+        elif decision == 'review':
+            status_title = "⚠️ PERINGATAN: Transaksi Mencurigakan"
+            status_desc = "Probabilitas fraud cukup tinggi, namun perlu verifikasi manual."
+            css_class = "fraud-bg" # Bisa buat class baru 'warning-bg' jika mau warna oranye
+            text_color = "#d97706" # Warna Amber/Oranye
+            recommendation = "✋ REKOMENDASI: TAHAN & LAKUKAN PENINJAUAN MANUAL (MANUAL REVIEW)"
+        else:
+            status_title = "✅ AMAN: Transaksi Valid"
+            status_desc = "Pola transaksi terlihat normal dan sesuai profil nasabah."
+            css_class = "safe-bg"
+            text_color = "#2f855a"
+            recommendation = "👍 REKOMENDASI: IZINKAN TRANSAKSI"
+
+        # --- 1. KARTU STATUS UTAMA ---
+        st.markdown(f"""
+            <div class="status-card {css_class}">
+                <h2 style='color:{text_color}; margin:0;'>{status_title}</h2>
+                <p style='color:{text_color}; font-size:16px; margin-top:5px;'>{status_desc}</p>
+                <hr style='border-top: 1px solid {text_color}; opacity: 0.3;'>
+                <p style='color:{text_color}; font-weight:bold; font-size:14px;'>{recommendation}</p>
+            </div>
+        """, unsafe_allow_html=True)
+
+        # --- 2. DETAIL ANALISIS (GRID 2 KOLOM) ---
+        res_col1, res_col2 = st.columns(2)
+        
+        # KOLOM KIRI: Skor Model
+        with res_col1:
+            st.markdown("### 📊 Skor Risiko Model")
+            
+            # Metric Probabilitas XGBoost
+            st.metric(
+                label="Probabilitas Fraud (XGBoost)", 
+                value=f"{xgb_proba:.1%}",
+                delta={"block": "Sangat Berisiko", "review": "Perlu Waspada"}.get(decision, "Aman"),
+                delta_color="inverse"
+            )
+            st.progress(float(xgb_proba))
+            st.caption(f"Review > {policy.review_threshold:.1%} · Blokir > {policy.block_threshold:.1%}")
+            
+            # Metric Anomaly Isolation Forest
+            anom_val = anomaly_score[0]
+            st.metric(
+                label="Skor Anomali (Isolation Forest)", 
+                value=f"{anom_val:.4f}",
+                help="Semakin negatif skornya, semakin aneh/langka data transaksi ini dibandingkan data historis.",
+                delta="Anomaly Terdeteksi" if anom_val < 0 else "Pola Wajar",
+                delta_color="off" if anom_val >= 0 else "inverse" 
+            )
+
+        # KOLOM KANAN: Penjelasan Teknis (Explainability)
+        with res_col2:
+            st.markdown("### 💡 Temuan Teknis (Why?)")
+
+            # Kontribusi TreeSHAP dari booster XGBoost (jaga/explain.py); anomaly_score
+            # dari Isolation Forest di atas dipakai ulang, tidak dihitung dua kali
+            if 'xgb_model' not in assets and 'xgb_booster' not in assets:
+                assets['xgb_booster'] = load_booster()
+            explanation = explain_frame(assets, input_df, anomaly_score)
+            index, values = explanation.top(5)
+            feature_values = {**input_df.iloc[0].to_dict(), ANOMALY_FEATURE: anom_val}
+
+            with st.container(border=True):
+                for j, contribution in zip(index[0], values[0]):
+                    feature = explanation.feature_names[j]
+                    if feature.startswith('type_'):
+                        shown = "Ya" if type_trans == feature[len('type_'):] else "Tidak"
+                    elif feature in ('hour', 'step'):
+                        shown = f"{feature_values[feature]:.0f}"
+                    elif feature == ANOMALY_FEATURE:
+                        shown = f"{feature_values[feature]:.4f}"
+                    else:
+                        shown = f"${feature_values[feature]:,.2f}"
+                    label = FEATURE_LABELS.get(feature, feature)
+                    if contribution > 0:
+                        st.error(f"🔺 **{label}** ({shown}) menaikkan risiko: **{contribution:+.3f}**")
+                    else:
+                        st.success(f"🔻 **{label}** ({shown}) menurunkan risiko: **{contribution:+.3f}**")
+
+            st.caption(f"Kontribusi dalam satuan log-odds XGBoost. Nilai dasar model {explanation.bias[0]:+.3f} "
+                       "ditambah seluruh kontribusi fitur = skor akhir sebelum sigmoid.")
+
+        st.divider()
+        whatif_section({
+            'step': hour_val, 'type': type_trans, 'amount': amount,
+            'oldbalanceOrg': old_org, 'newbalanceOrig': new_org,
+            'oldbalanceDest': old_dest, 'newbalanceDest': new_dest,
+        })
@@ -0,0 +1,59 @@
+import streamlit as st
+
+# ==========================================
+# HALAMAN: PENJELASAN MODEL
+# ==========================================
+# Konten statis: tidak memuat model maupun pandas.
+
+
+def render():
+    st.title("📚 Arsitektur Sistem JAGA ")
+    
+    st.markdown("""
+        <div style="background: linear-gradient(90deg, #1e3a8a 0%, #3b82f6 100%); padding: 30px; border-radius: 20px; color: white; margin-bottom: 30px;">
+            <h3 style="margin:0;">Mengapa Menggunakan Pendekatan Hybrid?</h3>
+            <p style="opacity: 0.9; font-size: 16px; margin-top: 10px;">
+                Penipuan transaksi (fraud) seringkali memiliki pola yang sangat cerdik dan terus berubah. JAGA menggabungkan 
+                <b>Unsupervised Learning</b> untuk mendeteksi anomali baru (Zero-day fraud) dan <b>Supervised Learning</b> 
+                untuk akurasi tinggi pada pola yang sudah dikenal.
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("🔄 Alur Kerja Data (Model Pipeline)")
+    
+    
+    st.markdown("""
+    <div style="background-color: #f1f5f9; padding: 20px; border-radius: 15px; border: 1px solid #e2e8f0;">
+        <p style="color: #475569; font-size: 14px;">
+            <b>Input Transaksi</b> → <b>Preprocessing</b> (Scaling & Encoding) → <b>Layer 1: Isolation Forest</b> (Skoring Anomali) → 
+            <b>Layer 2: XGBoost</b> (Klasifikasi Final) → <b>Hasil Prediksi</b>
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.write("")
+
+    col_a, col_b = st.columns(2)
+    with col_a:
+        st.markdown("""
+            <div style="border: 1px solid #e2e8f0; padding: 20px; border-radius: 15px; height: 100%;">
+                <img src="https://img.icons8.com/fluency/64/search-property.png"/>
+                <h4 style="margin-top: 15px;">Layer 1: Isolation Forest</h4>
+                <p style="font-size: 14px; color: #64748b;"><b>Spesialisasi: Deteksi Kejanggalan</b></p>
+                <p style="font-size: 14px; line-height: 1.6;">
+                    Model ini bekerja tanpa label. Ia mengasumsikan bahwa transaksi fraud adalah <b>langka</b> dan <b>berbeda</b> secara statistik.
+                </p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col_b:
+        st.markdown("""
+            <div style="border: 1px solid #e2e8f0; padding: 20px; border-radius: 15px; height: 100%;">
+                <img src="https://img.icons8.com/fluency/64/flash-on.png"/>
+                <h4 style="margin-top: 15px;">Layer 2: XGBoost Classifier</h4>
+                <p style="font-size: 14px; color: #64748b;"><b>Spesialisasi: Akurasi & Presisi</b></p>
+                <p style="font-size: 14px; line-height: 1.6;">
+                    Algoritma Gradient Boosting yang sangat kuat. Ia menerima input fitur transaksi beserta <b>skor dari Layer 1</b> untuk klasifikasi akhir yang tajam.
+                </p>
+            </div>
+        """, unsafe_allow_html=True)
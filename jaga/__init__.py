@@ -0,0 +1,2 @@
+# JAGA - Hybrid Fraud Shield
+# Paket inti scoring (tanpa Streamlit) yang dipakai dashboard, batch, dan service.
@@ -0,0 +1,229 @@
+import argparse
+
+import numpy as np
+
+# ==========================================
+# ENGINE ANOMALY SCORE (ISOLATION FOREST)
+# ==========================================
+# Evaluasi semua pohon Isolation Forest sekaligus untuk satu batch. Tiap pohon
+# dipadatkan menjadi pohon biner sempurna sedalam max_depth (8 untuk
+# max_samples=256) sehingga traversal cukup aritmetika indeks:
+#
+#   anak = 2 * node + 1 + (x > threshold)
+#
+# tanpa array anak kiri/kanan (satu gather lebih sedikit per level dibanding
+# FlatForest di jaga/compiled.py). Daun yang lebih dangkal diperpanjang dengan
+# threshold +inf (selalu ke kiri) dan nilainya disalin ke semua daun turunannya.
+# Threshold disimpan float32 dibulatkan ke bawah: untuk input float32,
+# x > t32  <=>  x > t64, jadi hasil identik dengan sklearn. NaN mengikuti
+# missing_go_to_left sklearn (default_left FlatForest), seperti FlatForest.apply.
+#
+# Mode pohon terbatas (opsional, TreeBudget): pohon dievaluasi per `step`, baris
+# berhenti setelah `min_trees` jika rata-rata path length-nya sudah jauh dari
+# batas keputusan Isolation Forest (decision_function = 0), yaitu
+#
+#   |mean - batas| > z * std / sqrt(k)
+#
+# Skor baris yang berhenti dihitung dari k pohon pertama (aproksimasi). Dampaknya
+# ke probabilitas XGBoost diukur di benchmarks/bench_anomaly.py:
+#   python -m benchmarks.bench_anomaly --versions v1_2
+# Batas yang dipakai adalah batas Isolation Forest, bukan threshold split XGBoost
+# atas anomaly_score: split itu terlalu rapat (64 di v1_2) sehingga berhenti
+# tanpa mengubah probabilitas hampir tidak pernah terjadi (~99 dari 100 pohon).
+# Batch < BUDGET_MIN_ROWS selalu memakai semua pohon (overhead per tahap lebih
+# mahal daripada pohon yang dihemat).
+#
+# Aktif otomatis untuk assets native/compiled (mode lengkap, exact). Mode pohon
+# terbatas: set_tree_budget(assets, TreeBudget(20)), JAGA_ISO_MIN_TREES=20
+# (jaga/server.py) atau --iso-min-trees 20 (jaga/batch.py).
+
+# Pohon lebih dalam (max_samples besar) tetap memakai FlatForest: ukuran
+# layout sempurna tumbuh 2^depth per pohon
+MAX_PADDED_DEPTH = 12
+
+# Ukuran blok evaluasi dalam sel baris x pohon: matriks node kecil tetap di
+# cache (256 baris x 100 pohon ~2x lebih cepat dibanding 2048 baris)
+BLOCK_CELLS = 25_600
+
+BUDGET_MIN_ROWS = 512
+
+DEFAULT_MIN_TREES = 20
+DEFAULT_STEP = 10
+DEFAULT_Z = 3.0
+
+
+class TreeBudget:
+
+    def __init__(self, min_trees=DEFAULT_MIN_TREES, step=DEFAULT_STEP, z=DEFAULT_Z):
+        if min_trees < 1 or step < 1 or z < 0:
+            raise ValueError(f"TreeBudget tidak valid: min_trees={min_trees}, step={step}, z={z}")
+        self.min_trees = int(min_trees)
+        self.step = int(step)
+        self.z = float(z)
+
+    def to_dict(self):
+        return {'min_trees': self.min_trees, 'step': self.step, 'z': self.z}
+
+
+def _round_down_float32(threshold):
+    t32 = threshold.astype(np.float32)
+    above = t32.astype(np.float64) > threshold
+    t32[above] = np.nextafter(t32[above], np.float32(-np.inf))
+    return t32
+
+
+class IsolationEngine:
+
+    def __init__(self, feature, threshold, leaf_value, offset, average_depth, default_left=None):
+        # feature/threshold/default_left: (n_trees, 2^depth - 1), leaf_value: (n_trees, 2^depth)
+        self.n_trees, n_leaves = leaf_value.shape
+        self.depth = int(np.log2(n_leaves))
+        self.n_internal = n_leaves - 1
+        self.feature = np.ascontiguousarray(feature, dtype=np.int32).ravel()
+        self.threshold = np.ascontiguousarray(threshold, dtype=np.float32).ravel()
+        self.leaf_value = np.ascontiguousarray(leaf_value, dtype=np.float64).ravel()
+        if default_left is None:
+            default_left = np.ones(self.threshold.shape, dtype=bool)
+        self.default_left = np.ascontiguousarray(default_left, dtype=bool).ravel()
+        self.root_feature = self.feature[::self.n_internal].copy()
+        self.root_threshold = self.threshold[::self.n_internal].copy()
+        self.offset = float(offset)
+        # c(max_samples): rata-rata path length, skor = -2^(-mean / c) - offset
+        self.average_depth = float(average_depth)
+        # Rata-rata path length di mana decision_function = 0
+        self.boundary = -self.average_depth * np.log2(-self.offset) if self.offset < 0 else np.inf
+        self.budget = None
+
+    @classmethod
+    def from_forest(cls, forest, offset, denominator):
+        # forest: FlatForest Isolation Forest (jaga/compiled.py), daun menunjuk ke dirinya sendiri
+        if forest.max_depth > MAX_PADDED_DEPTH:
+            raise ValueError(f"Kedalaman pohon {forest.max_depth} > {MAX_PADDED_DEPTH}, pakai FlatForest.")
+        depth = max(forest.max_depth, 1)
+        n_trees = forest.n_trees
+        threshold32 = _round_down_float32(np.asarray(forest.threshold, dtype=np.float64))
+
+        feature = np.empty((n_trees, 2 ** depth - 1), dtype=np.int32)
+        threshold = np.empty((n_trees, 2 ** depth - 1), dtype=np.float32)
+        default_left = np.empty((n_trees, 2 ** depth - 1), dtype=bool)
+        node = forest.roots[:, None]
+        for level in range(depth):
+            is_leaf = forest.left[node] == node
+            start = 2 ** level - 1
+            feature[:, start:start + node.shape[1]] = np.where(is_leaf, 0, forest.feature[node])
+            threshold[:, start:start + node.shape[1]] = np.where(is_leaf, np.inf, threshold32[node])
+            default_left[:, start:start + node.shape[1]] = is_leaf | forest.default_left[node]
+            node = np.stack([forest.left[node], forest.right[node]], axis=-1).reshape(n_trees, -1)
+        return cls(feature, threshold, forest.value[node], offset, denominator / n_trees, default_left)
+
+    def path_lengths(self, X32, first=0, last=None):
+        # X32: float32 (n, n_features) -> path length (n, last - first) untuk pohon first..last-1
+        last = self.n_trees if last is None else last
+        X32 = np.ascontiguousarray(X32)
+        n, n_features = X32.shape
+        X_flat = X32.ravel()
+        row_offset = (np.arange(n, dtype=np.int32) * n_features)[:, None]
+        trees = np.arange(first, last, dtype=np.int32)
+        base = trees * self.n_internal
+
+        has_nan = np.isnan(X_flat).any()
+
+        # Level 0: semua baris mulai dari akar, tanpa gather indeks node
+        x = X32[:, self.root_feature[first:last]]
+        go_right = x > self.root_threshold[first:last]
+        if has_nan:
+            go_right = np.where(np.isnan(x), ~self.default_left[base], go_right)
+        node = go_right.astype(np.int32) + 1
+        for _ in range(self.depth - 1):
+            at = base + node
+            x = np.take(X_flat, row_offset + np.take(self.feature, at))
+            go_right = x > np.take(self.threshold, at)
+            if has_nan:
+                go_right = np.where(np.isnan(x), ~np.take(self.default_left, at), go_right)
+            node = 2 * node + 1 + go_right
+        return np.take(self.leaf_value, trees * (self.n_internal + 1) + (node - self.n_internal))
+
+    def _score(self, mean_path):
+        return -(2.0 ** (-mean_path / self.average_depth)) - self.offset
+
+    def score(self, X32, budget=None):
+        # Setara iso_forest.decision_function; budget=None -> semua pohon (exact)
+        budget = self.budget if budget is None else budget
+        n = len(X32)
+        if budget is not None and n >= BUDGET_MIN_ROWS:
+            return self.score_budget(X32, budget)[0]
+        block = max(BLOCK_CELLS // self.n_trees, 1)
+        total = np.empty(n, dtype=np.float64)
+        for start in range(0, n, block):
+            total[start:start + block] = self.path_lengths(X32[start:start + block]).sum(axis=1)
+        return self._score(total / self.n_trees)
+
+    def score_budget(self, X32, budget):
+        # -> (skor, jumlah pohon yang dievaluasi per baris)
+        n = len(X32)
+        block = max(BLOCK_CELLS // budget.step, 1)
+        score = np.empty(n, dtype=np.float64)
+        used = np.empty(n, dtype=np.int64)
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            score[start:stop], used[start:stop] = self._score_budget_block(X32[start:stop], budget)
+        return score, used
+
+    def _score_budget_block(self, X32, budget):
+        n = len(X32)
+        total = np.zeros(n, dtype=np.float64)
+        square = np.zeros(n, dtype=np.float64)
+        used = np.zeros(n, dtype=np.int64)
+        active = np.arange(n)
+        for first in range(0, self.n_trees, budget.step):
+            last = min(first + budget.step, self.n_trees)
+            h = self.path_lengths(X32[active], first, last)
+            total[active] += h.sum(axis=1)
+            square[active] += np.square(h).sum(axis=1)
+            used[active] = last
+            if last < budget.min_trees or last == self.n_trees:
+                continue
+            mean = total[active] / last
+            std = np.sqrt(np.maximum(square[active] / last - mean ** 2, 0.0))
+            active = active[np.abs(mean - self.boundary) <= budget.z * std / np.sqrt(last)]
+            if not len(active):
+                break
+        return self._score(total / used), used
+
+
+def set_tree_budget(assets, budget):
+    # Mode pohon terbatas untuk assets native/compiled (None = kembali ke semua pohon)
+    compiled = assets.get('compiled')
+    if compiled is None or compiled.iso_engine is None:
+        raise ValueError("Mode pohon terbatas butuh assets native/compiled dengan IsolationEngine.")
+    compiled.iso_engine.budget = budget
+    return assets
+
+
+def main(argv=None):
+    from jaga.pipeline import DEFAULT_MODEL_DIR, load_scoring_assets
+    from jaga.synthetic import make_transactions
+
+    parser = argparse.ArgumentParser(description="Cek rata-rata pohon yang dievaluasi per TreeBudget")
+    parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--min-trees', type=int, nargs='+', default=[10, 20, 40])
+    parser.add_argument('--z', type=float, default=DEFAULT_Z)
+    args = parser.parse_args(argv)
+
+    compiled = load_scoring_assets(args.model_dir).get('compiled')
+    if compiled is None or compiled.iso_engine is None:
+        parser.error(f"{args.model_dir} belum punya format native (python -m jaga.artifacts {args.model_dir}).")
+    engine = compiled.iso_engine
+    X = compiled.features.from_frame(make_transactions(args.rows, seed=8))
+    X32 = X[:, :compiled.features.n_preprocessed].astype(np.float32)
+    exact = engine.score(X32)
+    print(f"{'min_trees':>10}{'rata2 pohon':>13}{'max |selisih|':>15}{'tanda beda':>12}")
+    for min_trees in args.min_trees:
+        score, used = engine.score_budget(X32, TreeBudget(min_trees, z=args.z))
+        flipped = int((np.sign(score) != np.sign(exact)).sum())
+        print(f"{min_trees:>10}{used.mean():>13.1f}{np.abs(score - exact).max():>15.5f}{flipped:>12,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+import argparse
+import glob
+import json
+import os
+
+import numpy as np
+
+from jaga.compiled import FORMAT_VERSION, CompiledModel
+from jaga.policy import DecisionPolicy
+
+# ==========================================
+# FORMAT MODEL NATIVE (TANPA PICKLE, MEMORY-MAPPED)
+# ==========================================
+# Struktur models/vX/native/:
+#
+#   manifest.json      format, versi, metadata model & daftar array
+#   arrays/<nama>.npy  parameter preprocessing + pohon IF & XGBoost (flattened)
+#   xgb_model.ubj      booster XGBoost format native (untuk tooling xgboost)
+#
+# Array dibuka dengan np.load(mmap_mode='r'): semua worker di mesin yang sama
+# berbagi satu salinan page cache dan start tanpa import sklearn/xgboost.
+#
+# Konversi:  python -m jaga.artifacts models/v0 models/v1 models/v1_2
+#            python -m jaga.artifacts --all
+
+NATIVE_DIRNAME = 'native'
+FORMAT_NAME = 'jaga-native'
+MANIFEST_FILENAME = 'manifest.json'
+BOOSTER_FILENAME = 'xgb_model.ubj'
+
+
+def native_dir(model_dir):
+    return os.path.join(model_dir, NATIVE_DIRNAME)
+
+
+def has_native(model_dir):
+    return os.path.exists(os.path.join(native_dir(model_dir), MANIFEST_FILENAME))
+
+
+def convert(model_dir, output_dir=None):
+    from jaga.pipeline import load_pipeline
+
+    assets = load_pipeline(model_dir)
+    compiled = CompiledModel.from_assets(assets)
+    output_dir = output_dir or native_dir(model_dir)
+    array_dir = os.path.join(output_dir, 'arrays')
+    os.makedirs(array_dir, exist_ok=True)
+
+    arrays = compiled.to_arrays()
+    for name, array in arrays.items():
+        np.save(os.path.join(array_dir, f'{name}.npy'), np.ascontiguousarray(array), allow_pickle=False)
+    assets['xgb_model'].get_booster().save_model(os.path.join(output_dir, BOOSTER_FILENAME))
+
+    manifest = {
+        'format': FORMAT_NAME,
+        'format_version': FORMAT_VERSION,
+        'source': os.path.normpath(model_dir),
+        'metadata': assets['metrics'],
+        'arrays': sorted(arrays),
+        'booster': BOOSTER_FILENAME,
+    }
+    # Manifest ditulis terakhir: folder tanpa manifest dianggap belum lengkap
+    with open(os.path.join(output_dir, MANIFEST_FILENAME), 'w') as f:
+        json.dump(manifest, f, indent=4)
+    return output_dir
+
+
+def load_booster(model_dir):
+    # Booster XGBoost asli (mis. untuk TreeSHAP di jaga/explain.py); butuh xgboost
+    import xgboost as xgb
+
+    with open(os.path.join(native_dir(model_dir), MANIFEST_FILENAME), 'r') as f:
+        manifest = json.load(f)
+    booster = xgb.Booster()
+    booster.load_model(os.path.join(native_dir(model_dir), manifest['booster']))
+    return booster
+
+
+def load_native(model_dir, mmap=True, with_booster=False):
+    path = native_dir(model_dir)
+    with open(os.path.join(path, MANIFEST_FILENAME), 'r') as f:
+        manifest = json.load(f)
+    if manifest.get('format') != FORMAT_NAME or manifest.get('format_version') != FORMAT_VERSION:
+        raise ValueError(
+            f"Format {manifest.get('format')} v{manifest.get('format_version')} di {path} "
+            f"tidak didukung (harus {FORMAT_NAME} v{FORMAT_VERSION})."
+        )
+
+    mmap_mode = 'r' if mmap else None
+    arrays = {
+        name: np.load(os.path.join(path, 'arrays', f'{name}.npy'), mmap_mode=mmap_mode, allow_pickle=False)
+        for name in manifest['arrays']
+    }
+    compiled = CompiledModel.from_arrays(arrays, manifest['metadata'])
+    assets = {
+        'compiled': compiled,
+        'features': compiled.features,
+        'metrics': manifest['metadata'],
+        'policy': DecisionPolicy.for_model(model_dir, manifest['metadata']),
+    }
+    if with_booster:
+        assets['xgb_booster'] = load_booster(model_dir)
+    return assets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi folder models/vX ke format native (tanpa pickle)")
+    parser.add_argument('model_dirs', nargs='*')
+    parser.add_argument('--all', action='store_true', help="Konversi semua folder di models/")
+    args = parser.parse_args(argv)
+
+    model_dirs = list(args.model_dirs)
+    if args.all:
+        model_dirs += sorted(d for d in glob.glob('models/*') if os.path.isdir(d))
+    if not model_dirs:
+        parser.error("Sebutkan folder model atau gunakan --all.")
+
+    for model_dir in model_dirs:
+        print(f"{model_dir} -> {convert(model_dir)}")
+
+
+if __name__ == '__main__':
+    main()
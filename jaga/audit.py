@@ -0,0 +1,367 @@
+import argparse
+import os
+import queue
+import sys
+import threading
+import time
+
+import numpy as np
+
+from jaga.features import RAW_NUMERIC_COLUMNS
+
+# ==========================================
+# AUDIT LOG KEPUTUSAN SCORING
+# ==========================================
+# Setiap baris yang diskor dicatat (input mentah, fitur turunan, anomaly_score,
+# probabilitas, keputusan, versi model, tahap keluar cascade) ke file Parquet
+# append-only:
+#
+#   audit/date=2026-10-18/part-071502-12345-0003.parquet
+#
+# Thread scoring hanya menaruh referensi array/record ke buffer (tanpa I/O).
+# Thread latar menggabungkan buffer tiap FLUSH_ROWS baris / FLUSH_SECONDS
+# detik menjadi satu row group, dan menutup file (rotasi) setiap ROTATE_ROWS
+# baris / ROTATE_SECONDS detik / ganti tanggal. File yang sedang ditulis
+# berawalan titik sehingga tidak terbaca query sampai ditutup & di-rename.
+# Jika antrean penuh, batch dibuang & dihitung (dropped_rows): scoring tidak
+# pernah menunggu disk.
+#
+# Query (pyarrow.dataset, hanya partisi tanggal & row group yang relevan dibaca):
+#   python -m jaga.audit audit/ --start 2026-10-18T08:00 --end 2026-10-18T09:00 \
+#       --type TRANSFER --decision block
+#
+# Selalu opt-in: jaga/server.py & dashboard (halaman "Deteksi Fraud" dan "Batch
+# Scoring") hanya mencatat jika JAGA_AUDIT_DIR diisi, jaga/batch.py dengan --audit.
+
+DEFAULT_FOLDER = 'audit'
+FLUSH_ROWS = 10_000
+FLUSH_SECONDS = 5.0
+ROTATE_ROWS = 1_000_000
+ROTATE_SECONDS = 600.0
+DEFAULT_MAX_PENDING = 256
+COMPRESSION = 'zstd'
+
+# Kolom opsional dari record (id akun untuk join label / investigasi sengketa)
+ID_COLUMNS = ['nameOrig', 'nameDest']
+DERIVED_COLUMNS = ['hour', 'errorBalanceOrig', 'errorBalanceDest']
+
+
+def audit_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [('ts', pa.timestamp('ms', tz='UTC')),
+         ('source', pa.dictionary(pa.int8(), pa.string())),
+         ('version', pa.dictionary(pa.int8(), pa.string())),
+         ('type', pa.dictionary(pa.int8(), pa.string()))]
+        + [(c, pa.float64()) for c in RAW_NUMERIC_COLUMNS]
+        + [(c, pa.string()) for c in ID_COLUMNS]
+        + [(c, pa.float64()) for c in DERIVED_COLUMNS]
+        + [('anomaly_score', pa.float64()),
+           ('fraud_probability', pa.float64()),
+           ('decision', pa.dictionary(pa.int8(), pa.string())),
+         ('stage', pa.dictionary(pa.int8(), pa.string()))]
+    )
+
+
+def _record_columns(rows):
+    # rows: list of dict (payload API) atau DataFrame -> dict kolom
+    if isinstance(rows, list):
+        columns = {c: np.array([r[c] for r in rows], dtype=np.float64) for c in RAW_NUMERIC_COLUMNS}
+        columns['type'] = [str(r['type']) for r in rows]
+        for c in ID_COLUMNS:
+            columns[c] = [r.get(c) for r in rows]
+        return columns
+    columns = {c: rows[c].to_numpy(dtype=np.float64) for c in RAW_NUMERIC_COLUMNS}
+    columns['type'] = rows['type'].astype(str).to_numpy(dtype=object)
+    for c in ID_COLUMNS:
+        columns[c] = rows[c].astype(object).to_numpy() if c in rows else [None] * len(rows)
+    return columns
+
+
+def _stages(stage, anomaly_score):
+    # Tahap keluar cascade (jaga/cascade.py). Jika pemanggil tidak tahu (mis. batch
+    # --cascade): 'model' untuk baris ber-anomaly_score, null untuk baris yang dilewati
+    if stage is not None:
+        return np.asarray(stage, dtype=object)
+    return np.where(np.isnan(anomaly_score), None, 'model').astype(object)
+
+
+def to_table(ts, source, version, rows, anomaly_score, proba, decision, stage=None):
+    import pyarrow as pa
+
+    columns = _record_columns(rows)
+    n = len(columns['amount'])
+    # Urutan operasi sama dengan add_features (nilai identik dengan fitur model)
+    columns['hour'] = columns['step'] % 24
+    columns['errorBalanceOrig'] = columns['newbalanceOrig'] + columns['amount'] - columns['oldbalanceOrg']
+    columns['errorBalanceDest'] = columns['oldbalanceDest'] + columns['amount'] - columns['newbalanceDest']
+    anomaly_score = np.asarray(anomaly_score, dtype=np.float64)
+    proba = np.asarray(proba, dtype=np.float64)
+    schema = audit_schema()
+    arrays = {
+        'ts': pa.array(np.full(n, int(ts * 1000), dtype=np.int64), pa.int64()).cast(schema.field('ts').type),
+        'source': pa.array([source] * n, pa.string()).dictionary_encode(),
+        'version': pa.array(np.asarray(version, dtype=object) if np.ndim(version) else [version] * n,
+                            pa.string()).dictionary_encode(),
+        'type': pa.array(columns['type'], pa.string()).dictionary_encode(),
+        # Baris yang dilewati cascade (anomaly_score NaN) -> null
+        'anomaly_score': pa.array(anomaly_score, mask=np.isnan(anomaly_score)),
+        # Baris prefilter cascade (proba NaN, hanya batas atas diketahui) -> null
+        'fraud_probability': pa.array(proba, mask=np.isnan(proba)),
+        'decision': pa.array(np.asarray(decision, dtype=object), pa.string()).dictionary_encode(),
+        'stage': pa.array(_stages(stage, anomaly_score), pa.string()).dictionary_encode(),
+    }
+    for c in RAW_NUMERIC_COLUMNS + DERIVED_COLUMNS:
+        arrays[c] = pa.array(columns[c], pa.float64())
+    for c in ID_COLUMNS:
+        arrays[c] = pa.array(columns[c], pa.string())
+    return pa.Table.from_arrays(
+        [arrays[f.name].cast(f.type) for f in schema], schema=schema
+    )
+
+
+# ==========================================
+# 1. PENULIS (THREAD LATAR)
+# ==========================================
+class _RotatingWriter:
+    # Satu file Parquet terbuka per proses; ditutup & di-rename saat rotasi
+
+    def __init__(self, folder, rotate_rows, rotate_seconds):
+        self.folder = folder
+        self.rotate_rows = rotate_rows
+        self.rotate_seconds = rotate_seconds
+        self.writer = None
+        self.path = None
+        self.date = None
+        self.rows = 0
+        self.opened = 0.0
+        self.sequence = 0
+        self.files = 0
+
+    def write(self, table, now):
+        import pyarrow.parquet as pq
+
+        date = time.strftime('%Y-%m-%d', time.gmtime(now))
+        if self.writer is not None and (date != self.date or self.rows >= self.rotate_rows
+                                        or now - self.opened >= self.rotate_seconds):
+            self.close()
+        if self.writer is None:
+            folder = os.path.join(self.folder, f'date={date}')
+            os.makedirs(folder, exist_ok=True)
+            name = f"part-{time.strftime('%H%M%S', time.gmtime(now))}-{os.getpid()}-{self.sequence:04d}.parquet"
+            self.path = os.path.join(folder, name)
+            self.writer = pq.ParquetWriter(os.path.join(folder, '.' + name), table.schema,
+                                           compression=COMPRESSION)
+            self.date, self.rows, self.opened = date, 0, now
+            self.sequence += 1
+        self.writer.write_table(table)
+        self.rows += table.num_rows
+
+    def close(self):
+        if self.writer is None:
+            return
+        self.writer.close()
+        folder, name = os.path.split(self.path)
+        os.replace(os.path.join(folder, '.' + name), self.path)
+        self.writer = None
+        self.files += 1
+
+
+class AuditLog:
+
+    def __init__(self, folder=DEFAULT_FOLDER, flush_rows=FLUSH_ROWS, flush_seconds=FLUSH_SECONDS,
+                 rotate_rows=ROTATE_ROWS, rotate_seconds=ROTATE_SECONDS, max_pending=DEFAULT_MAX_PENDING):
+        self.folder = folder
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self._writer = _RotatingWriter(folder, rotate_rows, rotate_seconds)
+
+        self._buffer_lock = threading.Lock()
+        self._buffer = []
+        self._buffer_rows = 0
+        self._queue = queue.Queue(max_pending)
+        self.rows_written = 0
+        self.dropped_rows = 0
+        self.errors = 0
+        self._last_flush = time.time()
+
+        self._thread = threading.Thread(target=self._run, name='jaga-audit', daemon=True)
+        self._thread.start()
+
+    def record(self, source, version, rows, anomaly_score, proba, decision, stage=None, block=False):
+        # Dipanggil di thread scoring: hanya menyimpan referensi (block=True untuk batch offline)
+        entry = (time.time(), source, version, rows, anomaly_score, proba, decision, stage)
+        with self._buffer_lock:
+            self._buffer.append(entry)
+            self._buffer_rows += len(proba)
+            if self._buffer_rows < self.flush_rows:
+                return
+            entries, self._buffer, self._buffer_rows = self._buffer, [], 0
+        self._send(entries, block)
+
+    def _send(self, entries, block):
+        try:
+            self._queue.put(('rows', entries), block=block)
+        except queue.Full:
+            # Bisa dipanggil beberapa thread scoring sekaligus
+            with self._buffer_lock:
+                self.dropped_rows += sum(len(e[5]) for e in entries)
+
+    def _take_buffer(self):
+        with self._buffer_lock:
+            entries, self._buffer, self._buffer_rows = self._buffer, [], 0
+        return entries
+
+    def flush(self):
+        # Buffer ditulis & file berjalan ditutup (langsung terlihat oleh query)
+        entries = self._take_buffer()
+        if entries:
+            self._queue.put(('rows', entries))
+        self._queue.put(('rotate',))
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            timeout = max(self._last_flush + self.flush_seconds - time.time(), 0.01)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            try:
+                if item is None:
+                    entries = self._take_buffer()
+                    if entries:
+                        self._write(entries)
+                    self._last_flush = time.time()
+                elif item[0] == 'rows':
+                    self._write(item[1])
+                elif item[0] == 'rotate':
+                    self._writer.close()
+                elif item[0] == 'stop':
+                    self._writer.close()
+                    return
+            except Exception as e:
+                with self._buffer_lock:
+                    self.errors += 1
+                print(f"jaga.audit: {e}", file=sys.stderr)
+            finally:
+                if item is not None:
+                    self._queue.task_done()
+
+    def _write(self, entries):
+        import pyarrow as pa
+
+        table = pa.concat_tables([to_table(*entry) for entry in entries]).unify_dictionaries()
+        self._writer.write(table.combine_chunks(), time.time())
+        self.rows_written += table.num_rows
+
+    def stats(self):
+        return {
+            'folder': self.folder,
+            'rows_written': self.rows_written,
+            'buffered_rows': self._buffer_rows,
+            'pending_batches': self._queue.qsize(),
+            'dropped_rows': self.dropped_rows,
+            'files_closed': self._writer.files,
+            'errors': self.errors,
+        }
+
+    def close(self):
+        entries = self._take_buffer()
+        if entries:
+            self._queue.put(('rows', entries))
+        self._queue.put(('stop',))
+        self._thread.join()
+
+
+# ==========================================
+# 2. QUERY
+# ==========================================
+def _timestamp(value):
+    # datetime / string ISO (tanpa zona = UTC) / epoch detik -> pandas Timestamp UTC
+    import pandas as pd
+
+    if isinstance(value, (int, float)):
+        return pd.Timestamp(value, unit='s', tz='UTC')
+    ts = pd.Timestamp(value)
+    return ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+
+
+def audit_dataset(folder=DEFAULT_FOLDER):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    partitioning = ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+    return ds.dataset(folder, format='parquet', partitioning=partitioning, schema=audit_schema().append(
+        pa.field('date', pa.string())))
+
+
+def query_filter(start=None, end=None, types=None, decisions=None, versions=None, sources=None, stages=None):
+    # Ekspresi pyarrow: partisi tanggal dipangkas dulu, lalu statistik row group (ts)
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    conditions = []
+    if start is not None:
+        start = _timestamp(start)
+        conditions += [ds.field('date') >= start.strftime('%Y-%m-%d'),
+                       ds.field('ts') >= pa.scalar(start.to_pydatetime(), pa.timestamp('ms', tz='UTC'))]
+    if end is not None:
+        end = _timestamp(end)
+        conditions += [ds.field('date') <= end.strftime('%Y-%m-%d'),
+                       ds.field('ts') < pa.scalar(end.to_pydatetime(), pa.timestamp('ms', tz='UTC'))]
+    for column, values in (('type', types), ('decision', decisions), ('version', versions), ('source', sources),
+                           ('stage', stages)):
+        if values:
+            conditions.append(ds.field(column).isin(list(values)))
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def query(folder=DEFAULT_FOLDER, start=None, end=None, types=None, decisions=None, versions=None,
+          sources=None, columns=None, stages=None):
+    # -> pyarrow.Table; hanya kolom `columns` yang dibaca dari file (None = semua)
+    dataset = audit_dataset(folder)
+    return dataset.to_table(columns=columns,
+                            filter=query_filter(start, end, types, decisions, versions, sources, stages))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query audit log keputusan scoring JAGA")
+    parser.add_argument('folder', nargs='?', default=DEFAULT_FOLDER)
+    parser.add_argument('--start', help="Waktu awal (ISO, UTC jika tanpa zona), inklusif")
+    parser.add_argument('--end', help="Waktu akhir (ISO, UTC jika tanpa zona), eksklusif")
+    parser.add_argument('--type', nargs='+', dest='types')
+    parser.add_argument('--decision', nargs='+', dest='decisions', choices=['allow', 'review', 'block'])
+    parser.add_argument('--version', nargs='+', dest='versions')
+    parser.add_argument('--source', nargs='+', dest='sources')
+    parser.add_argument('--stage', nargs='+', dest='stages', choices=['type_gate', 'rules', 'prefilter', 'model'],
+                        help="Tahap keluar cascade")
+    parser.add_argument('--columns', nargs='+')
+    parser.add_argument('--limit', type=int, default=20, help="Jumlah baris yang ditampilkan")
+    parser.add_argument('--output', help="Simpan hasil ke file .parquet/.csv")
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.folder):
+        parser.error(f"Folder audit {args.folder} tidak ditemukan.")
+
+    start = time.perf_counter()
+    table = query(args.folder, args.start, args.end, args.types, args.decisions, args.versions, args.sources,
+                  args.columns, args.stages)
+    elapsed = time.perf_counter() - start
+    print(f"{table.num_rows:,} baris ({elapsed * 1000:.0f} ms)", file=sys.stderr)
+    if args.output:
+        if args.output.lower().endswith(('.parquet', '.pq')):
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, args.output, compression=COMPRESSION)
+        else:
+            table.to_pandas().to_csv(args.output, index=False)
+    else:
+        print(table.slice(0, args.limit).to_pandas().to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,244 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from jaga.pipeline import DEFAULT_MODEL_DIR, add_features, decide, load_pipeline, score_frame
+
+# ==========================================
+# BATCH SCORING (HEADLESS)
+# ==========================================
+# Contoh:
+#   python -m jaga.batch paysim.csv hasil.parquet --chunksize 200000
+#
+# Model dimuat sekali, input dibaca per potongan (chunk) berukuran tetap,
+# sehingga pemakaian memori hanya bergantung pada chunksize, bukan ukuran file.
+# --workers N membagi tiap chunk ke N proses (jaga/parallel.py).
+# --velocity menambah fitur aktivitas per akun (jaga/velocity.py); file harus
+# berisi nameOrig/nameDest dan urut step.
+# --graph menambah fitur graf pengirim -> penerima (komponen, fan-in/out, akun
+# penampung; jaga/graph.py), dengan syarat input yang sama.
+# --explain K menambah K fitur dengan kontribusi TreeSHAP terbesar (reason_1..K)
+# untuk baris review/block (jaga/explain.py).
+# --cascade melewati baris yang jelas aman sebelum model lengkap (jaga/cascade.py);
+# baris tersebut mendapat anomaly_score kosong (fraud_probability kosong untuk prefilter).
+# --iso-min-trees K mengaktifkan mode pohon terbatas Isolation Forest (jaga/anomaly.py,
+# butuh format native): baris yang jelas jauh dari batas berhenti setelah >= K pohon.
+# --audit DIR mencatat setiap keputusan ke audit log Parquet (jaga/audit.py).
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def _is_parquet(path):
+    return str(path).lower().endswith(('.parquet', '.pq'))
+
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+class ChunkWriter:
+    # Menulis hasil per chunk (append) ke CSV atau Parquet
+
+    def __init__(self, path):
+        self.path = path
+        self._parquet_writer = None
+        self._header_written = False
+
+    def write(self, df):
+        if _is_parquet(self.path):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._parquet_writer is None:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            else:
+                table = pa.Table.from_pandas(df, schema=self._parquet_writer.schema, preserve_index=False)
+            self._parquet_writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode='a' if self._header_written else 'w',
+                      header=not self._header_written, index=False)
+            self._header_written = True
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+def add_reasons(assets, chunk, top_k):
+    # Kolom reason_j / reason_j_contribution; baris allow dibiarkan kosong
+    from jaga.explain import EXPLAIN_DECISIONS, explain_frame
+
+    rows = np.flatnonzero(chunk['decision'].isin(EXPLAIN_DECISIONS).to_numpy())
+    top_k = min(top_k, assets['features'].n_features)
+    if len(rows):
+        subset = chunk.iloc[rows]
+        index, values = explain_frame(assets, subset, subset['anomaly_score'].to_numpy()).top(top_k)
+    else:
+        index, values = np.empty((0, top_k), dtype=np.intp), np.empty((0, top_k))
+
+    names = np.array(assets['features'].feature_names, dtype=object)
+    for j in range(top_k):
+        feature = np.full(len(chunk), '', dtype=object)
+        feature[rows] = names[index[:, j]]
+        contribution = np.full(len(chunk), np.nan)
+        contribution[rows] = values[:, j]
+        chunk[f'reason_{j + 1}'] = feature
+        chunk[f'reason_{j + 1}_contribution'] = contribution
+    return chunk
+
+
+def score_chunk(assets, chunk, scorer=None, velocity=None, explain=0, graph=None):
+    chunk = add_features(chunk)
+    if velocity is not None:
+        chunk = chunk.join(velocity.update_frame(chunk))
+    if graph is not None:
+        chunk = chunk.join(graph.update_frame(chunk))
+    if scorer is not None:
+        proba, anomaly_score = scorer.score_frame(chunk)
+    else:
+        proba, anomaly_score = score_frame(assets, chunk)
+    chunk['anomaly_score'] = anomaly_score
+    chunk['fraud_probability'] = proba
+    chunk['decision'] = decide(assets, proba)
+    if explain:
+        chunk = add_reasons(assets, chunk, explain)
+    return chunk
+
+
+def iter_scored(assets, chunks, writer, scorer=None, velocity=None, explain=0, audit=None, version=None,
+                graph=None):
+    # Skor + tulis tiap chunk, lalu yield (chunk hasil, total berjalan) agar
+    # pemanggil (CLI / halaman Batch Scoring) bisa menampilkan progres
+    totals = {'rows': 0, 'blocked': 0, 'review': 0}
+    for chunk in chunks:
+        scored = score_chunk(assets, chunk, scorer, velocity, explain, graph)
+        writer.write(scored)
+        if audit is not None:
+            # Batch offline boleh menunggu antrean audit (tidak ada baris yang dibuang)
+            audit.record('batch', version, scored, scored['anomaly_score'].to_numpy(),
+                         scored['fraud_probability'].to_numpy(), scored['decision'].to_numpy(), block=True)
+
+        totals['rows'] += len(scored)
+        totals['blocked'] += int((scored['decision'] == 'block').sum())
+        totals['review'] += int((scored['decision'] == 'review').sum())
+        yield scored, totals
+
+
+def run_batch(input_path, output_path, model_dir=DEFAULT_MODEL_DIR,
+              chunksize=DEFAULT_CHUNKSIZE, workers=1, velocity=None, explain=0, cascade=False, iso_budget=None,
+              audit_dir=None, graph=None, log=sys.stderr):
+    scorer = None
+    if workers > 1:
+        from jaga.parallel import ParallelScorer
+
+        scorer = ParallelScorer(model_dir, workers, cascade=cascade, iso_budget=iso_budget)
+        assets = scorer.assets
+    else:
+        if iso_budget is not None:
+            # Mode pohon terbatas hanya tersedia di format native
+            from jaga.anomaly import set_tree_budget
+            from jaga.pipeline import load_scoring_assets
+
+            assets = set_tree_budget(load_scoring_assets(model_dir), iso_budget)
+        else:
+            assets = load_pipeline(model_dir)
+        if cascade:
+            from jaga.cascade import attach_cascade
+
+            attach_cascade(assets, model_dir)
+    if explain and 'xgb_model' not in assets:
+        from jaga.artifacts import load_booster
+
+        assets['xgb_booster'] = load_booster(model_dir)
+    writer = ChunkWriter(output_path)
+    audit = None
+    if audit_dir:
+        from jaga.audit import AuditLog
+
+        # Antrean pendek: tiap entri berisi satu chunk utuh
+        audit = AuditLog(audit_dir, max_pending=2)
+
+    totals = {'rows': 0, 'blocked': 0, 'review': 0}
+    start = time.perf_counter()
+    try:
+        for _, totals in iter_scored(assets, iter_chunks(input_path, chunksize), writer, scorer, velocity,
+                                    explain, audit, os.path.basename(os.path.normpath(model_dir)), graph):
+            elapsed = time.perf_counter() - start
+            print(f"{totals['rows']:,} baris | {totals['rows'] / elapsed:,.0f} baris/detik", file=log)
+    finally:
+        writer.close()
+        if scorer is not None:
+            scorer.close()
+        if audit is not None:
+            audit.close()
+
+    elapsed = time.perf_counter() - start
+    stats = assets['cascade'].stats() if 'cascade' in assets else None
+    if stats and stats['rows']:
+        # Hanya baris yang diskor di proses ini (dengan --workers, potongan besar diskor worker)
+        print("Cascade: " + ", ".join(
+            f"{stage} {s['exited']:,}" for stage, s in stats['stages'].items()
+        ) + f" | {stats['model_rate']:.1%} baris sampai ke model", file=log)
+    return {
+        **totals,
+        'seconds': elapsed,
+        'rows_per_sec': totals['rows'] / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch scoring JAGA untuk file CSV/Parquet berukuran besar.")
+    parser.add_argument('input', help="File transaksi (.csv atau .parquet)")
+    parser.add_argument('output', help="File hasil (.csv atau .parquet)")
+    parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR)
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument('--workers', type=int, default=1, help="Jumlah proses scoring paralel")
+    parser.add_argument('--velocity', action='store_true', help="Tambahkan fitur velocity per akun")
+    parser.add_argument('--velocity-window', type=int, default=24, help="Window velocity dalam step (jam)")
+    parser.add_argument('--graph', action='store_true',
+                        help="Tambahkan fitur graf akun pengirim -> penerima (fraud ring)")
+    parser.add_argument('--explain', type=int, default=0, metavar='K',
+                        help="Tambahkan K alasan (kontribusi TreeSHAP) untuk baris review/block")
+    parser.add_argument('--cascade', action='store_true',
+                        help="Lewati baris yang jelas aman sebelum model lengkap (cascade.json versi model)")
+    parser.add_argument('--audit', metavar='DIR', help="Catat setiap keputusan ke audit log Parquet di DIR")
+    parser.add_argument('--iso-min-trees', type=int, default=0, metavar='K',
+                        help="Mode pohon terbatas Isolation Forest, minimal K pohon (0 = semua pohon)")
+    args = parser.parse_args(argv)
+
+    velocity = None
+    if args.velocity:
+        from jaga.velocity import VelocityStore
+
+        velocity = VelocityStore(window_steps=args.velocity_window)
+    graph = None
+    if args.graph:
+        from jaga.graph import AccountGraph
+
+        graph = AccountGraph()
+    iso_budget = None
+    if args.iso_min_trees > 0:
+        from jaga.anomaly import TreeBudget
+
+        iso_budget = TreeBudget(args.iso_min_trees)
+    summary = run_batch(args.input, args.output, args.model_dir, args.chunksize, args.workers, velocity,
+                        args.explain, args.cascade, iso_budget, args.audit, graph)
+    print(f"Selesai: {summary['rows']:,} baris dalam {summary['seconds']:.1f} detik "
+          f"({summary['rows_per_sec']:,.0f} baris/detik), {summary['blocked']:,} diblokir, "
+          f"{summary['review']:,} perlu review.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from jaga.pipeline import RAW_COLUMNS
+
+# ==========================================
+# CACHE HASIL SCORING (RETRY / DUPLIKAT)
+# ==========================================
+# Gateway pembayaran mengirim ulang transaksi yang identik saat retry. Hasil
+# model untuk 7 kolom input yang sama pada versi model yang sama pasti sama,
+# jadi tidak perlu melewati preprocessor, Isolation Forest & XGBoost lagi.
+#
+#   key   : blake2b(model_tag + 7 kolom input dalam bentuk kanonik)
+#   value : probability & anomaly_score (decision dihitung ulang dari policy)
+#
+# model_tag = versi + signature file model (registry). Saat versi aktif
+# berganti atau file model berubah, tag berubah: entri lama tidak pernah cocok
+# lagi dan dibersihkan. Worker uvicorn mengikuti versi yang sama lewat
+# models/selection.json (jaga/registry.py), jadi tag antar worker hanya berbeda
+# selama satu interval watcher setelah hot swap.
+#
+# Dua implementasi dengan antarmuka sama:
+#   ScoreCache        : di dalam proses (OrderedDict, LRU + TTL)
+#   SharedScoreCache  : file SQLite lokal, dipakai bersama oleh semua worker
+#                       (mis. uvicorn --workers 4)
+
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_TTL_SECONDS = 300.0
+
+
+def cache_key(record, model_tag):
+    # 100 dan 100.0 (juga -0.0 dan 0.0: + 0.0 membuang tanda nol) menghasilkan key
+    # yang sama; urutan field JSON tidak berpengaruh
+    parts = [model_tag, str(record['type'])]
+    parts += [(float(record[c]) + 0.0).hex() for c in RAW_COLUMNS if c != 'type']
+    return hashlib.blake2b('\x1f'.join(parts).encode(), digest_size=16).hexdigest()
+
+
+class ScoreCache:
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl_seconds=DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.model_tag = None
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, proba, anomaly_score)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def bind(self, model_tag):
+        # Dipanggil sebelum lookup; tag berbeda = versi/file model berubah
+        if model_tag != self.model_tag:
+            with self._lock:
+                if model_tag != self.model_tag:
+                    if self.model_tag is not None:
+                        self.invalidations += 1
+                    self._entries.clear()
+                    self.model_tag = model_tag
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        found = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] <= now:
+                    del self._entries[key]
+                    self.expirations += 1
+                    entry = None
+                if entry is None:
+                    self.misses += 1
+                    found.append(None)
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    found.append(entry[1:])
+        return found
+
+    def put_many(self, keys, proba, anomaly_score):
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for key, p, s in zip(keys, proba, anomaly_score):
+                self._entries[key] = (expires_at, float(p), float(s))
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'backend': 'memory',
+            'entries': len(self),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+        }
+
+    def close(self):
+        pass
+
+
+class SharedScoreCache(ScoreCache):
+    # Counter hits/misses per proses; isi cache & tag model dibagi lewat file SQLite
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS scores (
+            key TEXT PRIMARY KEY,
+            tag TEXT NOT NULL,
+            proba REAL NOT NULL,
+            anomaly_score REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS scores_last_access ON scores (last_access);
+        CREATE INDEX IF NOT EXISTS scores_expires_at ON scores (expires_at);
+        CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+    '''
+
+    # Batas parameter per query SQLite
+    CHUNK = 500
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES, ttl_seconds=DEFAULT_TTL_SECONDS):
+        super().__init__(max_entries, ttl_seconds)
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        # Cache boleh hilang saat crash: tidak perlu fsync, cukup WAL agar reader tidak terblokir
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=OFF')
+        self._db.executescript(self.SCHEMA)
+        # Perkiraan jumlah entri: count(*) penuh hanya saat perkiraan melewati batas
+        # atau tiap _sync_every insert (insert worker lain tidak terlihat di sini)
+        self._sync_every = max(max_entries // 16, 1)
+        self._approx_entries = len(self)
+        self._inserts_since_sync = 0
+
+    def bind(self, model_tag):
+        if model_tag == self.model_tag:
+            return
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE name = 'model_tag'").fetchone()
+            if row is None or row[0] != model_tag:
+                # Worker pertama yang melihat versi baru membersihkan entri versi lama
+                with self._db:
+                    self._db.execute('BEGIN IMMEDIATE')
+                    self._approx_entries -= self._db.execute('DELETE FROM scores WHERE tag != ?', (model_tag,)).rowcount
+                    self._db.execute("INSERT OR REPLACE INTO meta VALUES ('model_tag', ?)", (model_tag,))
+            if self.model_tag is not None:
+                self.invalidations += 1
+            self.model_tag = model_tag
+
+    def get_many(self, keys):
+        now = time.time()
+        rows = {}
+        with self._lock:
+            for start in range(0, len(keys), self.CHUNK):
+                chunk = keys[start:start + self.CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                for key, proba, anomaly_score, expires_at in self._db.execute(
+                    f'SELECT key, proba, anomaly_score, expires_at FROM scores WHERE key IN ({placeholders})', chunk
+                ):
+                    rows[key] = (expires_at, proba, anomaly_score)
+
+            hit_keys = [key for key, entry in rows.items() if entry[0] > now]
+            expired = len(rows) - len(hit_keys)
+            if hit_keys:
+                self._db.executemany('UPDATE scores SET last_access = ? WHERE key = ?',
+                                     [(now, key) for key in hit_keys])
+
+            found = []
+            for key in keys:
+                entry = rows.get(key)
+                if entry is None or entry[0] <= now:
+                    self.misses += 1
+                    found.append(None)
+                else:
+                    self.hits += 1
+                    found.append(entry[1:])
+            self.expirations += expired
+        return found
+
+    def put_many(self, keys, proba, anomaly_score):
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            with self._db:
+                self._db.execute('BEGIN IMMEDIATE')
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?, ?)',
+                    [(k, self.model_tag, float(p), float(s), expires_at, now)
+                     for k, p, s in zip(keys, proba, anomaly_score)],
+                )
+                expired = self._db.execute('DELETE FROM scores WHERE expires_at <= ?', (now,)).rowcount
+                self.expirations += expired
+                self._approx_entries += len(keys) - expired
+                self._inserts_since_sync += len(keys)
+                if self._approx_entries > self.max_entries or self._inserts_since_sync >= self._sync_every:
+                    self._trim()
+
+    def _trim(self):
+        # Saat penuh, LRU dibuang sampai 15/16 batas agar count(*) tidak terjadi tiap insert
+        entries = len(self)
+        if entries > self.max_entries:
+            evicted = self._db.execute(
+                'DELETE FROM scores WHERE key IN '
+                '(SELECT key FROM scores ORDER BY last_access LIMIT ?)',
+                (entries - (self.max_entries - self.max_entries // 16),)
+            ).rowcount
+            self.evictions += evicted
+            entries -= evicted
+        self._approx_entries = entries
+        self._inserts_since_sync = 0
+
+    def __len__(self):
+        return self._db.execute('SELECT count(*) FROM scores').fetchone()[0]
+
+    def stats(self):
+        with self._lock:
+            stats = super().stats()
+        return {**stats, 'backend': 'sqlite', 'path': self.path}
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,352 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from jaga.compiled import FlatForest
+from jaga.metrics import METRICS
+
+# ==========================================
+# CASCADE SCORING (GERBANG MURAH -> MODEL HYBRID)
+# ==========================================
+# Fraud PaySim hanya ada di TRANSFER & CASH_OUT, tetapi tanpa cascade setiap
+# baris tetap melewati Isolation Forest + XGBoost. Mode cascade memotong baris
+# yang jelas aman sebelum model lengkap, berurutan:
+#
+#   type_gate : tipe di luar gate_types -> allow (proba 0). Hanya tipe yang
+#               punya kolom one-hot di model (features.categories) yang bisa dipakai.
+#   rules     : allow_rules atas kolom numerik mentah, mis.
+#               {"column": "amount", "op": "<=", "value": 0} -> allow (proba 0)
+#   prefilter : batas atas margin XGBoost tanpa Isolation Forest. Setiap split pada
+#               anomaly_score diganti daun bernilai maksimum subpohonnya, jadi
+#               margin_atas >= margin asli untuk anomaly_score berapa pun. Jika
+#               sigmoid(margin_atas) <= review_threshold, keputusan model lengkap
+#               pasti allow -> baris dilewati. Batas atas itu bukan probabilitas,
+#               jadi proba baris prefilter = NaN (null di API/audit/batch), keputusan allow.
+#   model     : sisanya diskor model hybrid lengkap (score_model).
+#
+# type_gate & rules memberi proba 0 (allow menurut aturan). Baris yang tidak
+# sampai ke model mendapat anomaly_score NaN dan tidak dikirim ke
+# monitor drift/cache registry; tahap keluarnya ikut di respons API & audit log
+# (field stage). Prefilter tidak pernah mengubah keputusan; type_gate & rules
+# bisa, jadi wajib dicek recall-nya atas file berlabel:
+#
+#   python -m jaga.cascade paysim.csv --model-dir models/v1_2/ [--write]
+#
+# Perintah di atas melaporkan pass-through per tahap, recall & selisih keputusan
+# cascade vs model lengkap, serta biaya keduanya. --write menyimpan
+# models/vX/cascade.json (prefilter hanya diaktifkan jika terukur lebih murah:
+# pada pohon XGBoost yang dalam, batas atasnya hampir semahal model lengkap).
+#
+# Cascade bersifat opt-in per layanan: JAGA_CASCADE=1 (server) atau
+# python -m jaga.batch ... --cascade. Konfigurasi per versi di cascade.json;
+# tanpa file dipakai default (gate = tipe fraud di dataset_stats.json jika ada,
+# jika tidak semua kategori one-hot model; tanpa rules; prefilter aktif).
+
+CASCADE_FILENAME = 'cascade.json'
+
+STAGES = ('type_gate', 'rules', 'prefilter', 'model')
+RULE_OPS = {
+    '<': np.less, '<=': np.less_equal, '==': np.equal,
+    '>=': np.greater_equal, '>': np.greater,
+}
+# Margin keamanan batas atas (log-odds): selisih pembulatan float32 / xgboost asli
+BOUND_EPSILON = 1e-4
+
+
+def _logit(p):
+    p = min(max(p, 1e-15), 1 - 1e-15)
+    return float(np.log(p / (1.0 - p)))
+
+
+def default_gate_types(features, folder_path=None):
+    # Tipe yang pernah fraud menurut statistik dataset (jaga/eda.py); None = gate
+    # tidak bisa dipakai karena ada tipe fraud tanpa kolom one-hot di model
+    if folder_path is not None:
+        from jaga.eda import load_stats
+
+        stats = load_stats(folder_path)
+        if stats is not None and stats.labeled:
+            fraud_types = [row['type'] for row in stats.type_table() if row['fraud'] > 0]
+            if not set(fraud_types) <= set(features.categories):
+                return None
+            return [t for t in features.categories if t in fraud_types]
+    return list(features.categories)
+
+
+class CascadePolicy:
+
+    def __init__(self, gate_types=None, allow_rules=(), prefilter=True):
+        self.gate_types = list(gate_types) if gate_types is not None else None
+        self.allow_rules = [dict(rule) for rule in allow_rules]
+        for rule in self.allow_rules:
+            if rule.get('op') not in RULE_OPS or 'column' not in rule or 'value' not in rule:
+                raise ValueError(f"Rule cascade tidak valid: {rule} (op: {', '.join(RULE_OPS)})")
+        self.prefilter = bool(prefilter)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('gate_types'), data.get('allow_rules', ()), data.get('prefilter', True))
+
+    @classmethod
+    def for_model(cls, folder_path, features):
+        # cascade.json di folder model; tanpa file -> default
+        path = os.path.join(folder_path, CASCADE_FILENAME)
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                return cls.from_dict(json.load(f))
+        return cls(default_gate_types(features, folder_path))
+
+    def to_dict(self):
+        return {'gate_types': self.gate_types, 'allow_rules': self.allow_rules, 'prefilter': self.prefilter}
+
+    def save(self, folder_path):
+        with open(os.path.join(folder_path, CASCADE_FILENAME), 'w') as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+
+def bound_forest(xgb_forest, anomaly_index):
+    # Salinan forest XGBoost: node split anomaly_score -> daun bernilai max subpohon
+    n_nodes = len(xgb_forest.feature)
+    node = np.arange(n_nodes)
+    children = xgb_forest.children.reshape(-1, 2)
+    internal = children[:, 0] != node
+    upper = np.where(internal, -np.inf, xgb_forest.value)
+    for _ in range(xgb_forest.max_depth + 1):
+        upper = np.where(internal, np.maximum(upper[children[:, 0]], upper[children[:, 1]]), upper)
+
+    unknown = internal & (xgb_forest.feature == anomaly_index)
+    children = children.copy()
+    children[unknown] = node[unknown, None]
+    return FlatForest(
+        xgb_forest.feature, xgb_forest.threshold, children[:, 0], children[:, 1], xgb_forest.default_left,
+        np.where(unknown, upper, xgb_forest.value), xgb_forest.roots, xgb_forest.max_depth, xgb_forest.inclusive,
+        children.ravel(),
+    )
+
+
+class Cascade:
+    # Disimpan di assets['cascade'] (attach_cascade); score_matrix memakainya otomatis
+
+    def __init__(self, assets, policy):
+        features = assets['features']
+        self.policy = policy
+        self.n_pre = features.n_preprocessed
+
+        n_num = len(features.numeric_columns)
+        if policy.gate_types is None:
+            self.gate_columns = None
+        else:
+            unknown = set(policy.gate_types) - set(features.categories)
+            if unknown:
+                raise ValueError(f"gate_types {sorted(unknown)} tidak punya kolom one-hot di model "
+                                 f"(hanya {features.categories}).")
+            self.gate_columns = [n_num + features.categories.index(t) for t in policy.gate_types]
+
+        self.rules = []
+        for rule in policy.allow_rules:
+            if rule['column'] not in features.numeric_columns:
+                raise ValueError(f"Kolom rule '{rule['column']}' bukan kolom numerik model.")
+            j = features.numeric_columns.index(rule['column'])
+            self.rules.append((j, features.center[j], features.scale[j], RULE_OPS[rule['op']], float(rule['value'])))
+
+        self.bound = None
+        if policy.prefilter:
+            compiled = assets.get('compiled')
+            if compiled is not None:
+                forest, base_margin = compiled.xgb_forest, compiled.xgb_base_margin
+            else:
+                from jaga.compiled import flatten_xgboost
+
+                forest, base_margin = flatten_xgboost(assets['xgb_model'])
+            self.bound = bound_forest(forest, self.n_pre)
+            self.bound_base_margin = base_margin
+            self.bound_limit = _logit(assets['policy'].review_threshold) - BOUND_EPSILON
+
+        self._lock = threading.Lock()
+        self.counts = np.zeros(len(STAGES), dtype=np.int64)
+
+    def stage_of(self, X):
+        # -> (indeks tahap keluar per baris, batas atas proba untuk baris prefilter)
+        n = len(X)
+        stage = np.full(n, len(STAGES) - 1, dtype=np.int8)
+        upper = np.zeros(n)
+        open_rows = np.ones(n, dtype=bool)
+        if self.gate_columns is not None:
+            gated = ~(X[:, self.gate_columns] > 0.5).any(axis=1)
+            stage[gated] = 0
+            open_rows &= ~gated
+        if self.rules:
+            allowed = np.zeros(n, dtype=bool)
+            for j, center, scale, op, value in self.rules:
+                allowed |= op(X[:, j] * scale + center, value)
+            allowed &= open_rows
+            stage[allowed] = 1
+            open_rows &= ~allowed
+        if self.bound is not None and open_rows.any():
+            rows = np.flatnonzero(open_rows)
+            margin = self.bound.leaf_sum(X[rows].astype(np.float32)) + self.bound_base_margin
+            safe = margin <= self.bound_limit
+            stage[rows[safe]] = 2
+            upper[rows[safe]] = 1.0 / (1.0 + np.exp(-margin[safe]))
+        return stage, upper
+
+    def score_matrix(self, assets, X, return_stage=False):
+        # return_stage=True menambah indeks tahap keluar per baris (STAGES).
+        # proba: 0 untuk type_gate/rules, NaN untuk prefilter (band allow tetap benar:
+        # NaN > threshold selalu False)
+        from jaga.pipeline import score_model
+
+        start = time.perf_counter()
+        stage, _ = self.stage_of(X)
+        METRICS.observe('cascade', start, len(X))
+
+        rows = np.flatnonzero(stage == len(STAGES) - 1)
+        proba = np.where(stage == STAGES.index('prefilter'), np.nan, 0.0)
+        anomaly_score = np.full(len(X), np.nan)
+        if len(rows) == len(X):
+            proba, anomaly_score = score_model(assets, X)
+        elif len(rows):
+            X_model = X[rows]
+            proba[rows], anomaly_score[rows] = score_model(assets, X_model)
+        X[:, self.n_pre] = anomaly_score
+
+        counts = np.bincount(stage, minlength=len(STAGES))
+        with self._lock:
+            self.counts += counts
+        if return_stage:
+            return proba, anomaly_score, stage
+        return proba, anomaly_score
+
+    def stats(self):
+        # Pass-through per tahap: rows_in masuk tahap, exited keluar (allow) di tahap itu
+        with self._lock:
+            counts = self.counts.copy()
+        total = int(counts.sum())
+        out = {'policy': self.policy.to_dict(), 'rows': total, 'stages': {}}
+        remaining = total
+        for name, exited in zip(STAGES, counts.tolist()):
+            out['stages'][name] = {'rows_in': remaining, 'exited': exited}
+            if name != 'model':
+                out['stages'][name]['pass_rate'] = (remaining - exited) / remaining if remaining else 1.0
+            remaining -= exited
+        out['model_rate'] = int(counts[-1]) / total if total else 0.0
+        return out
+
+
+def attach_cascade(assets, folder_path, policy=None):
+    # Mengaktifkan cascade untuk assets ini (score_matrix/score_frame/score_records)
+    policy = policy or CascadePolicy.for_model(folder_path, assets['features'])
+    assets['cascade'] = Cascade(assets, policy)
+    return assets
+
+
+# ==========================================
+# CEK RECALL & BIAYA (OFFLINE)
+# ==========================================
+def evaluate(input_path, assets, policies, label_column='isFraud', chunksize=100_000):
+    # Model lengkap vs cascade per policy atas file berlabel
+    from jaga.batch import iter_chunks
+    from jaga.pipeline import score_model
+
+    review, block = assets['policy'].review_threshold, assets['policy'].block_threshold
+    cascades = [Cascade(assets, p) for p in policies]
+    full = {'seconds': 0.0, 'review': 0, 'block': 0}
+    results = [{'seconds': 0.0, 'review': 0, 'block': 0, 'changed': 0, 'fraud_by_stage': np.zeros(len(STAGES), int)}
+               for _ in cascades]
+    rows = fraud = 0
+    for chunk in iter_chunks(input_path, chunksize):
+        label = chunk[label_column].to_numpy().astype(bool)
+        X = assets['features'].from_frame(chunk)
+        start = time.perf_counter()
+        proba, _ = score_model(assets, X.copy())
+        full['seconds'] += time.perf_counter() - start
+        full['review'] += int((label & (proba > review)).sum())
+        full['block'] += int((label & (proba > block)).sum())
+        for cascade, result in zip(cascades, results):
+            start = time.perf_counter()
+            cascade_proba, _ = cascade.score_matrix(assets, X.copy())
+            result['seconds'] += time.perf_counter() - start
+            result['review'] += int((label & (cascade_proba > review)).sum())
+            result['block'] += int((label & (cascade_proba > block)).sum())
+            result['changed'] += int((assets['policy'].band_index(cascade_proba)
+                                      != assets['policy'].band_index(proba)).sum())
+            stage, _ = cascade.stage_of(X)
+            result['fraud_by_stage'] += np.bincount(stage[label], minlength=len(STAGES))
+        rows += len(chunk)
+        fraud += int(label.sum())
+
+    for cascade, result in zip(cascades, results):
+        result['stats'] = cascade.stats()
+        result['cost_ratio'] = result['seconds'] / full['seconds'] if full['seconds'] else 0.0
+    return {'rows': rows, 'fraud': fraud, 'full': full, 'cascades': results}
+
+
+def recall_parity(report, result, tolerance=0.0):
+    # Recall review/block cascade tidak boleh turun lebih dari tolerance
+    fraud = max(report['fraud'], 1)
+    return all(
+        (report['full'][band] - result[band]) / fraud <= tolerance
+        for band in ('review', 'block')
+    )
+
+
+def print_evaluation(report, names):
+    fraud = max(report['fraud'], 1)
+    full = report['full']
+    print(f"{report['rows']:,} baris, {report['fraud']:,} fraud | model lengkap {full['seconds']:.2f} detik, "
+          f"recall review {full['review'] / fraud:.4f}, block {full['block'] / fraud:.4f}")
+    for name, result in zip(names, report['cascades']):
+        print(f"\n[{name}] biaya {result['cost_ratio']:.1%} dari model lengkap ({result['seconds']:.2f} detik), "
+              f"{result['stats']['model_rate']:.1%} baris sampai ke model")
+        print(f"  {'tahap':<10}{'masuk':>12}{'keluar':>12}{'lolos':>9}{'fraud keluar':>14}")
+        for stage, fraud_exited in zip(STAGES, result['fraud_by_stage'].tolist()):
+            s = result['stats']['stages'][stage]
+            rate = f"{s['pass_rate']:.1%}" if 'pass_rate' in s else '-'
+            print(f"  {stage:<10}{s['rows_in']:>12,}{s['exited']:>12,}{rate:>9}{fraud_exited:>14,}")
+        print(f"  recall review {result['review'] / fraud:.4f}, block {result['block'] / fraud:.4f}, "
+              f"keputusan berubah {result['changed']:,} baris")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pass-through, recall & biaya cascade atas file berlabel")
+    parser.add_argument('input', help="File berlabel (.csv/.parquet) dengan kolom isFraud")
+    parser.add_argument('--model-dir', default='models/v1_2/')
+    parser.add_argument('--label-column', default='isFraud')
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--tolerance', type=float, default=0.0,
+                        help="Penurunan recall maksimum yang masih diterima (mis. 0.001)")
+    parser.add_argument('--write', action='store_true',
+                        help=f"Simpan varian termurah yang lolos cek recall ke {CASCADE_FILENAME}")
+    args = parser.parse_args(argv)
+
+    from jaga.pipeline import load_scoring_assets
+
+    assets = load_scoring_assets(args.model_dir)
+    policy = CascadePolicy.for_model(args.model_dir, assets['features'])
+    variants = {
+        'dengan prefilter': CascadePolicy(policy.gate_types, policy.allow_rules, prefilter=True),
+        'tanpa prefilter': CascadePolicy(policy.gate_types, policy.allow_rules, prefilter=False),
+    }
+    report = evaluate(args.input, assets, list(variants.values()), args.label_column, args.chunksize)
+    print_evaluation(report, list(variants))
+
+    passing = [(result['seconds'], name) for name, result in zip(variants, report['cascades'])
+               if recall_parity(report, result, args.tolerance)]
+    if not passing:
+        print(f"\nRecall cascade turun lebih dari {args.tolerance}; periksa gate_types / allow_rules.")
+        return 1
+    _, best = min(passing)
+    print(f"\nRecall parity OK. Varian termurah: {best}.")
+    if args.write:
+        variants[best].save(args.model_dir)
+        print(f"Disimpan ke {os.path.join(args.model_dir, CASCADE_FILENAME)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
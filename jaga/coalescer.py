@@ -0,0 +1,112 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+# ==========================================
+# MICRO-BATCHING (REQUEST COALESCER)
+# ==========================================
+# Request yang datang bersamaan dikumpulkan maksimal `max_wait_ms` milidetik
+# atau `max_batch` baris, lalu preprocessor.transform, iso_forest.decision_function
+# dan xgb_model.predict_proba dijalankan SEKALI untuk seluruh tumpukan.
+# Hasil dibagi kembali (fan-out) ke masing-masing pemanggil lewat Future.
+#
+# Contoh:
+#   batcher = MicroBatcher(lambda recs: score_records(assets, recs), max_wait_ms=2, max_batch=256)
+#   proba, anomaly_score, decision = batcher.score([transaksi])
+
+DEFAULT_MAX_WAIT_MS = 2.0
+DEFAULT_MAX_BATCH = 256
+
+
+class MicroBatcher:
+
+    def __init__(self, score_fn, max_wait_ms=DEFAULT_MAX_WAIT_MS, max_batch=DEFAULT_MAX_BATCH):
+        # score_fn(records) -> tuple array sejajar dengan records
+        self.score_fn = score_fn
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch = max_batch
+
+        # Statistik sederhana untuk benchmark/monitoring
+        self.batches = 0
+        self.rows = 0
+
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='jaga-microbatcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, records):
+        if self._closed:
+            raise RuntimeError("MicroBatcher sudah ditutup.")
+        future = Future()
+        self._queue.put((records, future))
+        return future
+
+    def score(self, records, timeout=None):
+        return self.submit(records).result(timeout)
+
+    def close(self):
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self, first):
+        pending = [first]
+        n_rows = len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while n_rows < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Sinyal close: proses sisa batch lalu berhenti
+                self._queue.put(None)
+                break
+            pending.append(item)
+            n_rows += len(item[0])
+        return pending
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            pending = self._collect(first)
+
+            stacked = [r for records, _ in pending for r in records]
+            try:
+                outputs = self.score_fn(stacked)
+            except Exception as e:
+                # Satu request buruk tidak boleh menggagalkan request lain di tumpukan:
+                # ulangi per pemanggil, hanya Future yang recordnya gagal yang error
+                if len(pending) == 1:
+                    pending[0][1].set_exception(e)
+                else:
+                    self._run_each(pending)
+                continue
+
+            self.batches += 1
+            self.rows += len(stacked)
+
+            # Fan-out: potong hasil sesuai jumlah baris tiap pemanggil
+            offsets = np.cumsum([0] + [len(records) for records, _ in pending])
+            for (records, future), start, stop in zip(pending, offsets[:-1], offsets[1:]):
+                future.set_result(tuple(out[start:stop] for out in outputs))
+
+    def _run_each(self, pending):
+        for records, future in pending:
+            try:
+                outputs = self.score_fn(records)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            self.batches += 1
+            self.rows += len(records)
+            future.set_result(tuple(outputs))
@@ -0,0 +1,310 @@
+import json
+
+import numpy as np
+
+from jaga.anomaly import IsolationEngine
+from jaga.features import FastFeatures
+
+# ==========================================
+# MODEL INFERENSI TERKOMPILASI
+# ==========================================
+# Mengubah model satu folder models/vX (preprocessor + iso_forest + xgboost)
+# menjadi array pohon yang sudah diratakan (flattened) di memori. Kedua model
+# dievaluasi dengan NumPy yang sama:
+#
+#   Isolation Forest : nilai daun = depth + c(n_node_samples) - 1, dijumlah per pohon
+#   XGBoost          : nilai daun = bobot daun, dijumlah + base_margin -> sigmoid
+#
+# Saat scoring, Isolation Forest dievaluasi IsolationEngine (jaga/anomaly.py,
+# layout pohon sempurna); FlatForest tetap format simpan & fallback.
+#
+# Array (to_arrays/from_arrays) disimpan & dibuka memory-mapped oleh format
+# native (jaga/artifacts.py), satu-satunya format simpan; tanpa sklearn/xgboost:
+#   model = load_native('models/v1_2/')['compiled']
+#   proba, anomaly_score = model.predict_records(records)
+
+# Versi layout array (dicatat di manifest format native)
+FORMAT_VERSION = 1
+
+# Jumlah baris per blok evaluasi (membatasi memori matriks node n x n_trees)
+BLOCK_ROWS = 1024
+
+
+class FlatForest:
+    # Semua pohon disimpan berurutan dalam satu set array. Daun menunjuk ke
+    # dirinya sendiri (left = right = node) sehingga traversal cukup diulang
+    # max_depth kali tanpa mask.
+
+    def __init__(self, feature, threshold, left, right, default_left, value, roots, max_depth, inclusive,
+                 children=None):
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.default_left = np.asarray(default_left, dtype=bool)
+        self.value = np.asarray(value, dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.max_depth = int(max_depth)
+        # sklearn: kiri jika x <= threshold, xgboost: kiri jika x < threshold
+        self.inclusive = bool(inclusive)
+        # Anak kiri/kanan diselang-seling: anak = children[2 * node + go_right]
+        if children is None:
+            children = np.stack([self.left, self.right], axis=1).ravel()
+        self.children = np.asarray(children, dtype=np.int32)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def to_arrays(self, prefix):
+        return {
+            f'{prefix}_feature': self.feature,
+            f'{prefix}_threshold': self.threshold,
+            f'{prefix}_left': self.left,
+            f'{prefix}_right': self.right,
+            f'{prefix}_default_left': self.default_left,
+            f'{prefix}_value': self.value,
+            f'{prefix}_roots': self.roots,
+            f'{prefix}_children': self.children,
+            f'{prefix}_params': np.array([self.max_depth, int(self.inclusive)], dtype=np.int64),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix):
+        max_depth, inclusive = arrays[f'{prefix}_params']
+        return cls(
+            arrays[f'{prefix}_feature'], arrays[f'{prefix}_threshold'],
+            arrays[f'{prefix}_left'], arrays[f'{prefix}_right'],
+            arrays[f'{prefix}_default_left'], arrays[f'{prefix}_value'],
+            arrays[f'{prefix}_roots'], max_depth, inclusive,
+            arrays.get(f'{prefix}_children'),
+        )
+
+    def apply(self, X):
+        # X: float32 (n, n_features) -> indeks daun (n, n_trees)
+        X = np.ascontiguousarray(X)
+        n, n_features = X.shape
+        X_flat = X.ravel()
+        row_offset = (np.arange(n, dtype=np.int32) * n_features)[:, None]
+        has_nan = np.isnan(X_flat).any()
+
+        node = np.empty((n, self.n_trees), dtype=np.int32)
+        node[:] = self.roots
+        for _ in range(self.max_depth):
+            x = np.take(X_flat, row_offset + np.take(self.feature, node))
+            thr = np.take(self.threshold, node)
+            go_right = (x > thr) if self.inclusive else (x >= thr)
+            if has_nan:
+                go_right = np.where(np.isnan(x), ~np.take(self.default_left, node), go_right)
+            node = np.take(self.children, 2 * node + go_right)
+        return node
+
+    def leaf_sum(self, X, block_rows=BLOCK_ROWS):
+        n = X.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        for start in range(0, n, block_rows):
+            stop = min(start + block_rows, n)
+            out[start:stop] = np.take(self.value, self.apply(X[start:stop])).sum(axis=1)
+        return out
+
+
+# ==========================================
+# 1. KONVERSI DARI MODEL ASLI
+# ==========================================
+def _average_path_length(n_samples):
+    # Sama dengan sklearn.ensemble._iforest._average_path_length
+    n_samples = np.asarray(n_samples, dtype=np.float64)
+    result = np.zeros_like(n_samples)
+    result[n_samples == 2] = 1.0
+    mask = n_samples > 2
+    result[mask] = 2.0 * (np.log(n_samples[mask] - 1.0) + np.euler_gamma) - 2.0 * (n_samples[mask] - 1.0) / n_samples[mask]
+    return result
+
+
+def _concat_trees(trees, threshold_dtype, inclusive):
+    # trees: list of dict(feature, threshold, left, right, default_left, value, depth)
+    parts = {k: [] for k in ('feature', 'threshold', 'left', 'right', 'default_left', 'value')}
+    roots = []
+    offset = 0
+    max_depth = 0
+    for tree in trees:
+        n_nodes = len(tree['left'])
+        is_leaf = tree['left'] < 0
+        own = np.arange(n_nodes)
+        roots.append(offset)
+        parts['feature'].append(np.where(is_leaf, 0, tree['feature']))
+        parts['threshold'].append(np.where(is_leaf, 0, tree['threshold']))
+        parts['left'].append(np.where(is_leaf, own, tree['left']) + offset)
+        parts['right'].append(np.where(is_leaf, own, tree['right']) + offset)
+        parts['default_left'].append(tree['default_left'])
+        parts['value'].append(np.where(is_leaf, tree['value'], 0.0))
+        max_depth = max(max_depth, int(tree['depth'].max()))
+        offset += n_nodes
+
+    return FlatForest(
+        feature=np.concatenate(parts['feature']),
+        threshold=np.concatenate(parts['threshold']).astype(threshold_dtype),
+        left=np.concatenate(parts['left']),
+        right=np.concatenate(parts['right']),
+        default_left=np.concatenate(parts['default_left']),
+        value=np.concatenate(parts['value']),
+        roots=roots,
+        max_depth=max_depth,
+        inclusive=inclusive,
+    )
+
+
+def _node_depths(left, right):
+    depth = np.zeros(len(left), dtype=np.int64)
+    for node in range(len(left)):
+        if left[node] >= 0:
+            depth[left[node]] = depth[node] + 1
+            depth[right[node]] = depth[node] + 1
+    return depth
+
+
+def flatten_isolation_forest(iso_forest):
+    subsample_features = iso_forest._max_features != iso_forest.n_features_in_
+    trees = []
+    for estimator, features in zip(iso_forest.estimators_, iso_forest.estimators_features_):
+        tree = estimator.tree_
+        feature = tree.feature.astype(np.int64)
+        if subsample_features:
+            feature = np.where(feature >= 0, np.asarray(features)[np.maximum(feature, 0)], feature)
+        depth = _node_depths(tree.children_left, tree.children_right)
+        trees.append({
+            'feature': feature,
+            'threshold': tree.threshold,
+            'left': tree.children_left,
+            'right': tree.children_right,
+            'default_left': getattr(tree, 'missing_go_to_left', np.zeros(tree.node_count, dtype=bool)).astype(bool),
+            # depth di sini mulai dari 0 (sklearn: mulai 1 lalu dikurangi 1)
+            'value': depth + _average_path_length(tree.n_node_samples),
+            'depth': depth,
+        })
+    return _concat_trees(trees, np.float64, inclusive=True)
+
+
+def flatten_xgboost(xgb_model):
+    booster = xgb_model.get_booster()
+    model = json.loads(booster.save_raw(raw_format='json'))
+    learner = model['learner']
+    if learner['objective']['name'] != 'binary:logistic':
+        raise ValueError(f"Objective {learner['objective']['name']} belum didukung.")
+
+    gbtree = learner['gradient_booster']['model']
+    trees = []
+    for tree in gbtree['trees']:
+        left = np.asarray(tree['left_children'], dtype=np.int64)
+        right = np.asarray(tree['right_children'], dtype=np.int64)
+        if any(tree['split_type']):
+            raise ValueError("Split kategorikal XGBoost belum didukung.")
+        trees.append({
+            'feature': np.asarray(tree['split_indices'], dtype=np.int64),
+            'threshold': np.asarray(tree['split_conditions'], dtype=np.float32),
+            'left': left,
+            'right': right,
+            'default_left': np.asarray(tree['default_left'], dtype=bool),
+            # Untuk daun, split_conditions berisi bobot daun
+            'value': np.asarray(tree['split_conditions'], dtype=np.float64),
+            'depth': _node_depths(left, right),
+        })
+
+    base_score = float(learner['learner_model_param']['base_score'].strip('[]'))
+    base_margin = float(np.log(base_score / (1.0 - base_score)))
+    return _concat_trees(trees, np.float32, inclusive=False), base_margin
+
+
+# ==========================================
+# 2. MODEL TERKOMPILASI
+# ==========================================
+class CompiledModel:
+
+    def __init__(self, features, iso_forest, iso_offset, iso_denominator, xgb_forest, xgb_base_margin, metadata):
+        self.features = features
+        self.iso_forest = iso_forest
+        self.iso_offset = float(iso_offset)
+        self.iso_denominator = float(iso_denominator)
+        self.xgb_forest = xgb_forest
+        self.xgb_base_margin = float(xgb_base_margin)
+        self.metadata = metadata
+        # Engine pohon sempurna (jaga/anomaly.py); None jika pohon terlalu dalam
+        try:
+            self.iso_engine = IsolationEngine.from_forest(iso_forest, iso_offset, iso_denominator)
+        except ValueError:
+            self.iso_engine = None
+
+    @classmethod
+    def from_assets(cls, assets):
+        iso = assets['iso_forest']
+        xgb_forest, base_margin = flatten_xgboost(assets['xgb_model'])
+        return cls(
+            features=assets['features'],
+            iso_forest=flatten_isolation_forest(iso),
+            iso_offset=iso.offset_,
+            iso_denominator=len(iso.estimators_) * _average_path_length([iso.max_samples_])[0],
+            xgb_forest=xgb_forest,
+            xgb_base_margin=base_margin,
+            metadata=assets['metrics'],
+        )
+
+    def to_arrays(self):
+        f = self.features
+        arrays = {
+            'numeric_columns': np.array(f.numeric_columns),
+            'categories': np.array(f.categories),
+            'center': f.center,
+            'scale': f.scale,
+            'scalars': np.array([self.iso_offset, self.iso_denominator, self.xgb_base_margin]),
+        }
+        arrays.update(self.iso_forest.to_arrays('iso'))
+        arrays.update(self.xgb_forest.to_arrays('xgb'))
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, metadata):
+        features = FastFeatures(
+            [str(c) for c in arrays['numeric_columns']], arrays['center'], arrays['scale'],
+            [str(c) for c in arrays['categories']], metadata.get('feature_names'),
+        )
+        iso_offset, iso_denominator, xgb_base_margin = arrays['scalars']
+        return cls(
+            features=features,
+            iso_forest=FlatForest.from_arrays(arrays, 'iso'),
+            iso_offset=iso_offset,
+            iso_denominator=iso_denominator,
+            xgb_forest=FlatForest.from_arrays(arrays, 'xgb'),
+            xgb_base_margin=xgb_base_margin,
+            metadata=metadata,
+        )
+
+    def anomaly_score(self, X_preped):
+        # Setara iso_forest.decision_function (sklearn memakai float32)
+        if self.iso_engine is not None:
+            return self.iso_engine.score(np.asarray(X_preped, dtype=np.float32))
+        path_sum = self.iso_forest.leaf_sum(np.asarray(X_preped, dtype=np.float32))
+        return -(2.0 ** (-path_sum / self.iso_denominator)) - self.iso_offset
+
+    def xgb_proba(self, X32):
+        # Setara xgb_model.predict_proba(X)[:, 1] untuk matriks float32 lengkap
+        margin = self.xgb_forest.leaf_sum(X32) + self.xgb_base_margin
+        return 1.0 / (1.0 + np.exp(-margin))
+
+    def predict_matrix(self, X):
+        # X: matriks FastFeatures (n, 12); kolom anomaly_score diisi di tempat
+        n_pre = self.features.n_preprocessed
+        X32 = X.astype(np.float32)
+        anomaly_score = self.anomaly_score(X32[:, :n_pre])
+        X[:, n_pre] = anomaly_score
+        X32[:, n_pre] = anomaly_score
+        return self.xgb_proba(X32), anomaly_score
+
+    def predict(self, raw, types):
+        return self.predict_matrix(self.features.transform(raw, types))
+
+    def predict_records(self, records):
+        return self.predict_matrix(self.features.from_records(records))
+
+    def predict_frame(self, df):
+        return self.predict_matrix(self.features.from_frame(df))
+
@@ -0,0 +1,569 @@
+import argparse
+import json
+import math
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from jaga.features import ANOMALY_FEATURE
+
+# ==========================================
+# MONITOR DRIFT & KUALITAS DATA
+# ==========================================
+# Membandingkan trafik yang sedang diskor dengan baseline data training per
+# versi model (models/vX/drift_baseline.json):
+#
+#   - sketch kuantil per kolom numerik, anomaly_score & fraud_probability
+#     (bucket logaritmik ala DDSketch: error relatif 1%, jumlah bucket tetap)
+#   - komposisi tipe (CASH_OUT / TRANSFER / lainnya, sesuai one-hot model)
+#   - rate kualitas data (errorBalanceOrig != 0, saldo pengirim 0, nilai negatif/NaN)
+#   - PSI per kolom: bin = kuantil baseline (PSI_BINS), dihitung dari bucket sketch
+#
+# Memori konstan (jumlah kolom x jumlah bucket) dan update per baris O(1).
+# DriftMonitor memproses matriks fitur di thread sendiri lewat antrean terbatas.
+# Thread scoring hanya menambah referensi batch ke buffer; setiap BUFFER_ROWS
+# baris buffer dikirim dengan put_nowait (dilewati & dicatat jika antrean penuh),
+# sehingga sketch di-update sekali per ~1000 baris, bukan per request.
+# Setiap `interval` detik (minimal MIN_REPORT_ROWS baris) dibuat laporan untuk
+# window tersebut; kolom dengan PSI >= PSI_ALERT atau rate yang bergeser lebih
+# dari RATE_TOLERANCE menjadi alert.
+#
+# Baseline dari data training berlabel (atau sampel trafik yang dianggap normal):
+#   python -m jaga.drift paysim.csv --model-dir models/v1_2/ --write
+# Laporan drift file lain terhadap baseline tersimpan:
+#   python -m jaga.drift transaksi_baru.csv --model-dir models/v1_2/
+
+BASELINE_FILENAME = 'drift_baseline.json'
+FORMAT_VERSION = 1
+
+RELATIVE_ACCURACY = 0.01
+MIN_VALUE = 1e-6
+MAX_VALUE = 1e13
+
+PSI_BINS = 20
+PSI_WARN = 0.1
+PSI_ALERT = 0.25
+# Smoothing proporsi bin kosong agar PSI tetap terhingga
+PSI_EPSILON = 1e-4
+RATE_TOLERANCE = 0.05
+
+MIN_REPORT_ROWS = 500
+DEFAULT_INTERVAL = 60.0
+DEFAULT_MAX_PENDING = 64
+BUFFER_ROWS = 1024
+QUANTILES = (0.5, 0.95, 0.99)
+
+PROBABILITY_COLUMN = 'fraud_probability'
+OTHER_TYPE = 'lainnya'
+QUALITY_FLAGS = (
+    'error_balance_orig_nonzero', 'error_balance_dest_nonzero',
+    'zero_balance_orig', 'negative_values', 'missing_values',
+)
+NON_NEGATIVE_COLUMNS = ('amount', 'oldbalanceOrg', 'newbalanceOrig', 'oldbalanceDest', 'newbalanceDest')
+
+
+# ==========================================
+# 1. SKETCH KUANTIL
+# ==========================================
+class QuantileSketches:
+    # Satu sketch per kolom dalam satu array (n_columns, n_buckets). Indeks bucket
+    # naik seiring nilai: [negatif besar ... -MIN_VALUE, nol, MIN_VALUE ... MAX_VALUE]
+
+    def __init__(self, n_columns, relative_accuracy=RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.n_log = int(math.ceil(math.log(MAX_VALUE / MIN_VALUE) / self._log_gamma)) + 1
+        self.center = self.n_log
+        self.n_buckets = 2 * self.n_log + 1
+        self.counts = np.zeros((n_columns, self.n_buckets), dtype=np.int64)
+        self.missing = np.zeros(n_columns, dtype=np.int64)
+
+    def bucket_index(self, values):
+        # values: (n, n_columns) float -> indeks bucket int64 (NaN -> -1)
+        magnitude = np.abs(values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k = np.ceil(np.log(magnitude / MIN_VALUE) / self._log_gamma)
+        k = np.clip(np.nan_to_num(k, nan=0.0), 0, self.n_log - 1).astype(np.int64)
+        sign = np.sign(np.nan_to_num(values)).astype(np.int64)
+        index = np.where(magnitude < MIN_VALUE, self.center, self.center + sign * (k + 1))
+        return np.where(np.isnan(values), -1, index)
+
+    def update(self, values):
+        index = self.bucket_index(values)
+        valid = index >= 0
+        self.missing += (~valid).sum(axis=0)
+        flat = (index + np.arange(self.counts.shape[0]) * self.n_buckets)[valid]
+        counts = self.counts.reshape(-1)
+        if len(flat) < 4096:
+            # Batch kecil (request online): tanpa alokasi array sebesar seluruh bucket
+            np.add.at(counts, flat, 1)
+        else:
+            counts += np.bincount(flat, minlength=counts.size)
+
+    def merge(self, other):
+        self.counts += other.counts
+        self.missing += other.missing
+
+    def bucket_value(self, index):
+        # Nilai representatif bucket (titik tengah relatif)
+        index = np.asarray(index)
+        k = np.abs(index - self.center) - 1
+        value = MIN_VALUE * self.gamma ** k * 2 / (1 + self.gamma)
+        return np.where(index == self.center, 0.0, np.sign(index - self.center) * value)
+
+    def quantiles(self, qs=QUANTILES):
+        # -> (n_columns, len(qs)); NaN untuk kolom tanpa data
+        cumulative = np.cumsum(self.counts, axis=1)
+        total = cumulative[:, -1]
+        out = np.full((len(total), len(qs)), np.nan)
+        for c in np.flatnonzero(total):
+            index = np.searchsorted(cumulative[c], np.asarray(qs) * total[c], side='left')
+            out[c] = self.bucket_value(np.minimum(index, self.n_buckets - 1))
+        return out
+
+
+# ==========================================
+# 2. AKUMULATOR (BASELINE & WINDOW)
+# ==========================================
+def monitored_columns(features):
+    return list(features.numeric_columns) + [ANOMALY_FEATURE, PROBABILITY_COLUMN]
+
+
+def psi(expected, actual):
+    expected = np.asarray(expected, dtype=np.float64)
+    actual = np.asarray(actual, dtype=np.float64)
+    if expected.sum() == 0 or actual.sum() == 0:
+        return None
+    e = np.maximum(expected / expected.sum(), PSI_EPSILON)
+    a = np.maximum(actual / actual.sum(), PSI_EPSILON)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+class DriftStats:
+    # Bisa di-merge: baseline = DriftStats atas data training, window = trafik terbaru
+
+    def __init__(self, columns, type_categories):
+        self.columns = list(columns)
+        self.type_categories = list(type_categories)
+        self.sketches = QuantileSketches(len(self.columns))
+        self.type_counts = np.zeros(len(self.type_categories), dtype=np.int64)
+        self.flags = np.zeros(len(QUALITY_FLAGS), dtype=np.int64)
+        self.rows = 0
+
+    @classmethod
+    def for_features(cls, features):
+        return cls(monitored_columns(features), list(features.categories) + [OTHER_TYPE])
+
+    def empty_like(self):
+        return DriftStats(self.columns, self.type_categories)
+
+    def update(self, features, X, proba):
+        # X: matriks FastFeatures (anomaly_score sudah terisi), proba: (n,)
+        n = len(X)
+        if n == 0:
+            return
+        n_num = len(features.numeric_columns)
+        n_cat = len(features.categories)
+        values = np.empty((n, len(self.columns)))
+        # Kembali ke satuan asli (kebalikan RobustScaler) agar kuantil mudah dibaca
+        np.multiply(X[:, :n_num], features.scale, out=values[:, :n_num])
+        values[:, :n_num] += features.center
+        values[:, n_num] = X[:, features.n_preprocessed]
+        values[:, n_num + 1] = proba
+        self.sketches.update(values)
+
+        onehot = X[:, n_num:n_num + n_cat] > 0.5
+        type_index = np.where(onehot.any(axis=1), onehot.argmax(axis=1), n_cat)
+        self.type_counts += np.bincount(type_index, minlength=n_cat + 1)
+
+        column = {name: values[:, j] for j, name in enumerate(self.columns)}
+        non_negative = [column[c] for c in NON_NEGATIVE_COLUMNS if c in column]
+        with np.errstate(invalid='ignore'):
+            self.flags += [
+                int((np.abs(column['errorBalanceOrig']) > 0.01).sum()),
+                int((np.abs(column['errorBalanceDest']) > 0.01).sum()),
+                int((np.abs(column['oldbalanceOrg']) <= 0.01).sum()),
+                int((np.stack(non_negative, axis=1) < 0).any(axis=1).sum()),
+                # Hanya kolom input: anomaly_score NaN = baris dilewati cascade (jaga/cascade.py)
+                int(np.isnan(values[:, :n_num]).any(axis=1).sum()),
+            ]
+        self.rows += n
+
+    def merge(self, other):
+        self.sketches.merge(other.sketches)
+        self.type_counts += other.type_counts
+        self.flags += other.flags
+        self.rows += other.rows
+
+    def rates(self):
+        return {flag: float(count) / max(self.rows, 1) for flag, count in zip(QUALITY_FLAGS, self.flags)}
+
+    def type_mix(self):
+        total = max(int(self.type_counts.sum()), 1)
+        return {t: int(c) / total for t, c in zip(self.type_categories, self.type_counts)}
+
+    def psi_bins(self):
+        # Per kolom: bucket -> bin PSI (batas di kuantil 1/PSI_BINS ... dari data ini)
+        cumulative = np.cumsum(self.sketches.counts, axis=1)
+        bins = []
+        for c in range(len(self.columns)):
+            total = cumulative[c, -1]
+            if total == 0:
+                bins.append(None)
+                continue
+            cuts = np.unique(np.searchsorted(cumulative[c], np.arange(1, PSI_BINS) / PSI_BINS * total))
+            bins.append(np.searchsorted(cuts, np.arange(self.sketches.n_buckets), side='left'))
+        return bins
+
+    def to_dict(self):
+        # Bucket disimpan sparse: {kolom: [[indeks, jumlah], ...]}
+        counts = self.sketches.counts
+        return {
+            'columns': self.columns,
+            'type_categories': self.type_categories,
+            'relative_accuracy': self.sketches.relative_accuracy,
+            'rows': self.rows,
+            'buckets': {c: np.stack([np.flatnonzero(counts[j]), counts[j][counts[j] > 0]], axis=1).tolist()
+                        for j, c in enumerate(self.columns)},
+            'missing': self.sketches.missing.tolist(),
+            'type_counts': self.type_counts.tolist(),
+            'flags': dict(zip(QUALITY_FLAGS, self.flags.tolist())),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data['columns'], data['type_categories'])
+        if data['relative_accuracy'] != stats.sketches.relative_accuracy:
+            raise ValueError(f"Baseline memakai relative_accuracy {data['relative_accuracy']}, "
+                             f"harus {stats.sketches.relative_accuracy}.")
+        for j, c in enumerate(stats.columns):
+            pairs = np.asarray(data['buckets'][c], dtype=np.int64).reshape(-1, 2)
+            stats.sketches.counts[j, pairs[:, 0]] = pairs[:, 1]
+        stats.sketches.missing[:] = data['missing']
+        stats.type_counts[:] = data['type_counts']
+        stats.flags[:] = [data['flags'][f] for f in QUALITY_FLAGS]
+        stats.rows = data['rows']
+        return stats
+
+
+def save_baseline(stats, folder_path, source=None):
+    path = os.path.join(folder_path, BASELINE_FILENAME)
+    with open(path, 'w') as f:
+        json.dump({'format_version': FORMAT_VERSION, 'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'source': source, **stats.to_dict()}, f)
+    return path
+
+
+def load_baseline(folder_path):
+    # None jika versi model belum punya baseline
+    path = os.path.join(folder_path, BASELINE_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if data.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Format baseline drift v{data.get('format_version')} tidak didukung.")
+    return DriftStats.from_dict(data)
+
+
+# ==========================================
+# 3. LAPORAN
+# ==========================================
+def _status(value, warn, alert):
+    if value is None:
+        return 'unknown'
+    return 'alert' if value >= alert else 'warn' if value >= warn else 'ok'
+
+
+def drift_report(current, baseline=None, baseline_bins=None):
+    q_names = [f'p{round(q * 100)}' for q in QUANTILES]
+    current_q = current.sketches.quantiles()
+    report = {'rows': current.rows, 'has_baseline': baseline is not None, 'columns': {}, 'alerts': []}
+    if baseline is not None:
+        baseline_q = baseline.sketches.quantiles()
+        if baseline_bins is None:
+            baseline_bins = baseline.psi_bins()
+
+    for j, column in enumerate(current.columns):
+        entry = {'quantiles': dict(zip(q_names, current_q[j].tolist())), 'missing': int(current.sketches.missing[j])}
+        if baseline is not None and baseline_bins[j] is not None:
+            bins = baseline_bins[j]
+            n_bins = int(bins.max()) + 1
+            entry['psi'] = psi(np.bincount(bins, weights=baseline.sketches.counts[j], minlength=n_bins),
+                               np.bincount(bins, weights=current.sketches.counts[j], minlength=n_bins))
+            entry['baseline_quantiles'] = dict(zip(q_names, baseline_q[j].tolist()))
+            entry['status'] = _status(entry['psi'], PSI_WARN, PSI_ALERT)
+            if entry['status'] == 'alert':
+                report['alerts'].append({'kind': 'psi', 'name': column, 'value': entry['psi']})
+        report['columns'][column] = entry
+
+    report['type_mix'] = {'current': current.type_mix()}
+    if baseline is not None:
+        value = psi(baseline.type_counts, current.type_counts)
+        report['type_mix'].update({'baseline': baseline.type_mix(), 'psi': value,
+                                   'status': _status(value, PSI_WARN, PSI_ALERT)})
+        if report['type_mix']['status'] == 'alert':
+            report['alerts'].append({'kind': 'psi', 'name': 'type', 'value': value})
+
+    report['quality'] = {}
+    baseline_rates = baseline.rates() if baseline is not None else {}
+    for flag, rate in current.rates().items():
+        entry = {'rate': rate}
+        if flag in baseline_rates:
+            entry['baseline_rate'] = baseline_rates[flag]
+            entry['status'] = 'alert' if abs(rate - baseline_rates[flag]) > RATE_TOLERANCE else 'ok'
+            if entry['status'] == 'alert':
+                report['alerts'].append({'kind': 'rate', 'name': flag, 'value': rate,
+                                         'baseline': baseline_rates[flag]})
+        report['quality'][flag] = entry
+    return report
+
+
+# ==========================================
+# 4. MONITOR ONLINE
+# ==========================================
+class DriftMonitor:
+
+    def __init__(self, interval=DEFAULT_INTERVAL, min_rows=MIN_REPORT_ROWS,
+                 max_pending=DEFAULT_MAX_PENDING, on_alert=None):
+        self.interval = interval
+        self.min_rows = min_rows
+        self.on_alert = on_alert
+
+        self.version = None
+        self._features = None
+        self._baseline = None
+        self._baseline_bins = None
+        self._window = None
+        self._total = None
+        self._window_started = time.time()
+
+        self._lock = threading.Lock()
+        self._buffer_lock = threading.Lock()
+        self._buffer = []
+        self._buffer_rows = 0
+        self._queue = queue.Queue(max_pending)
+        self.dropped_batches = 0
+        self.reports = 0
+        self.alerts_total = 0
+        self.last_report = None
+        self.alerts = deque(maxlen=100)
+
+        self._thread = threading.Thread(target=self._run, name='jaga-drift', daemon=True)
+        self._thread.start()
+
+    def bind(self, version, features, baseline=None):
+        # Versi model berganti: buffer & antrean diproses dulu, lalu akumulator diganti
+        self._send_buffer()
+        self._queue.put(('bind', version, features, baseline))
+
+    def submit(self, X, proba):
+        # Dipanggil di thread scoring; tidak pernah menunggu
+        with self._buffer_lock:
+            self._buffer.append((X, proba))
+            self._buffer_rows += len(X)
+            if self._buffer_rows < BUFFER_ROWS:
+                return
+            batches, self._buffer, self._buffer_rows = self._buffer, [], 0
+        try:
+            self._queue.put_nowait(('rows', batches))
+        except queue.Full:
+            self.dropped_batches += 1
+
+    def _send_buffer(self, block=True):
+        with self._buffer_lock:
+            batches, self._buffer, self._buffer_rows = self._buffer, [], 0
+        if batches:
+            self._queue.put(('rows', batches), block=block)
+
+    def flush(self):
+        self._send_buffer()
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            timeout = max(self._window_started + self.interval - time.time(), 0.01)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is not None and item[0] == 'stop':
+                self._queue.task_done()
+                return
+            try:
+                if item is not None:
+                    self._handle(item)
+                if time.time() >= self._window_started + self.interval:
+                    # Sisa buffer ikut masuk window ini
+                    with self._buffer_lock:
+                        batches, self._buffer, self._buffer_rows = self._buffer, [], 0
+                    if batches:
+                        self._handle(('rows', batches))
+                    self.report()
+            except Exception as e:
+                print(f"jaga.drift: {e}", file=sys.stderr)
+            finally:
+                if item is not None:
+                    self._queue.task_done()
+
+    def _handle(self, item):
+        with self._lock:
+            if item[0] == 'bind':
+                _, self.version, self._features, self._baseline = item
+                self._baseline_bins = self._baseline.psi_bins() if self._baseline is not None else None
+                self._window = DriftStats.for_features(self._features)
+                self._total = self._window.empty_like()
+                self._window_started = time.time()
+            elif self._window is not None:
+                batches = item[1]
+                X = np.concatenate([b[0] for b in batches]) if len(batches) > 1 else batches[0][0]
+                proba = np.concatenate([b[1] for b in batches]) if len(batches) > 1 else batches[0][1]
+                self._window.update(self._features, X, proba)
+
+    def report(self, force=False):
+        # Laporan window berjalan; window dibiarkan terisi jika barisnya belum cukup
+        with self._lock:
+            window = self._window
+            if window is None or window.rows == 0 or (window.rows < self.min_rows and not force):
+                self._window_started = time.time()
+                return None
+            report = drift_report(window, self._baseline, self._baseline_bins)
+            report.update({
+                'version': self.version,
+                'window_start': self._window_started,
+                'window_end': time.time(),
+            })
+            self._total.merge(window)
+            self._window = window.empty_like()
+            self._window_started = time.time()
+            self.reports += 1
+            self.last_report = report
+            self.alerts_total += len(report['alerts'])
+            for alert in report['alerts']:
+                self.alerts.append({**alert, 'time': report['window_end'], 'version': self.version})
+
+        if report['alerts'] and self.on_alert is not None:
+            self.on_alert(report)
+        return report
+
+    def status(self, include_report=True):
+        with self._lock:
+            status = {
+                'version': self.version,
+                'has_baseline': self._baseline is not None,
+                'interval_seconds': self.interval,
+                'rows_total': (self._total.rows if self._total else 0) + (self._window.rows if self._window else 0),
+                'rows_window': self._window.rows if self._window else 0,
+                'buffered_rows': self._buffer_rows,
+                'pending_batches': self._queue.qsize(),
+                'dropped_batches': self.dropped_batches,
+                'reports': self.reports,
+                'alerts': list(self.alerts),
+            }
+            if include_report:
+                status['last_report'] = self.last_report
+            return status
+
+    def to_prometheus(self, prefix='jaga'):
+        report = self.last_report or {}
+        lines = [
+            f'# HELP {prefix}_drift_psi PSI per kolom pada laporan drift terakhir.',
+            f'# TYPE {prefix}_drift_psi gauge',
+        ]
+        for column, entry in report.get('columns', {}).items():
+            if entry.get('psi') is not None:
+                lines.append(f'{prefix}_drift_psi{{column="{column}"}} {entry["psi"]:.6g}')
+        if report.get('type_mix', {}).get('psi') is not None:
+            lines.append(f'{prefix}_drift_psi{{column="type"}} {report["type_mix"]["psi"]:.6g}')
+        lines += [
+            f'# HELP {prefix}_drift_quality_rate Rate kualitas data pada laporan drift terakhir.',
+            f'# TYPE {prefix}_drift_quality_rate gauge',
+        ]
+        lines += [f'{prefix}_drift_quality_rate{{flag="{flag}"}} {entry["rate"]:.6g}'
+                  for flag, entry in report.get('quality', {}).items()]
+        lines += [
+            f'# HELP {prefix}_drift_alerts_total Jumlah alert drift sejak start.',
+            f'# TYPE {prefix}_drift_alerts_total counter',
+            f'{prefix}_drift_alerts_total {self.alerts_total}',
+            f'# HELP {prefix}_drift_dropped_batches_total Batch yang tidak dimonitor karena antrean penuh.',
+            f'# TYPE {prefix}_drift_dropped_batches_total counter',
+            f'{prefix}_drift_dropped_batches_total {self.dropped_batches}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+    def close(self):
+        self._queue.put(('stop',))
+        self._thread.join()
+
+
+# ==========================================
+# 5. CLI: BUAT BASELINE / LAPORAN FILE
+# ==========================================
+def collect(input_path, assets, chunksize=100_000):
+    from jaga.batch import iter_chunks
+    from jaga.pipeline import score_matrix
+
+    stats = DriftStats.for_features(assets['features'])
+    for chunk in iter_chunks(input_path, chunksize):
+        X = assets['features'].from_frame(chunk)
+        proba, _ = score_matrix(assets, X)
+        stats.update(assets['features'], X, proba)
+    return stats
+
+
+def print_report(report):
+    print(f"{'kolom':<20}{'PSI':>8}{'status':>8}{'p50':>14}{'p50 base':>14}{'p99':>14}{'p99 base':>14}")
+    for column, e in report['columns'].items():
+        base = e.get('baseline_quantiles', {})
+        psi_text = f"{e['psi']:.3f}" if e.get('psi') is not None else '-'
+        print(f"{column:<20}{psi_text:>8}{e.get('status', '-'):>8}{e['quantiles']['p50']:>14,.4g}"
+              f"{base.get('p50', float('nan')):>14,.4g}{e['quantiles']['p99']:>14,.4g}"
+              f"{base.get('p99', float('nan')):>14,.4g}")
+    mix = report['type_mix']
+    print("\nKomposisi tipe: " + ", ".join(
+        f"{t} {r:.1%}" + (f" (base {mix['baseline'][t]:.1%})" if 'baseline' in mix else '')
+        for t, r in mix['current'].items()
+    ) + (f" | PSI {mix['psi']:.3f}" if mix.get('psi') is not None else ''))
+    print("Kualitas data : " + ", ".join(
+        f"{flag} {e['rate']:.2%}" + (f" (base {e['baseline_rate']:.2%})" if 'baseline_rate' in e else '')
+        for flag, e in report['quality'].items()
+    ))
+    print(f"\n{len(report['alerts'])} alert" + ''.join(
+        f"\n  - {a['kind']} {a['name']}: {a['value']:.4g}" for a in report['alerts']
+    ))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Baseline & laporan drift data input model")
+    parser.add_argument('input', help="File transaksi (.csv/.parquet)")
+    parser.add_argument('--model-dir', default='models/v1_2/')
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--write', action='store_true',
+                        help="Simpan statistik file ini sebagai baseline drift_baseline.json versi model")
+    args = parser.parse_args(argv)
+
+    from jaga.pipeline import load_scoring_assets
+
+    assets = load_scoring_assets(args.model_dir)
+    stats = collect(args.input, assets, args.chunksize)
+    if args.write:
+        path = save_baseline(stats, args.model_dir, source=os.path.basename(args.input))
+        print(f"Baseline {stats.rows:,} baris disimpan ke {path}")
+        return 0
+
+    baseline = load_baseline(args.model_dir)
+    if baseline is None:
+        print(f"Peringatan: {args.model_dir} belum punya {BASELINE_FILENAME}; hanya statistik file ini.\n")
+    report = drift_report(stats, baseline)
+    print_report(report)
+    return 1 if report['alerts'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,384 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from jaga.drift import QuantileSketches
+
+# ==========================================
+# STATISTIK EDA DATASET (OFFLINE)
+# ==========================================
+# Halaman "Tentang Dataset" membaca ringkasan ini dari models/vX/dataset_stats.json,
+# bukan dari angka yang ditulis tangan. Ringkasan dibuat dengan membaca file
+# transaksi per chunk (memori konstan, ukuran file bebas):
+#
+#   python -m jaga.eda paysim.csv --model-dir models/v1_2/
+#   python -m jaga.eda bagian1.parquet bagian2.parquet --model-dir models/v1_2/
+#
+# Semua agregat bisa di-merge (jumlah per tipe/jam, momen Chan/Welford,
+# sketch kuantil dari jaga/drift.py): statistik beberapa file / chunk digabung
+# tanpa membaca ulang datanya, dan hasilnya sama dengan satu kali baca penuh.
+#
+#   - distribusi tipe & jumlah fraud per tipe
+#   - histogram per jam (hour = step % 24) total & fraud, rentang step
+#   - selisih saldo (errorBalanceOrig/Dest) per kelas: mean, std, min, max,
+#     proporsi tidak nol; proporsi saldo pengirim habis (newbalanceOrig == 0)
+#   - kuantil nominal transaksi per kelas
+#
+# isFraud boleh tidak ada (file trafik tanpa label): baris dihitung sebagai
+# kelas normal dan labeled_rows tidak bertambah.
+
+STATS_FILENAME = 'dataset_stats.json'
+FORMAT_VERSION = 1
+
+CLASSES = ('normal', 'fraud')
+BALANCE_COLUMNS = ('errorBalanceOrig', 'errorBalanceDest')
+# Toleransi pembulatan saldo (sama dengan flag kualitas di jaga/drift.py)
+BALANCE_TOLERANCE = 0.01
+AMOUNT_QUANTILES = (0.5, 0.9, 0.99)
+HOURS = 24
+
+
+class Moments:
+    # count / mean / M2 per sel (rumus gabungan Chan) + min, max, jumlah tidak nol
+
+    def __init__(self, shape):
+        self.count = np.zeros(shape, dtype=np.int64)
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+        self.min = np.full(shape, np.inf)
+        self.max = np.full(shape, -np.inf)
+        self.nonzero = np.zeros(shape, dtype=np.int64)
+
+    def _combine(self, count, mean, m2):
+        total = self.count + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean
+            weight = np.where(total > 0, count / np.maximum(total, 1), 0.0)
+            self.mean = self.mean + delta * weight
+            self.m2 = self.m2 + m2 + delta ** 2 * self.count * weight
+        self.count = total
+
+    def update(self, index, values):
+        # index: sel tujuan tiap nilai (n,), values: (n,) tanpa NaN
+        size = self.count.size
+        count = np.bincount(index, minlength=size)
+        sums = np.bincount(index, weights=values, minlength=size)
+        mean = np.divide(sums, count, out=np.zeros(size), where=count > 0)
+        m2 = np.bincount(index, weights=(values - mean[index]) ** 2, minlength=size)
+        self._combine(count, mean, m2)
+        np.minimum.at(self.min, index, values)
+        np.maximum.at(self.max, index, values)
+        self.nonzero += np.bincount(index, weights=np.abs(values) > BALANCE_TOLERANCE, minlength=size).astype(np.int64)
+
+    def merge(self, other):
+        self._combine(other.count, other.mean, other.m2)
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.nonzero += other.nonzero
+
+    def std(self):
+        return np.sqrt(np.divide(self.m2, self.count, out=np.zeros_like(self.m2), where=self.count > 0))
+
+    def to_dict(self):
+        finite = self.count > 0
+        return {
+            'count': self.count.tolist(),
+            'mean': self.mean.tolist(),
+            'm2': self.m2.tolist(),
+            'min': np.where(finite, self.min, 0.0).tolist(),
+            'max': np.where(finite, self.max, 0.0).tolist(),
+            'nonzero': self.nonzero.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        moments = cls(len(data['count']))
+        moments.count[:] = data['count']
+        moments.mean[:] = data['mean']
+        moments.m2[:] = data['m2']
+        finite = moments.count > 0
+        moments.min[finite] = np.asarray(data['min'])[finite]
+        moments.max[finite] = np.asarray(data['max'])[finite]
+        moments.nonzero[:] = data['nonzero']
+        return moments
+
+
+class DatasetStats:
+
+    def __init__(self, types=()):
+        self.types = list(types)
+        self.type_counts = np.zeros((len(self.types), len(CLASSES)), dtype=np.int64)
+        self.hour_counts = np.zeros((HOURS, len(CLASSES)), dtype=np.int64)
+        # Sel momen: (kolom selisih saldo, kelas), diratakan -> indeks kolom * 2 + kelas
+        self.balance = Moments(len(BALANCE_COLUMNS) * len(CLASSES))
+        self.drained = np.zeros(len(CLASSES), dtype=np.int64)
+        self.amount = QuantileSketches(len(CLASSES))
+        self.step_min = None
+        self.step_max = None
+        self.rows = 0
+        self.labeled_rows = 0
+        self.sources = []
+
+    # ------------------------------------------
+    # Update & merge
+    # ------------------------------------------
+    def _type_index(self, names):
+        for name in names:
+            if name not in self.types:
+                self.types.append(name)
+        missing = len(self.types) - len(self.type_counts)
+        if missing:
+            self.type_counts = np.vstack([self.type_counts, np.zeros((missing, len(CLASSES)), dtype=np.int64)])
+        lookup = {name: i for i, name in enumerate(self.types)}
+        return lookup
+
+    def update(self, chunk):
+        # chunk: DataFrame transaksi mentah (RAW_COLUMNS, isFraud opsional)
+        n = len(chunk)
+        if n == 0:
+            return
+        if 'isFraud' in chunk:
+            label = chunk['isFraud'].to_numpy(dtype=np.int64, na_value=0).clip(0, 1)
+            self.labeled_rows += n
+        else:
+            label = np.zeros(n, dtype=np.int64)
+
+        codes, names = chunk['type'].astype(str).factorize()
+        lookup = self._type_index(names)
+        type_index = np.asarray([lookup[name] for name in names], dtype=np.int64)[codes]
+        self.type_counts += np.bincount(type_index * len(CLASSES) + label,
+                                        minlength=self.type_counts.size).reshape(self.type_counts.shape)
+
+        step = chunk['step'].to_numpy(dtype=np.int64)
+        self.hour_counts += np.bincount((step % HOURS) * len(CLASSES) + label,
+                                        minlength=self.hour_counts.size).reshape(self.hour_counts.shape)
+        self.step_min = int(step.min()) if self.step_min is None else min(self.step_min, int(step.min()))
+        self.step_max = int(step.max()) if self.step_max is None else max(self.step_max, int(step.max()))
+
+        amount = chunk['amount'].to_numpy(dtype=np.float64)
+        old_org = chunk['oldbalanceOrg'].to_numpy(dtype=np.float64)
+        new_org = chunk['newbalanceOrig'].to_numpy(dtype=np.float64)
+        old_dest = chunk['oldbalanceDest'].to_numpy(dtype=np.float64)
+        new_dest = chunk['newbalanceDest'].to_numpy(dtype=np.float64)
+        # Rumus sama dengan add_features (jaga/pipeline.py)
+        for j, error in enumerate((new_org + amount - old_org, old_dest + amount - new_dest)):
+            valid = ~np.isnan(error)
+            self.balance.update((j * len(CLASSES) + label)[valid], error[valid])
+        self.drained += np.bincount(label, weights=np.abs(new_org) <= BALANCE_TOLERANCE,
+                                    minlength=len(CLASSES)).astype(np.int64)
+
+        values = np.full((n, len(CLASSES)), np.nan)
+        values[np.arange(n), label] = amount
+        self.amount.update(values)
+        self.amount.missing[:] = 0  # NaN di sini hanya penanda kelas lain, bukan data hilang
+        self.rows += n
+
+    def merge(self, other):
+        lookup = self._type_index(other.types)
+        for i, name in enumerate(other.types):
+            self.type_counts[lookup[name]] += other.type_counts[i]
+        self.hour_counts += other.hour_counts
+        self.balance.merge(other.balance)
+        self.drained += other.drained
+        self.amount.merge(other.amount)
+        if other.step_min is not None:
+            self.step_min = other.step_min if self.step_min is None else min(self.step_min, other.step_min)
+            self.step_max = other.step_max if self.step_max is None else max(self.step_max, other.step_max)
+        self.rows += other.rows
+        self.labeled_rows += other.labeled_rows
+        self.sources += [s for s in other.sources if s not in self.sources]
+
+    # ------------------------------------------
+    # Ringkasan untuk UI
+    # ------------------------------------------
+    @property
+    def labeled(self):
+        return self.labeled_rows > 0
+
+    def fraud_count(self):
+        return int(self.type_counts[:, 1].sum())
+
+    def type_table(self):
+        # list per tipe (urut jumlah transaksi menurun)
+        order = np.argsort(-self.type_counts.sum(axis=1), kind='stable')
+        return [
+            {'type': self.types[i], 'count': int(self.type_counts[i].sum()), 'fraud': int(self.type_counts[i, 1]),
+             'fraud_rate': float(self.type_counts[i, 1] / max(self.type_counts[i].sum(), 1))}
+            for i in order
+        ]
+
+    def hour_table(self):
+        total = self.hour_counts.sum(axis=1)
+        return [
+            {'hour': h, 'count': int(total[h]), 'fraud': int(self.hour_counts[h, 1]),
+             'fraud_rate': float(self.hour_counts[h, 1] / max(total[h], 1))}
+            for h in range(HOURS)
+        ]
+
+    def balance_table(self):
+        std = self.balance.std()
+        rows = []
+        for j, column in enumerate(BALANCE_COLUMNS):
+            for k, label in enumerate(CLASSES):
+                cell = j * len(CLASSES) + k
+                count = int(self.balance.count[cell])
+                if count == 0:
+                    continue
+                rows.append({
+                    'column': column, 'class': label, 'count': count,
+                    'mean': float(self.balance.mean[cell]), 'std': float(std[cell]),
+                    'min': float(self.balance.min[cell]), 'max': float(self.balance.max[cell]),
+                    'nonzero_rate': float(self.balance.nonzero[cell] / count),
+                })
+        return rows
+
+    def drained_rates(self):
+        # Proporsi transaksi yang membuat saldo pengirim habis, per kelas
+        per_class = self.type_counts.sum(axis=0)
+        return {label: float(self.drained[k] / max(per_class[k], 1)) for k, label in enumerate(CLASSES)}
+
+    def amount_quantiles(self):
+        q = self.amount.quantiles(AMOUNT_QUANTILES)
+        names = [f'p{round(p * 100)}' for p in AMOUNT_QUANTILES]
+        per_class = self.type_counts.sum(axis=0)
+        return {label: dict(zip(names, q[k].tolist())) for k, label in enumerate(CLASSES) if per_class[k]}
+
+    def summary(self):
+        # Dict biasa (siap di-cache Streamlit) untuk halaman "Tentang Dataset"
+        return {
+            'rows': self.rows,
+            'fraud': self.fraud_count() if self.labeled else None,
+            'step_min': self.step_min,
+            'step_max': self.step_max,
+            'types': self.type_table(),
+            'hours': self.hour_table(),
+            'balance': self.balance_table(),
+            'drained': self.drained_rates() if self.labeled else None,
+            'amount': self.amount_quantiles(),
+            'sources': self.sources,
+        }
+
+    # ------------------------------------------
+    # Serialisasi (artifact JSON ringkas)
+    # ------------------------------------------
+    def to_dict(self):
+        counts = self.amount.counts
+        return {
+            'rows': self.rows,
+            'labeled_rows': self.labeled_rows,
+            'step_min': self.step_min,
+            'step_max': self.step_max,
+            'types': self.types,
+            'type_counts': self.type_counts.tolist(),
+            'hour_counts': self.hour_counts.tolist(),
+            'balance': self.balance.to_dict(),
+            'drained': self.drained.tolist(),
+            'amount_relative_accuracy': self.amount.relative_accuracy,
+            # Bucket sketch sparse: {kelas: [[indeks, jumlah], ...]}
+            'amount_buckets': {c: np.stack([np.flatnonzero(counts[k]), counts[k][counts[k] > 0]], axis=1).tolist()
+                               for k, c in enumerate(CLASSES)},
+            'sources': self.sources,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data['types'])
+        if data['amount_relative_accuracy'] != stats.amount.relative_accuracy:
+            raise ValueError(f"Statistik memakai relative_accuracy {data['amount_relative_accuracy']}, "
+                             f"harus {stats.amount.relative_accuracy}.")
+        stats.type_counts = np.asarray(data['type_counts'], dtype=np.int64).reshape(len(stats.types), len(CLASSES))
+        stats.hour_counts[:] = data['hour_counts']
+        stats.balance = Moments.from_dict(data['balance'])
+        stats.drained[:] = data['drained']
+        for k, c in enumerate(CLASSES):
+            pairs = np.asarray(data['amount_buckets'][c], dtype=np.int64).reshape(-1, 2)
+            stats.amount.counts[k, pairs[:, 0]] = pairs[:, 1]
+        stats.step_min = data['step_min']
+        stats.step_max = data['step_max']
+        stats.rows = data['rows']
+        stats.labeled_rows = data['labeled_rows']
+        stats.sources = list(data.get('sources', []))
+        return stats
+
+
+def save_stats(stats, folder_path):
+    path = os.path.join(folder_path, STATS_FILENAME)
+    with open(path, 'w') as f:
+        json.dump({'format_version': FORMAT_VERSION, 'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   **stats.to_dict()}, f)
+    return path
+
+
+def load_stats(folder_path):
+    # None jika versi model belum punya statistik dataset
+    path = os.path.join(folder_path, STATS_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if data.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Format statistik dataset v{data.get('format_version')} tidak didukung.")
+    return DatasetStats.from_dict(data)
+
+
+# ==========================================
+# CLI
+# ==========================================
+def collect(input_path, chunksize=200_000, log=None):
+    from jaga.batch import iter_chunks
+
+    stats = DatasetStats()
+    stats.sources.append(os.path.basename(input_path))
+    for chunk in iter_chunks(input_path, chunksize):
+        stats.update(chunk)
+        if log is not None:
+            print(f"\r{os.path.basename(input_path)}: {stats.rows:,} baris", end='', file=log, flush=True)
+    if log is not None:
+        print(file=log)
+    return stats
+
+
+def print_summary(stats):
+    fraud = stats.fraud_count()
+    print(f"{stats.rows:,} baris, step {stats.step_min}..{stats.step_max}"
+          + (f", {fraud:,} fraud ({fraud / max(stats.rows, 1):.3%})" if stats.labeled else ", tanpa label isFraud"))
+    print(f"\n{'tipe':<12}{'transaksi':>12}{'fraud':>9}{'rate':>9}")
+    for row in stats.type_table():
+        print(f"{row['type']:<12}{row['count']:>12,}{row['fraud']:>9,}{row['fraud_rate']:>9.3%}")
+    print(f"\n{'kolom':<18}{'kelas':<8}{'mean':>14}{'std':>14}{'!= 0':>8}")
+    for row in stats.balance_table():
+        print(f"{row['column']:<18}{row['class']:<8}{row['mean']:>14,.1f}{row['std']:>14,.1f}{row['nonzero_rate']:>8.1%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Statistik EDA dataset untuk halaman 'Tentang Dataset'")
+    parser.add_argument('inputs', nargs='+', help="File transaksi (.csv/.parquet); beberapa file digabung")
+    parser.add_argument('--model-dir', default='models/v1_2/',
+                        help=f"Folder versi model tujuan {STATS_FILENAME}")
+    parser.add_argument('--chunksize', type=int, default=200_000)
+    parser.add_argument('--merge', action='store_true',
+                        help=f"Gabungkan dengan {STATS_FILENAME} yang sudah ada (data tambahan)")
+    parser.add_argument('--dry-run', action='store_true', help="Hanya tampilkan ringkasan, tidak menulis file")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = load_stats(args.model_dir) if args.merge else None
+    stats = stats or DatasetStats()
+    for path in args.inputs:
+        stats.merge(collect(path, args.chunksize, log=sys.stderr))
+    elapsed = time.perf_counter() - start
+
+    print_summary(stats)
+    print(f"\n{elapsed:.1f} detik ({stats.rows / max(elapsed, 1e-9):,.0f} baris/detik)")
+    if not args.dry_run:
+        path = save_stats(stats, args.model_dir)
+        print(f"Disimpan ke {path} ({os.path.getsize(path) / 1024:,.1f} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import time
+
+import numpy as np
+
+from jaga.features import ANOMALY_FEATURE
+from jaga.metrics import METRICS
+from jaga.pipeline import score_model
+
+# ==========================================
+# PENJELASAN PREDIKSI (TREESHAP)
+# ==========================================
+# Kontribusi tiap fitur terhadap skor XGBoost dihitung oleh booster sendiri
+# (predict(pred_contribs=True)), sekaligus untuk satu batch baris:
+#
+#   bias + sum(kontribusi fitur) = margin (log-odds)  ->  sigmoid = probability
+#
+# anomaly_score adalah fitur XGBoost (kolom terakhir), jadi pengaruh skor
+# Isolation Forest ikut terukur sebagai kontribusi fitur 'anomaly_score'.
+#
+# Mode:
+#   exact       : TreeSHAP (default), biaya ~ jumlah pohon x daun x kedalaman^2
+#   approximate : Saabas (approx_contribs=True), jauh lebih murah, urutan fitur
+#                 biasanya sama tetapi nilainya tidak memenuhi sifat SHAP
+#
+# Biaya per versi model diukur di benchmarks/bench_explain.py. Di produksi
+# penjelasan cukup dihitung untuk baris review/block (EXPLAIN_DECISIONS).
+
+EXPLAIN_DECISIONS = ('review', 'block')
+
+# Label fitur untuk UI (Bahasa Indonesia)
+FEATURE_LABELS = {
+    'amount': 'Nominal transaksi',
+    'oldbalanceOrg': 'Saldo awal pengirim',
+    'newbalanceOrig': 'Saldo akhir pengirim',
+    'oldbalanceDest': 'Saldo awal penerima',
+    'newbalanceDest': 'Saldo akhir penerima',
+    'step': 'Step (jam ke-)',
+    'errorBalanceOrig': 'Selisih saldo pengirim',
+    'errorBalanceDest': 'Selisih saldo penerima',
+    'hour': 'Jam transaksi',
+    'type_CASH_OUT': 'Tipe CASH_OUT',
+    'type_TRANSFER': 'Tipe TRANSFER',
+    ANOMALY_FEATURE: 'Skor anomali (Isolation Forest)',
+}
+
+
+def booster_for(assets):
+    # Assets pickle: booster dari XGBClassifier. Assets native: load_native(..., with_booster=True)
+    booster = assets.get('xgb_booster')
+    if booster is None and 'xgb_model' in assets:
+        booster = assets['xgb_booster'] = assets['xgb_model'].get_booster()
+    if booster is None:
+        raise ValueError("Assets tidak memiliki booster XGBoost; muat dengan load_native(..., with_booster=True).")
+    return booster
+
+
+class Explanation:
+
+    def __init__(self, contributions, bias, feature_names):
+        self.contributions = contributions  # (n, n_features), satuan log-odds
+        self.bias = bias                    # (n,)
+        self.feature_names = list(feature_names)
+
+    def __len__(self):
+        return len(self.contributions)
+
+    def top(self, k):
+        # Indeks & nilai k fitur dengan |kontribusi| terbesar per baris, urut menurun
+        k = min(k, self.contributions.shape[1])
+        magnitude = np.abs(self.contributions)
+        if k < magnitude.shape[1]:
+            index = np.argpartition(-magnitude, k - 1, axis=1)[:, :k]
+        else:
+            index = np.broadcast_to(np.arange(k), magnitude.shape).copy()
+        order = np.argsort(-np.take_along_axis(magnitude, index, axis=1), axis=1, kind='stable')
+        index = np.take_along_axis(index, order, axis=1)
+        return index, np.take_along_axis(self.contributions, index, axis=1)
+
+    def to_records(self, k=None):
+        # list per baris: [{'feature': ..., 'contribution': ...}, ...]
+        index, values = self.top(k or self.contributions.shape[1])
+        names = self.feature_names
+        return [
+            [{'feature': names[j], 'contribution': float(v)} for j, v in zip(row_index, row_values)]
+            for row_index, row_values in zip(index.tolist(), values.tolist())
+        ]
+
+
+def explain_matrix(assets, X, approximate=False):
+    # X: matriks FastFeatures dengan kolom anomaly_score sudah terisi (setelah score_matrix)
+    import xgboost as xgb
+
+    start = time.perf_counter()
+    booster = booster_for(assets)
+    contribs = booster.predict(
+        xgb.DMatrix(np.asarray(X, dtype=np.float32)),
+        pred_contribs=True, approx_contribs=approximate, validate_features=False,
+    )
+    METRICS.observe('explain', start, len(X))
+    return Explanation(contribs[:, :-1], contribs[:, -1], assets['features'].feature_names)
+
+
+def _with_anomaly(assets, X, anomaly_score):
+    # anomaly_score dari hasil scoring sebelumnya -> Isolation Forest tidak diulang.
+    # NaN (baris dilewati cascade) -> dihitung model lengkap
+    if anomaly_score is None or np.isnan(anomaly_score).any():
+        score_model(assets, X)
+    else:
+        X[:, assets['features'].n_preprocessed] = anomaly_score
+    return X
+
+
+def explain_records(assets, records, anomaly_score=None, approximate=False):
+    X = _with_anomaly(assets, assets['features'].from_records(records), anomaly_score)
+    return explain_matrix(assets, X, approximate)
+
+
+def explain_frame(assets, df, anomaly_score=None, approximate=False):
+    X = _with_anomaly(assets, assets['features'].from_frame(df), anomaly_score)
+    return explain_matrix(assets, X, approximate)
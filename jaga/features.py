@@ -0,0 +1,131 @@
+import time
+
+import numpy as np
+
+from jaga.metrics import METRICS
+
+# ==========================================
+# FEATURE ENGINEERING CEPAT (NUMPY)
+# ==========================================
+# Pengganti jalur DataFrame -> add_features -> preprocessor.transform untuk
+# scoring online. Parameter RobustScaler (center_/scale_) dan kategori
+# OneHotEncoder diambil langsung dari preprocessor.pkl, lalu fitur dihitung di
+# array float yang sudah dialokasikan:
+#
+#   kolom 0..8  : numerik ter-scale (amount ... hour)
+#   kolom 9..10 : type_CASH_OUT, type_TRANSFER
+#   kolom 11    : anomaly_score (diisi setelah Isolation Forest)
+#
+# Urutan kolom mengikuti feature_names di model_metadata.json.
+# Parity dengan preprocessor asli (termasuk input NaN/inf) dijaga tests/test_parity.py;
+# benchmarks/bench_features.py mengukur kecepatan & parity pada 100k baris.
+
+ANOMALY_FEATURE = 'anomaly_score'
+
+# Kolom numerik mentah (urutan kolom array input `raw`)
+RAW_NUMERIC_COLUMNS = [
+    'step', 'amount',
+    'oldbalanceOrg', 'newbalanceOrig',
+    'oldbalanceDest', 'newbalanceDest'
+]
+
+
+def _derive(raw):
+    # raw: (n, 6) sesuai RAW_NUMERIC_COLUMNS -> dict kolom numerik lengkap
+    step, amount = raw[:, 0], raw[:, 1]
+    old_org, new_org = raw[:, 2], raw[:, 3]
+    old_dest, new_dest = raw[:, 4], raw[:, 5]
+    return {
+        'step': step,
+        'amount': amount,
+        'oldbalanceOrg': old_org,
+        'newbalanceOrig': new_org,
+        'oldbalanceDest': old_dest,
+        'newbalanceDest': new_dest,
+        'hour': step % 24,
+        # Urutan operasi sama dengan add_features agar hasil identik (bit-exact)
+        'errorBalanceOrig': new_org + amount - old_org,
+        'errorBalanceDest': old_dest + amount - new_dest,
+    }
+
+
+class FastFeatures:
+
+    def __init__(self, numeric_columns, center, scale, categories, feature_names=None):
+        self.numeric_columns = list(numeric_columns)
+        self.center = np.asarray(center, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.categories = [str(c) for c in categories]
+
+        self.feature_names = (
+            list(self.numeric_columns)
+            + [f'type_{c}' for c in self.categories]
+            + [ANOMALY_FEATURE]
+        )
+        if feature_names is not None and list(feature_names) != self.feature_names:
+            raise ValueError(
+                "feature_names di metadata tidak cocok dengan preprocessor: "
+                f"{list(feature_names)} != {self.feature_names}"
+            )
+        self.n_features = len(self.feature_names)
+        # Jumlah kolom yang dipakai Isolation Forest (tanpa anomaly_score)
+        self.n_preprocessed = self.n_features - 1
+
+    @classmethod
+    def from_preprocessor(cls, preprocessor, feature_names=None):
+        transformers = {name: (trans, cols) for name, trans, cols in preprocessor.transformers_}
+        if set(transformers) - {'remainder'} != {'num', 'cat'}:
+            raise ValueError(f"Struktur preprocessor tidak didukung: {list(transformers)}")
+
+        scaler, numeric_columns = transformers['num']
+        encoder, cat_columns = transformers['cat']
+        if list(cat_columns) != ['type']:
+            raise ValueError(f"OneHotEncoder diharapkan hanya untuk kolom 'type', bukan {cat_columns}")
+
+        n_num = len(numeric_columns)
+        center = scaler.center_ if scaler.with_centering else np.zeros(n_num)
+        scale = scaler.scale_ if scaler.with_scaling else np.ones(n_num)
+        return cls(numeric_columns, center, scale, encoder.categories_[0], feature_names)
+
+    def allocate(self, n):
+        return np.empty((n, self.n_features), dtype=np.float64)
+
+    def transform(self, raw, types, out=None):
+        # raw: array float (n, 6) urut RAW_NUMERIC_COLUMNS, types: array string (n,)
+        raw = np.asarray(raw, dtype=np.float64)
+        n = raw.shape[0]
+        if out is None:
+            out = self.allocate(n)
+
+        start = time.perf_counter()
+        derived = _derive(raw)
+        METRICS.observe('feature_engineering', start, n)
+
+        start = time.perf_counter()
+        for j, col in enumerate(self.numeric_columns):
+            np.subtract(derived[col], self.center[j], out=out[:, j])
+            np.divide(out[:, j], self.scale[j], out=out[:, j])
+
+        types = np.asarray(types)
+        offset = len(self.numeric_columns)
+        for k, category in enumerate(self.categories):
+            out[:, offset + k] = types == category
+
+        out[:, -1] = 0.0
+        METRICS.observe('preprocess', start, n)
+        return out
+
+    def from_records(self, records, out=None):
+        # records: list of dict (payload JSON) -> matriks fitur
+        start = time.perf_counter()
+        raw = np.array([[r[c] for c in RAW_NUMERIC_COLUMNS] for r in records], dtype=np.float64)
+        types = np.array([r['type'] for r in records], dtype=object)
+        METRICS.observe('parse', start, len(records))
+        return self.transform(raw.reshape(len(records), len(RAW_NUMERIC_COLUMNS)), types, out)
+
+    def from_frame(self, df, out=None):
+        start = time.perf_counter()
+        raw = df[RAW_NUMERIC_COLUMNS].to_numpy(dtype=np.float64)
+        types = df['type'].to_numpy(dtype=object)
+        METRICS.observe('parse', start, len(df))
+        return self.transform(raw, types, out)
@@ -0,0 +1,315 @@
+from array import array
+
+import numpy as np
+import pandas as pd
+
+from jaga.velocity import hash_accounts
+
+# ==========================================
+# GRAF TRANSAKSI ANTAR AKUN (FRAUD RING)
+# ==========================================
+# Fitur per transaksi yang melihat SIAPA mengirim ke SIAPA (nameOrig -> nameDest),
+# dihitung dari graf yang tumbuh transaksi demi transaksi:
+#
+#   component_size  : jumlah akun di komponen terhubung (tak berarah) setelah
+#                     transaksi ini; ring mule membentuk komponen besar
+#   orig_fan_out    : penerima berbeda yang pernah dikirimi akun pengirim
+#   orig_fan_in     : pengirim berbeda yang pernah mengirim ke akun pengirim
+#                     (dana masuk lalu diteruskan keluar)
+#   dest_fan_in     : pengirim berbeda yang pernah mengirim ke akun penerima
+#   dest_fan_out    : penerima berbeda yang pernah dikirimi akun penerima
+#   pair_count      : transaksi sebelumnya dengan pasangan pengirim -> penerima sama
+#   dest_mule_reuse : dest_fan_in jika akun penerima juga meneruskan dana
+#                     (dest_fan_out > 0), selain itu 0: akun penampung yang
+#                     dipakai ulang banyak pengirim
+#
+# Selain component_size, semua fitur = keadaan SEBELUM transaksi itu sendiri
+# (termasuk transaksi lebih awal di batch yang sama), sama seperti jaga/velocity.py.
+#
+# Penyimpanan (tanpa dict/set Python, sehingga puluhan juta edge muat di satu mesin):
+#   - ID akun & pasangan (pengirim, penerima) dipetakan ke indeks berurutan lewat
+#     hash table open addressing berbasis array NumPy (_KeyIndex)
+#   - union-find (parent, size) di array('i'): union by size + path halving,
+#     amortized hampir O(1) per edge
+#   - fan-in/fan-out per akun & jumlah transaksi per edge di array int32
+# Edge berbeda disimpan sebagai key (indeks pengirim << 32 | indeks penerima);
+# adjacency() menyusunnya menjadi array CSR untuk investigasi.
+#
+# Berbeda dengan VelocityStore, graf bersifat kumulatif (tidak ada TTL/eviction):
+# memori tumbuh dengan jumlah akun & edge berbeda (lihat benchmarks/bench_graph.py).
+#
+#   graph = AccountGraph()
+#   features = graph.update_frame(chunk)   # DataFrame berisi GRAPH_COLUMNS
+
+GRAPH_COLUMNS = [
+    'component_size', 'orig_fan_out', 'orig_fan_in', 'dest_fan_in', 'dest_fan_out',
+    'pair_count', 'dest_mule_reuse',
+]
+
+DEFAULT_CAPACITY = 1 << 20
+# Perkalian Fibonacci hashing (key -> slot awal)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+_MAX_LOAD = 0.5
+
+
+# ==========================================
+# 1. HASH TABLE UINT64 -> INDEKS
+# ==========================================
+class _KeyIndex:
+    # Linear probing, vectorized per batch: tiap putaran memeriksa satu slot untuk
+    # semua key yang belum selesai. Key baru mendapat indeks berurutan 0, 1, 2, ...
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.size = 0
+        self._allocate(max(int(capacity / _MAX_LOAD - 1).bit_length(), 4))
+
+    def _allocate(self, bits):
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.keys = np.zeros(1 << bits, dtype=np.uint64)
+        self.ids = np.full(1 << bits, -1, dtype=np.int32)
+
+    @property
+    def nbytes(self):
+        return self.keys.nbytes + self.ids.nbytes
+
+    def _slots(self, keys, slots=None):
+        # Slot yang berisi key tersebut, atau slot kosong pertama pada jalur probe-nya
+        if slots is None:
+            slots = ((keys * _MIX) >> np.uint64(64 - self.bits)).astype(np.int64)
+        pending = np.arange(len(keys))
+        while len(pending):
+            s = slots[pending]
+            done = (self.ids[s] < 0) | (self.keys[s] == keys[pending])
+            pending = pending[~done]
+            slots[pending] = (slots[pending] + 1) & self.mask
+        return slots
+
+    def _insert(self, keys, ids, slots=None):
+        # keys unik & belum ada di tabel
+        slots = self._slots(keys, slots)
+        pending = np.arange(len(keys))
+        while len(pending):
+            # Beberapa key baru bisa mendapat slot kosong yang sama: satu menang,
+            # sisanya melanjutkan probing dari slot berikutnya
+            _, first = np.unique(slots[pending], return_index=True)
+            winners = pending[first]
+            self.keys[slots[winners]] = keys[winners]
+            self.ids[slots[winners]] = ids[winners]
+            losers = np.ones(len(pending), dtype=bool)
+            losers[first] = False
+            pending = pending[losers]
+            if len(pending):
+                slots[pending] = self._slots(keys[pending], (slots[pending] + 1) & self.mask)
+
+    def _grow(self, needed):
+        bits = self.bits
+        while needed > _MAX_LOAD * (1 << bits):
+            bits += 1
+        occupied = self.ids >= 0
+        keys, ids = self.keys[occupied], self.ids[occupied]
+        self._allocate(bits)
+        self._insert(keys, ids)
+
+    def lookup(self, keys):
+        # -> indeks, -1 untuk key yang belum pernah dilihat
+        keys = np.asarray(keys, dtype=np.uint64)
+        return self.ids[self._slots(keys)]
+
+    def add(self, keys):
+        # -> indeks tiap key (key baru ditambahkan); boleh berisi duplikat
+        keys = np.asarray(keys, dtype=np.uint64)
+        unique, inverse = np.unique(keys, return_inverse=True)
+        if self.size + len(unique) > _MAX_LOAD * (1 << self.bits):
+            self._grow(self.size + len(unique))
+        slots = self._slots(unique)
+        ids = self.ids[slots].astype(np.int64)
+        new = np.nonzero(ids < 0)[0]
+        if len(new):
+            ids[new] = np.arange(self.size, self.size + len(new))
+            self._insert(unique[new], ids[new], slots[new])
+            self.size += len(new)
+        return ids[inverse.reshape(-1)]
+
+    def items(self):
+        occupied = self.ids >= 0
+        return self.keys[occupied], self.ids[occupied]
+
+
+def _resized(values, size):
+    # Array per akun/edge tumbuh 2x agar biaya salin teramortisasi
+    if size <= len(values):
+        return values
+    grown = np.zeros(max(size, 2 * len(values)), dtype=values.dtype)
+    grown[:len(values)] = values
+    return grown
+
+
+def _add_counts(values, index):
+    unique, counts = np.unique(index, return_counts=True)
+    values[unique] += counts.astype(values.dtype)
+
+
+def _earlier_counts(event_nodes, *query_nodes):
+    # Untuk tiap query & posisi i: jumlah event j < i dengan event_nodes[j] == query[i]
+    # (event_nodes = -1 berarti posisi itu bukan event). Event & query diurutkan per
+    # (node, posisi, query dulu) dalam satu key int64, lalu cumsum dikurangi nilai
+    # di awal grup node.
+    n = len(event_nodes)
+    events = np.nonzero(event_nodes >= 0)[0]
+    nodes = np.concatenate(list(query_nodes) + [event_nodes[events]])
+    position = np.concatenate([np.arange(n)] * len(query_nodes) + [events])
+    is_event = np.zeros(len(nodes), dtype=np.int64)
+    is_event[n * len(query_nodes):] = 1
+    # node < 2^31 & 2n < 2^32 -> key muat di int64
+    order = np.argsort(nodes * (2 * n) + 2 * position + is_event)
+    nodes, is_event = nodes[order], is_event[order]
+
+    cumulative = np.cumsum(is_event) - is_event
+    group_start = np.searchsorted(nodes, nodes, side='left')
+    counts = cumulative - cumulative[group_start]
+    out = np.empty(n * len(query_nodes), dtype=np.int64)
+    queries = is_event == 0
+    out[order[queries]] = counts[queries]
+    return out.reshape(len(query_nodes), n)
+
+
+def _union(parent, size, orig, dest):
+    # Union-find berurutan (tiap transaksi bergantung pada union sebelumnya):
+    # union by size + path halving -> amortized hampir O(1) per edge
+    out = array('i', bytes(4 * len(orig)))
+    for i, (a, b) in enumerate(zip(orig, dest)):
+        while parent[a] != a:
+            parent[a] = a = parent[parent[a]]
+        while parent[b] != b:
+            parent[b] = b = parent[parent[b]]
+        if a != b:
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+        out[i] = size[a]
+    return np.frombuffer(out, dtype=np.int32)
+
+
+# ==========================================
+# 2. GRAF AKUN
+# ==========================================
+class AccountGraph:
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._accounts = _KeyIndex(capacity)
+        self._edges = _KeyIndex(capacity)
+        self._parent = array('i')
+        self._size = array('i')
+        self.fan_in = np.zeros(capacity, dtype=np.int32)
+        self.fan_out = np.zeros(capacity, dtype=np.int32)
+        self.edge_count = np.zeros(capacity, dtype=np.int32)
+        self.transactions = 0
+
+    def __len__(self):
+        return self._accounts.size
+
+    @property
+    def n_edges(self):
+        # Pasangan pengirim -> penerima berbeda
+        return self._edges.size
+
+    @property
+    def nbytes(self):
+        return (self._accounts.nbytes + self._edges.nbytes
+                + self._parent.itemsize * len(self._parent) + self._size.itemsize * len(self._size)
+                + self.fan_in.nbytes + self.fan_out.nbytes + self.edge_count.nbytes)
+
+    # ------------------------------------------
+    # Lookup + update (satu batch transaksi)
+    # ------------------------------------------
+    def update_keys(self, orig_keys, dest_keys):
+        # keys: hash akun uint64 (hash_accounts). Mengembalikan matriks (n, 7) urut
+        # GRAPH_COLUMNS, lalu mencatat batch ke graf
+        n = len(orig_keys)
+        if n == 0:
+            return np.zeros((0, len(GRAPH_COLUMNS)))
+        nodes = self._accounts.add(np.concatenate([orig_keys, dest_keys]))
+        orig, dest = nodes[:n], nodes[n:]
+        n_accounts = self._accounts.size
+        if n_accounts > len(self._parent):
+            self._parent.extend(range(len(self._parent), n_accounts))
+            self._size.extend(array('i', [1]) * (n_accounts - len(self._size)))
+            self.fan_in = _resized(self.fan_in, n_accounts)
+            self.fan_out = _resized(self.fan_out, n_accounts)
+
+        edges = self._edges.add((orig.astype(np.uint64) << np.uint64(32)) | dest.astype(np.uint64))
+        self.edge_count = _resized(self.edge_count, self._edges.size)
+        pair_count = self.edge_count[edges] + _earlier_counts(edges, edges)[0]
+        # Pasangan pertama kali muncul -> menambah fan-out pengirim & fan-in penerima
+        first = pair_count == 0
+        new_orig = np.where(first, orig, -1)
+        new_dest = np.where(first, dest, -1)
+
+        out = np.empty((n, len(GRAPH_COLUMNS)))
+        sent = _earlier_counts(new_orig, orig, dest)
+        received = _earlier_counts(new_dest, orig, dest)
+        out[:, 1] = self.fan_out[orig] + sent[0]
+        out[:, 2] = self.fan_in[orig] + received[0]
+        out[:, 3] = self.fan_in[dest] + received[1]
+        out[:, 4] = self.fan_out[dest] + sent[1]
+        out[:, 5] = pair_count
+        out[:, 6] = np.where(out[:, 4] > 0, out[:, 3], 0.0)
+        out[:, 0] = _union(self._parent, self._size, orig.tolist(), dest.tolist())
+
+        _add_counts(self.edge_count, edges)
+        _add_counts(self.fan_out, orig[first])
+        _add_counts(self.fan_in, dest[first])
+        self.transactions += n
+        return out
+
+    def update(self, orig_ids, dest_ids):
+        return self.update_keys(hash_accounts(orig_ids), hash_accounts(dest_ids))
+
+    def update_frame(self, df):
+        # df: kolom PaySim nameOrig & nameDest, urut kedatangan (step)
+        features = self.update(df['nameOrig'].to_numpy(), df['nameDest'].to_numpy())
+        return pd.DataFrame(features, columns=GRAPH_COLUMNS, index=df.index)
+
+    def update_records(self, records):
+        # records: list of dict (NDJSON) yang memiliki nameOrig & nameDest
+        return self.update([r['nameOrig'] for r in records], [r['nameDest'] for r in records])
+
+    # ------------------------------------------
+    # Query
+    # ------------------------------------------
+    def component_sizes(self, ids):
+        # Ukuran komponen saat ini per akun (0 untuk akun yang belum pernah terlihat)
+        nodes = self._accounts.lookup(hash_accounts(ids))
+        parent = np.frombuffer(self._parent, dtype=np.int32).astype(np.int64)
+        # Pointer jumping sampai semua node menunjuk akar (tanpa mengubah union-find)
+        roots = np.where(nodes >= 0, nodes, 0)
+        while True:
+            up = parent[roots]
+            if np.array_equal(up, roots):
+                break
+            roots = up
+        sizes = np.frombuffer(self._size, dtype=np.int32)[roots]
+        return np.where(nodes >= 0, sizes, 0)
+
+    def adjacency(self):
+        # Edge berbeda sebagai CSR: penerima akun i = indices[indptr[i]:indptr[i + 1]]
+        # Key edge = pengirim << 32 | penerima, jadi satu sort mengurutkan per pengirim
+        keys = np.sort(self._edges.items()[0])
+        indptr = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(np.bincount((keys >> np.uint64(32)).astype(np.int64), minlength=len(self)), out=indptr[1:])
+        return indptr, (keys & np.uint64(0xFFFFFFFF)).astype(np.int32)
+
+    def stats(self):
+        sizes = np.frombuffer(self._size, dtype=np.int32)
+        parent = np.frombuffer(self._parent, dtype=np.int32)
+        roots = parent == np.arange(len(parent), dtype=np.int32)
+        return {
+            'accounts': len(self),
+            'edges': self.n_edges,
+            'transactions': self.transactions,
+            'components': int(roots.sum()),
+            'largest_component': int(sizes[roots].max()) if len(sizes) else 0,
+            'memory_mb': self.nbytes / 2**20,
+        }
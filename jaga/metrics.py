@@ -0,0 +1,173 @@
+import bisect
+import os
+import threading
+import time
+
+# ==========================================
+# INSTRUMENTASI TAHAP SCORING
+# ==========================================
+# Setiap tahap pipeline mencatat durasi & jumlah baris per panggilan:
+#
+#   parse              list of dict -> array mentah (payload JSON)
+#   feature_engineering hour, errorBalanceOrig, errorBalanceDest
+#   preprocess         RobustScaler + one-hot (pengganti preprocessor.transform)
+#   cascade            gerbang tipe/rules/prefilter sebelum model (jika aktif)
+#   iso_forest         decision_function / anomaly_score
+#   column_stack       anomaly_score -> kolom terakhir matriks fitur
+#   xgboost            predict_proba
+#   decision           threshold allow/review/block
+#   request            satu panggilan score_records ujung ke ujung
+#   explain            kontribusi fitur TreeSHAP (hanya jika diminta)
+#
+# Data: histogram latensi, histogram ukuran batch, total baris & waktu per
+# tahap (rows/sec = rows / seconds). Overhead per tahap ~1 us (perf_counter +
+# bisect + lock), jadi aman dibiarkan aktif. JAGA_METRICS=0 menonaktifkan.
+#
+# Ekspor: METRICS.to_prometheus() (GET /metrics) atau METRICS.snapshot() (dict).
+# Dengan uvicorn --workers N, tiap worker punya angka sendiri.
+
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 10.0,
+)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384, 65536, 262144)
+
+STAGES = (
+    'parse', 'feature_engineering', 'preprocess', 'cascade', 'iso_forest',
+    'column_stack', 'xgboost', 'decision', 'request', 'explain',
+)
+
+ENABLED = os.environ.get('JAGA_METRICS', '1') != '0'
+
+
+class StageMetrics:
+
+    def __init__(self):
+        self.latency = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.batch = [0] * (len(BATCH_BUCKETS) + 1)
+        self.calls = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+    def snapshot(self):
+        return {
+            'calls': self.calls,
+            'rows': self.rows,
+            'seconds': self.seconds,
+            'rows_per_sec': self.rows / self.seconds if self.seconds > 0 else 0.0,
+            'mean_ms': self.seconds / self.calls * 1000 if self.calls else 0.0,
+            'mean_batch': self.rows / self.calls if self.calls else 0.0,
+            'latency_buckets': dict(zip([*LATENCY_BUCKETS, '+Inf'], self.latency)),
+            'batch_buckets': dict(zip([*BATCH_BUCKETS, '+Inf'], self.batch)),
+        }
+
+
+class StageTrace:
+    # Mengumpulkan durasi tiap tahap untuk satu permintaan di thread ini
+    # (mis. ditampilkan di halaman Streamlit)
+
+    def __init__(self):
+        self.stages = []
+
+    def __enter__(self):
+        _local.trace = self
+        return self
+
+    def __exit__(self, *exc):
+        _local.trace = None
+
+    def totals(self):
+        totals = {}
+        for stage, seconds in self.stages:
+            totals[stage] = totals.get(stage, 0.0) + seconds
+        return totals
+
+
+_local = threading.local()
+_perf_counter = time.perf_counter
+_bisect = bisect.bisect_left
+
+
+class Metrics:
+
+    def __init__(self, enabled=ENABLED):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stages = {stage: StageMetrics() for stage in STAGES}
+        self.started = time.time()
+
+    def observe(self, stage, start, rows):
+        # start = time.perf_counter() sebelum tahap dimulai
+        if not self.enabled:
+            return
+        seconds = _perf_counter() - start
+        state = _local.__dict__
+        if state.get('suppressed'):
+            return
+        metrics = self._stages[stage]
+        with self._lock:
+            metrics.latency[_bisect(LATENCY_BUCKETS, seconds)] += 1
+            metrics.batch[_bisect(BATCH_BUCKETS, rows)] += 1
+            metrics.calls += 1
+            metrics.rows += rows
+            metrics.seconds += seconds
+        trace = state.get('trace')
+        if trace is not None:
+            trace.stages.append((stage, seconds))
+
+    def suppress_thread(self):
+        # Thread ini (mis. shadow scoring) tidak lagi dicatat
+        _local.suppressed = True
+
+    def reset(self):
+        with self._lock:
+            self._stages = {stage: StageMetrics() for stage in STAGES}
+            self.started = time.time()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'uptime_seconds': time.time() - self.started,
+                'stages': {stage: m.snapshot() for stage, m in self._stages.items()},
+            }
+
+    def to_prometheus(self, prefix='jaga'):
+        snapshot = self.snapshot()['stages']
+        lines = [
+            f'# HELP {prefix}_stage_seconds Latensi per tahap scoring.',
+            f'# TYPE {prefix}_stage_seconds histogram',
+        ]
+        for stage, s in snapshot.items():
+            lines += _histogram_lines(f'{prefix}_stage_seconds', stage, s['latency_buckets'], s['seconds'], s['calls'])
+        lines += [
+            f'# HELP {prefix}_stage_batch_rows Jumlah baris per panggilan tahap.',
+            f'# TYPE {prefix}_stage_batch_rows histogram',
+        ]
+        for stage, s in snapshot.items():
+            lines += _histogram_lines(f'{prefix}_stage_batch_rows', stage, s['batch_buckets'], s['rows'], s['calls'])
+        lines += [
+            f'# HELP {prefix}_stage_rows_total Total baris yang melewati tahap.',
+            f'# TYPE {prefix}_stage_rows_total counter',
+        ]
+        lines += [f'{prefix}_stage_rows_total{{stage="{stage}"}} {s["rows"]}' for stage, s in snapshot.items()]
+        lines += [
+            f'# HELP {prefix}_stage_rows_per_second Throughput tahap (baris / detik di dalam tahap).',
+            f'# TYPE {prefix}_stage_rows_per_second gauge',
+        ]
+        lines += [f'{prefix}_stage_rows_per_second{{stage="{stage}"}} {s["rows_per_sec"]:.6g}'
+                  for stage, s in snapshot.items()]
+        return '\n'.join(lines) + '\n'
+
+
+def _histogram_lines(name, stage, buckets, total, count):
+    lines = []
+    cumulative = 0
+    for le, n in buckets.items():
+        cumulative += n
+        lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+    lines.append(f'{name}_sum{{stage="{stage}"}} {total:.9g}')
+    lines.append(f'{name}_count{{stage="{stage}"}} {count}')
+    return lines
+
+
+METRICS = Metrics()
@@ -0,0 +1,204 @@
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from jaga.anomaly import set_tree_budget
+from jaga.cascade import attach_cascade
+from jaga.pipeline import DEFAULT_MODEL_DIR, decide, load_scoring_assets, score_matrix
+
+# ==========================================
+# SCORING MULTI-CORE (PROCESS POOL)
+# ==========================================
+# Batch besar dipecah ke beberapa proses worker:
+#
+#   parent : raw -> matriks fitur, ditulis langsung ke shared memory
+#   worker : score_matrix atas potongan baris [start, stop) di shared memory,
+#            proba & anomaly_score ditulis ke segmen output bersama
+#
+# Yang lewat pipe hanya nama segmen + indeks baris, bukan DataFrame/array.
+# Model dimuat sekali per worker:
+#   - fork   : worker mewarisi assets milik parent (copy-on-write)
+#   - spawn  : worker memuat sendiri; format native (mmap) tetap berbagi page cache
+#
+# Fork hanya dipakai untuk format native. Booster XGBoost (OpenMP) yang sudah
+# dipakai di parent bisa deadlock setelah fork, jadi jalur pickle memakai spawn.
+#
+#   with ParallelScorer('models/v1_2/', workers=4) as scorer:
+#       proba, anomaly_score = scorer.score_frame(df)
+
+# Di bawah ini per worker, overhead antar proses lebih mahal dari scoring-nya
+MIN_ROWS_PER_WORKER = 4096
+
+# Assets & segmen shared memory milik proses worker
+_worker_assets = None
+_worker_segments = {}
+
+
+def _limit_threads(assets):
+    # Satu worker = satu core; library di dalamnya tidak boleh ikut membuat thread
+    if 'xgb_model' in assets:
+        assets['xgb_model'].set_params(n_jobs=1)
+
+
+def _init_worker(model_dir, prefer_native, cascade=False, iso_budget=None):
+    global _worker_assets
+    if _worker_assets is None:
+        _worker_assets = load_scoring_assets(model_dir, prefer_native)
+        if cascade:
+            attach_cascade(_worker_assets, model_dir)
+        if iso_budget is not None:
+            set_tree_budget(_worker_assets, iso_budget)
+    _limit_threads(_worker_assets)
+
+
+def _attach(role, name):
+    # Segmen di-cache per peran; jika parent memperbesar buffer, namanya berganti
+    current = _worker_segments.get(role)
+    if current is not None and current.name == name:
+        return current
+    if current is not None:
+        current.close()
+    segment = shared_memory.SharedMemory(name=name)
+    _worker_segments[role] = segment
+    return segment
+
+
+def _score_slice(in_name, out_name, capacity, n_features, start, stop):
+    X = np.ndarray((capacity, n_features), dtype=np.float64, buffer=_attach('in', in_name).buf)
+    out = np.ndarray((2, capacity), dtype=np.float64, buffer=_attach('out', out_name).buf)
+    proba, anomaly_score = score_matrix(_worker_assets, X[start:stop])
+    out[0, start:stop] = proba
+    out[1, start:stop] = anomaly_score
+    return stop - start
+
+
+class _SharedBuffer:
+    # Segmen shared memory yang diperbesar (x2) hanya jika batch melebihi kapasitas
+
+    def __init__(self, n_columns):
+        self.n_columns = n_columns
+        self.capacity = 0
+        self.segment = None
+
+    def ensure(self, n_rows):
+        if n_rows > self.capacity:
+            self.release()
+            self.capacity = max(n_rows, 2 * self.capacity, MIN_ROWS_PER_WORKER)
+            size = self.capacity * self.n_columns * np.dtype(np.float64).itemsize
+            self.segment = shared_memory.SharedMemory(create=True, size=size)
+        return self.segment.name
+
+    def release(self):
+        if self.segment is not None:
+            self.segment.close()
+            self.segment.unlink()
+            self.segment = None
+
+
+class ParallelScorer:
+
+    def __init__(self, model_dir=DEFAULT_MODEL_DIR, workers=None, prefer_native=True, start_method=None,
+                 min_rows_per_worker=MIN_ROWS_PER_WORKER, cascade=False, iso_budget=None):
+        global _worker_assets
+
+        self.model_dir = model_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.min_rows_per_worker = min_rows_per_worker
+        self.assets = load_scoring_assets(model_dir, prefer_native)
+        if cascade:
+            attach_cascade(self.assets, model_dir)
+        if iso_budget is not None:
+            set_tree_budget(self.assets, iso_budget)
+        self.features = self.assets['features']
+
+        if start_method is None:
+            native = 'compiled' in self.assets
+            start_method = 'fork' if native and 'fork' in mp.get_all_start_methods() else 'spawn'
+        self.start_method = start_method
+
+        self._input = _SharedBuffer(self.features.n_features)
+        self._output = _SharedBuffer(2)
+        self._pool = None
+        if self.workers > 1:
+            if start_method == 'fork':
+                # Diwariskan ke worker saat fork; initializer tidak memuat ulang
+                _worker_assets = self.assets
+            # Worker harus berbagi resource tracker milik parent; jika tidak, tracker
+            # milik worker meng-unlink segmen parent saat worker keluar
+            resource_tracker.ensure_running()
+            try:
+                self._pool = ProcessPoolExecutor(
+                    self.workers, mp_context=mp.get_context(start_method),
+                    initializer=_init_worker, initargs=(model_dir, prefer_native, cascade, iso_budget),
+                )
+                # Paksa semua worker start (& memuat model) sekarang, bukan di batch pertama
+                for future in [self._pool.submit(os.getpid) for _ in range(self.workers)]:
+                    future.result()
+            finally:
+                _worker_assets = None
+
+    # ------------------------------------------
+    # Scoring
+    # ------------------------------------------
+    def _slices(self, n):
+        n_parts = min(self.workers, max(1, n // self.min_rows_per_worker))
+        bounds = np.linspace(0, n, n_parts + 1).astype(int)
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _score_shared(self, fill, n):
+        # fill(out) menulis matriks fitur n baris ke view shared memory
+        in_name = self._input.ensure(n)
+        out_name = self._output.ensure(n)
+        capacity = self._input.capacity
+        X = np.ndarray((capacity, self.features.n_features), dtype=np.float64, buffer=self._input.segment.buf)
+        fill(X[:n])
+
+        out_capacity = self._output.capacity
+        futures = [
+            self._pool.submit(_score_slice, in_name, out_name, capacity, self.features.n_features, start, stop)
+            for start, stop in self._slices(n)
+        ]
+        for future in futures:
+            future.result()
+        out = np.ndarray((2, out_capacity), dtype=np.float64, buffer=self._output.segment.buf)
+        return out[0, :n].copy(), out[1, :n].copy()
+
+    def _parallel(self, n):
+        return self._pool is not None and len(self._slices(n)) > 1
+
+    def score_matrix(self, X):
+        if not self._parallel(len(X)):
+            return score_matrix(self.assets, X)
+
+        def fill(view):
+            view[:] = X
+        return self._score_shared(fill, len(X))
+
+    def score_frame(self, df):
+        if not self._parallel(len(df)):
+            return score_matrix(self.assets, self.features.from_frame(df))
+        return self._score_shared(lambda view: self.features.from_frame(df, out=view), len(df))
+
+    def score_records(self, records):
+        if not self._parallel(len(records)):
+            proba, anomaly_score = score_matrix(self.assets, self.features.from_records(records))
+        else:
+            proba, anomaly_score = self._score_shared(
+                lambda view: self.features.from_records(records, out=view), len(records))
+        return proba, anomaly_score, decide(self.assets, proba)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._input.release()
+        self._output.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
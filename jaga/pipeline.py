@@ -0,0 +1,163 @@
+import json
+import math
+import os
+import time
+
+import numpy as np
+
+from jaga.features import FastFeatures
+from jaga.metrics import METRICS
+from jaga.policy import DecisionPolicy
+
+# ==========================================
+# 0. KONSTANTA PIPELINE
+# ==========================================
+DEFAULT_MODEL_DIR = 'models/v1_2/'
+
+# Kolom mentah transaksi (sama dengan isian form "Deteksi Fraud")
+RAW_COLUMNS = [
+    'step', 'type', 'amount',
+    'oldbalanceOrg', 'newbalanceOrig',
+    'oldbalanceDest', 'newbalanceDest'
+]
+
+# ==========================================
+# 1. LOAD MODEL
+# ==========================================
+# v0 memakai nama iso_forest_layer1.pkl, v1 hanya punya metrics.json
+ISO_FOREST_FILES = ['iso_forest_layer.pkl', 'iso_forest_layer1.pkl']
+
+def find_file(folder_path, candidates):
+    for name in candidates:
+        path = os.path.join(folder_path, name)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"Tidak ada {' / '.join(candidates)} di {folder_path}")
+
+def read_metadata(folder_path):
+    metadata_path = os.path.join(folder_path, 'model_metadata.json')
+    if os.path.exists(metadata_path):
+        with open(metadata_path, 'r') as f:
+            return json.load(f)
+    metrics_path = os.path.join(folder_path, 'metrics.json')
+    if os.path.exists(metrics_path):
+        with open(metrics_path, 'r') as f:
+            return {'metrics': json.load(f)}
+    return {}
+
+def load_pipeline(folder_path=DEFAULT_MODEL_DIR):
+    # Import lokal: jalur native (tanpa pickle) tidak perlu membayar import joblib
+    import joblib
+
+    folder_path = os.path.join(folder_path, '')
+
+    preprocessor = joblib.load(f'{folder_path}preprocessor.pkl')
+    iso_forest = joblib.load(find_file(folder_path, ISO_FOREST_FILES))
+    xgb_model = joblib.load(f'{folder_path}model_fraud_xgb.pkl')
+    metrics = read_metadata(folder_path)
+
+    return {
+        'preprocessor': preprocessor,
+        'iso_forest': iso_forest,
+        'xgb_model': xgb_model,
+        'metrics': metrics,
+        'features': FastFeatures.from_preprocessor(preprocessor, metrics.get('feature_names')),
+        'policy': DecisionPolicy.for_model(folder_path, metrics)
+    }
+
+def load_scoring_assets(folder_path=DEFAULT_MODEL_DIR, prefer_native=True):
+    # Format native (jaga/artifacts.py) jika sudah dikonversi: start jauh lebih cepat
+    from jaga.artifacts import has_native, load_native
+
+    if prefer_native and has_native(folder_path):
+        return load_native(folder_path)
+    return load_pipeline(folder_path)
+
+# ==========================================
+# 2. FEATURE ENGINEERING & SCORING
+# ==========================================
+def add_features(df):
+    # Fitur turunan yang dipakai saat training (hour & selisih saldo)
+    df['hour'] = df['step'] % 24
+    df['errorBalanceOrig'] = df['newbalanceOrig'] + df['amount'] - df['oldbalanceOrg']
+    df['errorBalanceDest'] = df['oldbalanceDest'] + df['amount'] - df['newbalanceDest']
+    return df
+
+def score_matrix(assets, X):
+    # X: matriks fitur dari FastFeatures, kolom terakhir diisi anomaly_score.
+    # Dengan attach_cascade (jaga/cascade.py) baris yang jelas aman dilewati
+    cascade = assets.get('cascade')
+    if cascade is not None:
+        return cascade.score_matrix(assets, X)
+    return score_model(assets, X)
+
+def score_model(assets, X):
+    # Model hybrid lengkap untuk semua baris. Tiap tahap dicatat di jaga/metrics.py
+    n = len(X)
+    n_pre = assets['features'].n_preprocessed
+    compiled = assets.get('compiled')
+    if compiled is not None:
+        X_model = X.astype(np.float32)
+
+    start = time.perf_counter()
+    if compiled is not None:
+        anomaly_score = compiled.anomaly_score(X_model[:, :n_pre])
+    else:
+        anomaly_score = assets['iso_forest'].decision_function(X[:, :n_pre])
+    METRICS.observe('iso_forest', start, n)
+
+    start = time.perf_counter()
+    X[:, n_pre] = anomaly_score
+    if compiled is not None:
+        X_model[:, n_pre] = anomaly_score
+    METRICS.observe('column_stack', start, n)
+
+    start = time.perf_counter()
+    if compiled is not None:
+        proba = compiled.xgb_proba(X_model)
+    else:
+        proba = assets['xgb_model'].predict_proba(X)[:, 1]
+    METRICS.observe('xgboost', start, n)
+    return proba, anomaly_score
+
+def score_frame(assets, df):
+    # Tiga tahap model dijalankan sekali untuk seluruh baris (vectorized)
+    return score_matrix(assets, assets['features'].from_frame(df))
+
+def decide(assets, proba):
+    # Band allow/review/block sesuai threshold versi model (jaga/policy.py)
+    start = time.perf_counter()
+    decision = assets['policy'].decide(proba)
+    METRICS.observe('decision', start, len(decision))
+    return decision
+
+def validate_record(record):
+    # Pesan error (str) untuk satu transaksi dari JSON, atau None jika valid
+    if not isinstance(record, dict):
+        return "bukan objek JSON."
+    missing = [c for c in RAW_COLUMNS if c not in record]
+    if missing:
+        return f"tidak memiliki kolom: {', '.join(missing)}"
+    if not isinstance(record['type'], str):
+        return "kolom type harus string."
+    for c in RAW_COLUMNS:
+        if c == 'type':
+            continue
+        if isinstance(record[c], bool) or not isinstance(record[c], (int, float)):
+            return f"kolom {c} harus numerik."
+        # int raksasa (10**400) tidak muat float64; NaN/Infinity dari JSON juga ditolak
+        try:
+            finite = math.isfinite(float(record[c]))
+        except OverflowError:
+            finite = False
+        if not finite:
+            return f"kolom {c} harus bilangan berhingga dalam rentang float64."
+    return None
+
+def score_records(assets, records):
+    # records: list of dict berisi RAW_COLUMNS (mis. payload JSON), tanpa DataFrame
+    start = time.perf_counter()
+    proba, anomaly_score = score_matrix(assets, assets['features'].from_records(records))
+    decision = decide(assets, proba)
+    METRICS.observe('request', start, len(records))
+    return proba, anomaly_score, decision
@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+
+import numpy as np
+
+# ==========================================
+# DECISION POLICY (ALLOW / REVIEW / BLOCK)
+# ==========================================
+# Batas keputusan per versi model, bukan angka 0.8 / 0.5 di kode:
+#
+#   block  : proba >  block_threshold   (default: optimal_threshold di model_metadata.json)
+#   review : proba >  review_threshold
+#   allow  : sisanya
+#
+# Override per versi tanpa mengubah kode: models/vX/decision_policy.json
+#   {"review_threshold": 0.35, "block_threshold": 0.938}
+#
+# Sweep offline atas file berlabel (isFraud) + tuning kapasitas antrean review:
+#   python -m jaga.policy paysim.csv --model-dir models/v1_2/ --review-capacity 0.002 --write
+
+BANDS = ('allow', 'review', 'block')
+BAND_LABELS = np.array(BANDS)
+
+# Dipakai jika metadata versi model tidak punya optimal_threshold
+DEFAULT_BLOCK_THRESHOLD = 0.8
+DEFAULT_REVIEW_THRESHOLD = 0.5
+
+POLICY_FILENAME = 'decision_policy.json'
+
+# Resolusi histogram probabilitas untuk sweep (bin k = (k/N, (k+1)/N])
+SWEEP_BINS = 10_000
+
+
+class DecisionPolicy:
+
+    def __init__(self, review_threshold=DEFAULT_REVIEW_THRESHOLD, block_threshold=DEFAULT_BLOCK_THRESHOLD):
+        if not 0.0 <= review_threshold <= block_threshold <= 1.0:
+            raise ValueError(
+                f"Threshold harus 0 <= review ({review_threshold}) <= block ({block_threshold}) <= 1"
+            )
+        self.review_threshold = float(review_threshold)
+        self.block_threshold = float(block_threshold)
+
+    @classmethod
+    def from_metadata(cls, metadata):
+        policy = metadata.get('decision_policy') or {}
+        block = policy.get('block_threshold', metadata.get('optimal_threshold') or DEFAULT_BLOCK_THRESHOLD)
+        review = policy.get('review_threshold', min(DEFAULT_REVIEW_THRESHOLD, block))
+        return cls(review, block)
+
+    @classmethod
+    def for_model(cls, folder_path, metadata):
+        # decision_policy.json di folder model mengalahkan metadata bawaan
+        path = os.path.join(folder_path, POLICY_FILENAME)
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                metadata = {**metadata, 'decision_policy': json.load(f)}
+        return cls.from_metadata(metadata)
+
+    def band_index(self, proba):
+        proba = np.asarray(proba)
+        return (proba > self.review_threshold).astype(np.int8) + (proba > self.block_threshold)
+
+    def decide(self, proba):
+        return BAND_LABELS[self.band_index(proba)]
+
+    def to_dict(self):
+        return {'review_threshold': self.review_threshold, 'block_threshold': self.block_threshold}
+
+    def save(self, folder_path):
+        with open(os.path.join(folder_path, POLICY_FILENAME), 'w') as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+
+# ==========================================
+# SWEEP THRESHOLD (OFFLINE)
+# ==========================================
+class ProbabilityHistogram:
+    # Histogram probabilitas per label (memori konstan, bisa di-merge)
+
+    def __init__(self, n_bins=SWEEP_BINS):
+        self.n_bins = n_bins
+        self.fraud = np.zeros(n_bins, dtype=np.int64)
+        self.legit = np.zeros(n_bins, dtype=np.int64)
+
+    def _bins(self, proba):
+        return np.clip(np.ceil(np.asarray(proba) * self.n_bins).astype(np.int64) - 1, 0, self.n_bins - 1)
+
+    def update(self, proba, is_fraud):
+        bins = self._bins(proba)
+        is_fraud = np.asarray(is_fraud).astype(bool)
+        self.fraud += np.bincount(bins[is_fraud], minlength=self.n_bins)
+        self.legit += np.bincount(bins[~is_fraud], minlength=self.n_bins)
+
+    def merge(self, other):
+        self.fraud += other.fraud
+        self.legit += other.legit
+
+    def _above(self, counts, threshold):
+        # Jumlah baris dengan proba > threshold
+        k = int(np.floor(threshold * self.n_bins + 1e-9))
+        return int(counts[k:].sum())
+
+    def threshold_stats(self, threshold):
+        tp = self._above(self.fraud, threshold)
+        fp = self._above(self.legit, threshold)
+        total_fraud = int(self.fraud.sum())
+        total = total_fraud + int(self.legit.sum())
+        return {
+            'threshold': threshold,
+            'flagged': tp + fp,
+            'flagged_rate': (tp + fp) / max(total, 1),
+            'precision': tp / (tp + fp) if tp + fp else 0.0,
+            'recall': tp / total_fraud if total_fraud else 0.0,
+        }
+
+    def best_f1(self):
+        # Threshold (batas bin k/N) dengan F1 tertinggi + accuracy/precision/recall di titik itu
+        tp = np.cumsum(self.fraud[::-1])[::-1]
+        fp = np.cumsum(self.legit[::-1])[::-1]
+        total_fraud = int(self.fraud.sum())
+        total_legit = int(self.legit.sum())
+        f1 = np.divide(2 * tp, 2 * tp + fp + (total_fraud - tp), out=np.zeros(self.n_bins),
+                       where=(2 * tp + fp + (total_fraud - tp)) > 0)
+        k = int(np.argmax(f1))
+        stats = self.threshold_stats(k / self.n_bins)
+        stats['f1_score'] = float(f1[k])
+        stats['accuracy'] = (int(tp[k]) + total_legit - int(fp[k])) / max(total_fraud + total_legit, 1)
+        return stats
+
+    def band_stats(self, policy):
+        total_fraud = int(self.fraud.sum())
+        total = total_fraud + int(self.legit.sum())
+        edges = [(0.0, policy.review_threshold), (policy.review_threshold, policy.block_threshold),
+                 (policy.block_threshold, 1.0)]
+        stats = []
+        for band, (lo, hi) in zip(BANDS, edges):
+            fraud = self._above(self.fraud, lo) - self._above(self.fraud, hi)
+            legit = self._above(self.legit, lo) - self._above(self.legit, hi)
+            rows = int(fraud + legit)
+            stats.append({
+                'band': band,
+                'rows': rows,
+                'volume_rate': rows / max(total, 1),
+                'fraud': int(fraud),
+                'precision': fraud / rows if rows else 0.0,
+                'recall': fraud / total_fraud if total_fraud else 0.0,
+            })
+        return stats
+
+    def tune_review_threshold(self, policy, capacity_rate):
+        # Threshold review terendah sehingga volume band review <= capacity_rate * total
+        counts = self.fraud + self.legit
+        budget = capacity_rate * counts.sum()
+        k_block = int(np.floor(policy.block_threshold * self.n_bins + 1e-9))
+        # Jumlah kumulatif dari bin k sampai tepat di bawah block threshold
+        review_counts = np.cumsum(counts[:k_block][::-1])[::-1]
+        feasible = np.nonzero(review_counts <= budget)[0]
+        k = int(feasible[0]) if len(feasible) else k_block
+        return DecisionPolicy(k / self.n_bins, policy.block_threshold)
+
+
+def sweep(input_path, model_dir, label_column='isFraud', chunksize=100_000, thresholds=None):
+    from jaga.batch import iter_chunks
+    from jaga.pipeline import load_pipeline, score_frame
+
+    assets = load_pipeline(model_dir)
+    hist = ProbabilityHistogram()
+    for chunk in iter_chunks(input_path, chunksize):
+        proba, _ = score_frame(assets, chunk)
+        hist.update(proba, chunk[label_column].to_numpy())
+
+    if thresholds is None:
+        thresholds = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99]
+        thresholds = sorted(set(thresholds) | set(assets['policy'].to_dict().values()))
+    return assets, hist, [hist.threshold_stats(t) for t in thresholds]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep threshold keputusan atas file transaksi berlabel")
+    parser.add_argument('input', help="File berlabel (.csv/.parquet) dengan kolom isFraud")
+    parser.add_argument('--model-dir', default='models/v1_2/')
+    parser.add_argument('--label-column', default='isFraud')
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--review-capacity', type=float, default=None,
+                        help="Porsi maksimum transaksi yang masuk antrean review (mis. 0.002 = 0.2%%)")
+    parser.add_argument('--write', action='store_true', help="Simpan policy hasil tuning ke decision_policy.json")
+    args = parser.parse_args(argv)
+
+    assets, hist, rows = sweep(args.input, args.model_dir, args.label_column, args.chunksize)
+
+    print(f"{'threshold':>10}{'flagged %':>11}{'precision':>11}{'recall':>9}")
+    for r in rows:
+        print(f"{r['threshold']:>10.3f}{r['flagged_rate']:>11.3%}{r['precision']:>11.3f}{r['recall']:>9.3f}")
+
+    policy = assets['policy']
+    if args.review_capacity is not None:
+        policy = hist.tune_review_threshold(policy, args.review_capacity)
+
+    print(f"\nPolicy: review > {policy.review_threshold:.4f}, block > {policy.block_threshold:.4f}")
+    print(f"{'band':<8}{'rows':>10}{'volume %':>10}{'precision':>11}{'recall':>9}")
+    for b in hist.band_stats(policy):
+        print(f"{b['band']:<8}{b['rows']:>10,}{b['volume_rate']:>10.3%}{b['precision']:>11.3f}{b['recall']:>9.3f}")
+
+    if args.write:
+        policy.save(args.model_dir)
+        print(f"\nDisimpan ke {os.path.join(args.model_dir, POLICY_FILENAME)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,483 @@
+import glob
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from jaga.artifacts import load_booster
+from jaga.cache import cache_key
+from jaga.anomaly import set_tree_budget
+from jaga.cascade import STAGES, attach_cascade
+from jaga.drift import load_baseline
+from jaga.explain import explain_records
+from jaga.metrics import METRICS
+from jaga.pipeline import (
+    DEFAULT_MODEL_DIR, ISO_FOREST_FILES, decide, load_scoring_assets, read_metadata, score_matrix
+)
+
+# ==========================================
+# MODEL REGISTRY (MULTI-VERSI)
+# ==========================================
+# - Menemukan semua folder models/* yang berisi model lengkap
+# - Menormalkan metadata (model_metadata.json / metrics.json / tidak ada)
+# - Menyimpan pipeline yang sudah dimuat dalam LRU (max_loaded versi)
+# - Mengganti versi aktif secara atomik tanpa restart (hot swap). Dengan
+#   selection_path (mis. models/selection.json) pilihan aktif/challenger ditulis
+#   ke file dan watcher tiap proses membacanya, jadi semua worker uvicorn ikut
+#   berganti dalam satu interval watcher (juga setelah restart).
+# - Opsional: shadow scoring versi challenger di thread latar belakang dan
+#   mencatat tingkat ketidaksepakatan keputusan, tanpa menambah latensi.
+# - Opsional: cache hasil scoring (jaga/cache.py) untuk transaksi retry/duplikat;
+#   key memuat versi + signature file, jadi otomatis basi saat model berganti.
+# - Penjelasan TreeSHAP (jaga/explain.py) untuk baris yang sudah diskor; booster
+#   XGBoost format native baru dimuat saat penjelasan pertama diminta.
+# - Opsional: monitor drift (jaga/drift.py) menerima matriks fitur baris yang
+#   benar-benar diskor versi aktif (hit cache/retry tidak dihitung ulang).
+# - Opsional: cascade (jaga/cascade.py) per versi, konfigurasi dari cascade.json.
+#   Baris yang keluar sebelum model (proba 0 / NaN untuk prefilter) tidak masuk
+#   monitor drift maupun cache; tahap keluarnya dikembalikan & dicatat di audit.
+# - Opsional: mode pohon terbatas Isolation Forest (jaga/anomaly.py, TreeBudget),
+#   hanya untuk versi yang dimuat dari format native.
+# - Opsional: audit log (jaga/audit.py) setiap keputusan versi aktif, ditulis
+#   thread latar; termasuk baris dari cache (keputusan tetap dikirim ke klien).
+
+MODELS_ROOT = os.path.dirname(os.path.normpath(DEFAULT_MODEL_DIR))
+DEFAULT_VERSION = os.path.basename(os.path.normpath(DEFAULT_MODEL_DIR))
+
+REQUIRED_FILES = ['preprocessor.pkl', 'model_fraud_xgb.pkl']
+
+# Pilihan versi aktif/challenger yang dibagi antar worker (di dalam root model)
+SELECTION_FILENAME = 'selection.json'
+
+# Batas antrean shadow scoring; jika penuh, batch shadow dilewati (dicatat)
+MAX_SHADOW_PENDING = 8
+
+
+def version_key(version):
+    # Urutan natural: v0 < v1 < v1_2 < v2 < v10
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', version)]
+
+
+def normalize_metadata(raw, version):
+    metrics = raw.get('metrics', {})
+    return {
+        'version': version,
+        'optimal_threshold': raw.get('optimal_threshold'),
+        'feature_names': raw.get('feature_names'),
+        'input_columns': raw.get('input_columns'),
+        'metrics': {k: metrics.get(k) for k in ('accuracy', 'precision', 'recall', 'f1_score')},
+        'decision_policy': raw.get('decision_policy'),
+    }
+
+
+def _is_model_dir(path):
+    has_pickles = all(os.path.exists(os.path.join(path, f)) for f in REQUIRED_FILES) and any(
+        os.path.exists(os.path.join(path, f)) for f in ISO_FOREST_FILES
+    )
+    has_native = os.path.exists(os.path.join(path, 'native', 'manifest.json'))
+    return has_pickles or has_native
+
+
+def _signature(path):
+    # Perubahan file model di disk (mtime) memicu reload saat versi diakses lagi
+    mtimes = [os.path.getmtime(p) for p in glob.glob(os.path.join(path, '**', '*'), recursive=True)]
+    return max(mtimes, default=0.0)
+
+
+class ShadowStats:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset(None)
+
+    def reset(self, challenger):
+        with self.lock:
+            self.challenger = challenger
+            self.batches = 0
+            self.rows = 0
+            self.disagreements = 0
+            self.abs_diff_sum = 0.0
+            self.proba_rows = 0
+            self.dropped_batches = 0
+            self.errors = 0
+
+    def record(self, primary_decision, primary_proba, shadow_decision, shadow_proba):
+        with self.lock:
+            self.batches += 1
+            self.rows += len(primary_decision)
+            self.disagreements += int(np.sum(primary_decision != shadow_decision))
+            # Baris prefilter cascade (proba NaN) hanya dihitung untuk keputusan
+            diff = np.abs(primary_proba - shadow_proba)
+            self.abs_diff_sum += float(np.nansum(diff))
+            self.proba_rows += int(np.count_nonzero(~np.isnan(diff)))
+
+    def report(self):
+        with self.lock:
+            rows = max(self.rows, 1)
+            return {
+                'challenger': self.challenger,
+                'batches': self.batches,
+                'rows': self.rows,
+                'disagreement_rate': self.disagreements / rows,
+                'mean_abs_proba_diff': self.abs_diff_sum / max(self.proba_rows, 1),
+                'dropped_batches': self.dropped_batches,
+                'errors': self.errors,
+            }
+
+
+class ModelRegistry:
+
+    def __init__(self, root=MODELS_ROOT, active_version=DEFAULT_VERSION, max_loaded=2, prefer_native=True,
+                 cache=None, monitor=None, cascade=False, iso_budget=None,
+                 audit=None, challenger_version=None, selection_path=None):
+        self.root = root
+        self.selection_path = selection_path
+        self.max_loaded = max_loaded
+        self.prefer_native = prefer_native
+        self.cache = cache
+        self.monitor = monitor
+        self.cascade = cascade
+        self.iso_budget = iso_budget
+        self.audit = audit
+
+        self._lock = threading.RLock()
+        # Hot swap (POST) & watcher bergiliran: pilihan yang ditulis selalu yang terakhir diterapkan
+        self._swap_lock = threading.Lock()
+        self._loaded = OrderedDict()  # version -> (signature, assets)
+        self._versions = {}
+
+        # Satu atribut tuple: pembaca selalu melihat pasangan versi+assets yang konsisten
+        self._active = None
+        self._challenger = None
+        self.shadow = ShadowStats()
+        self._shadow_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='jaga-shadow')
+        self._shadow_pending = 0
+        self._stop = threading.Event()
+        self._watcher = None
+
+        self.refresh()
+        # File pilihan (hasil hot swap sebelumnya / worker lain) menang atas argumen
+        selection = self._read_selection()
+        if selection is not None:
+            active_version, challenger_version = selection
+        self._activate(active_version)
+        if challenger_version is not None:
+            self._set_challenger(challenger_version)
+
+    # ------------------------------------------
+    # Discovery & loading
+    # ------------------------------------------
+    def refresh(self):
+        versions = {}
+        for path in glob.glob(os.path.join(self.root, '*')):
+            if os.path.isdir(path) and _is_model_dir(path):
+                version = os.path.basename(path)
+                versions[version] = {
+                    'version': version,
+                    'path': path,
+                    'metadata': normalize_metadata(read_metadata(path), version),
+                }
+        with self._lock:
+            self._versions = versions
+        return self.versions()
+
+    def versions(self):
+        with self._lock:
+            return sorted(self._versions, key=version_key)
+
+    def describe(self, version):
+        with self._lock:
+            if version not in self._versions:
+                raise KeyError(f"Versi model '{version}' tidak ditemukan di {self.root}/")
+            return dict(self._versions[version])
+
+    def get(self, version, reload=False):
+        # Jalur request (reload=False) memakai pipeline yang sudah dimuat tanpa
+        # menyentuh disk; perubahan file (signature) hanya diperiksa oleh
+        # activate/set_challenger dan watcher (reload=True)
+        if not reload:
+            for pair in (self._active, self._challenger):
+                if pair is not None and pair[0] == version:
+                    return pair[1]
+            with self._lock:
+                cached = self._loaded.get(version)
+                if cached is not None:
+                    self._loaded.move_to_end(version)
+                    return cached[1]
+
+        info = self.describe(version)
+        signature = _signature(info['path'])
+        with self._lock:
+            cached = self._loaded.get(version)
+            if cached is not None and cached[0] == signature:
+                self._loaded.move_to_end(version)
+                return cached[1]
+
+        # Load di luar lock agar scoring versi lain tidak tertahan
+        assets = load_scoring_assets(info['path'], self.prefer_native)
+        assets['metrics'] = info['metadata']
+        assets['version'] = version
+        assets['model_tag'] = f'{version}@{signature}'
+        if self.cascade:
+            attach_cascade(assets, info['path'])
+        if self.iso_budget is not None and 'compiled' in assets:
+            set_tree_budget(assets, self.iso_budget)
+
+        with self._lock:
+            self._loaded[version] = (signature, assets)
+            self._loaded.move_to_end(version)
+            self._evict(keep=version)
+        return assets
+
+    def _evict(self, keep=None):
+        # Versi aktif & challenger tidak pernah dikeluarkan dari LRU
+        pinned = {pair[0] for pair in (self._active, self._challenger) if pair} | {keep}
+        for old in list(self._loaded):
+            if len(self._loaded) <= self.max_loaded:
+                break
+            if old not in pinned:
+                del self._loaded[old]
+
+    # ------------------------------------------
+    # Versi aktif & challenger
+    # ------------------------------------------
+    def activate(self, version):
+        # Model dimuat dulu; pointer aktif baru diganti setelah siap (atomik),
+        # lalu pilihan ditulis agar worker lain ikut
+        with self._swap_lock:
+            self._activate(version)
+            self._write_selection()
+        return version
+
+    def _activate(self, version):
+        assets = self.get(version, reload=True)
+        previous = self._active
+        self._active = (version, assets)
+        with self._lock:
+            self._evict()
+        if self.monitor is not None and (previous is None or previous[1] is not assets):
+            self.monitor.bind(version, assets['features'], load_baseline(self.describe(version)['path']))
+        return version
+
+    def active(self):
+        return self._active
+
+    @property
+    def active_version(self):
+        return self._active[0]
+
+    def set_challenger(self, version):
+        with self._swap_lock:
+            self._set_challenger(version)
+            self._write_selection()
+        return version
+
+    def _set_challenger(self, version):
+        if version is None:
+            self._challenger = None
+        else:
+            self._challenger = (version, self.get(version, reload=True))
+        with self._lock:
+            self._evict()
+        self.shadow.reset(version)
+        return version
+
+    @property
+    def challenger_version(self):
+        challenger = self._challenger
+        return challenger[0] if challenger else None
+
+    def _read_selection(self):
+        # -> (aktif, challenger) dari selection_path, atau None jika tidak ada / versi tidak dikenal
+        if self.selection_path is None or not os.path.exists(self.selection_path):
+            return None
+        try:
+            with open(self.selection_path, 'r') as f:
+                selection = json.load(f)
+        except ValueError:
+            return None
+        active, challenger = selection.get('active'), selection.get('challenger')
+        with self._lock:
+            if active not in self._versions or (challenger is not None and challenger not in self._versions):
+                return None
+        return active, challenger
+
+    def _write_selection(self):
+        if self.selection_path is None:
+            return
+        # Tulis ke file sementara lalu rename: worker lain tidak pernah membaca file setengah jadi
+        tmp_path = f'{self.selection_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'active': self.active_version, 'challenger': self.challenger_version}, f)
+        os.replace(tmp_path, self.selection_path)
+
+    # ------------------------------------------
+    # Scoring
+    # ------------------------------------------
+    def _score_matrix(self, assets, X):
+        # -> proba, anomaly_score, nama tahap keluar per baris ('model' tanpa cascade);
+        # hanya baris yang benar-benar diskor model dikirim ke monitor drift
+        cascade = assets.get('cascade')
+        if cascade is None:
+            proba, anomaly_score = score_matrix(assets, X)
+            stage = np.full(len(X), STAGES[-1])
+            model_rows = None
+        else:
+            proba, anomaly_score, stage_index = cascade.score_matrix(assets, X, return_stage=True)
+            stage = np.asarray(STAGES)[stage_index]
+            model_rows = np.flatnonzero(stage_index == len(STAGES) - 1)
+        if self.monitor is not None:
+            if model_rows is None:
+                self.monitor.submit(X, proba)
+            elif len(model_rows):
+                self.monitor.submit(X[model_rows], proba[model_rows])
+        return proba, anomaly_score, stage
+
+    def score_records(self, records):
+        # -> proba, anomaly_score, decision, versi, tahap keluar cascade per baris
+        start = time.perf_counter()
+        version, assets = self._active
+        if self.cache is None:
+            proba, anomaly_score, stage = self._score_matrix(assets, assets['features'].from_records(records))
+            scored = None
+        else:
+            proba, anomaly_score, stage, scored = self._score_cached(assets, records)
+        decision = decide(assets, proba)
+        if self.audit is not None:
+            self.audit.record('api', version, records, anomaly_score, proba, decision, stage)
+        if self._challenger is not None:
+            if scored is None:
+                self._submit_shadow(records, proba, decision)
+            elif scored:
+                # Hanya baris yang benar-benar dihitung model; retry tidak dihitung dua kali
+                self._submit_shadow([records[i] for i in scored], proba[scored], decision[scored])
+        METRICS.observe('request', start, len(records))
+        return proba, anomaly_score, decision, np.full(len(proba), version), stage
+
+    def _score_cached(self, assets, records):
+        # -> proba, anomaly_score, tahap, indeks baris yang tidak ada di cache (dihitung ulang).
+        # Hanya baris tahap 'model' yang disimpan, jadi hit cache selalu probabilitas model
+        cache = self.cache
+        cache.bind(assets['model_tag'])
+        keys = [cache_key(r, assets['model_tag']) for r in records]
+        cached = cache.get_many(keys)
+
+        proba = np.empty(len(records))
+        anomaly_score = np.empty(len(records))
+        stage = np.full(len(records), STAGES[-1], dtype=object)
+        missing = []
+        for i, entry in enumerate(cached):
+            if entry is None:
+                missing.append(i)
+            else:
+                proba[i], anomaly_score[i] = entry
+
+        if missing:
+            X = assets['features'].from_records([records[i] for i in missing])
+            missing_proba, missing_anomaly, missing_stage = self._score_matrix(assets, X)
+            proba[missing] = missing_proba
+            anomaly_score[missing] = missing_anomaly
+            stage[missing] = missing_stage
+            model_rows = np.flatnonzero(missing_stage == STAGES[-1])
+            if len(model_rows):
+                cache.put_many([keys[missing[i]] for i in model_rows], missing_proba[model_rows],
+                               missing_anomaly[model_rows])
+        return proba, anomaly_score, stage, missing
+
+    def explain_records(self, version, records, anomaly_score, approximate=False):
+        # Versi yang sama dengan yang menskor baris; anomaly_score dipakai ulang
+        assets = self.get(version)
+        if 'xgb_booster' not in assets and 'xgb_model' not in assets:
+            assets['xgb_booster'] = load_booster(self.describe(version)['path'])
+        return explain_records(assets, records, anomaly_score, approximate)
+
+    def _submit_shadow(self, records, primary_proba, primary_decision):
+        challenger = self._challenger
+        if challenger is None:
+            return
+        with self._lock:
+            if self._shadow_pending >= MAX_SHADOW_PENDING:
+                self.shadow.dropped_batches += 1
+                return
+            self._shadow_pending += 1
+        self._shadow_executor.submit(self._run_shadow, challenger, records, primary_proba, primary_decision)
+
+    def _run_shadow(self, challenger, records, primary_proba, primary_decision):
+        # Fitur dihitung ulang dengan preprocessor milik challenger
+        version, assets = challenger
+        # Waktu challenger tidak dicampur ke metrik tahap versi aktif
+        METRICS.suppress_thread()
+        try:
+            proba, _ = score_matrix(assets, assets['features'].from_records(records))
+            if self.challenger_version == version:
+                self.shadow.record(primary_decision, primary_proba, decide(assets, proba), proba)
+        except Exception:
+            with self.shadow.lock:
+                self.shadow.errors += 1
+        finally:
+            with self._lock:
+                self._shadow_pending -= 1
+
+    # ------------------------------------------
+    # Hot reload
+    # ------------------------------------------
+    def reload(self):
+        # Temukan versi baru, ikuti pilihan worker lain (selection_path) & muat
+        # ulang versi aktif/challenger jika filenya berubah
+        self.refresh()
+        with self._swap_lock:
+            selection = self._read_selection()
+            if selection is not None and selection[1] != self.challenger_version:
+                self._set_challenger(selection[1])
+            active_version = selection[0] if selection is not None else self.active_version
+            if active_version in self._versions:
+                self._activate(active_version)
+            challenger = self._challenger
+            if challenger is not None and challenger[0] in self._versions:
+                self._challenger = (challenger[0], self.get(challenger[0], reload=True))
+
+    def start_watcher(self, interval=5.0):
+        def watch():
+            while not self._stop.wait(interval):
+                try:
+                    self.reload()
+                except Exception:
+                    # Folder sedang ditulis ulang: coba lagi di interval berikutnya
+                    pass
+
+        self._watcher = threading.Thread(target=watch, name='jaga-registry-watcher', daemon=True)
+        self._watcher.start()
+
+    def status(self):
+        return {
+            'root': self.root,
+            'versions': self.versions(),
+            'active': self.active_version,
+            'challenger': self.challenger_version,
+            'selection_path': self.selection_path,
+            'loaded': list(self._loaded),
+            'policy': self._active[1]['policy'].to_dict(),
+            'shadow': self.shadow.report(),
+            'cache': self.cache.stats() if self.cache is not None else None,
+            'drift': self.monitor.status(include_report=False) if self.monitor is not None else None,
+            'cascade': self._active[1]['cascade'].stats() if 'cascade' in self._active[1] else None,
+            'iso_budget': self.iso_budget.to_dict() if self.iso_budget is not None else None,
+            'audit': self.audit.stats() if self.audit is not None else None,
+        }
+
+    def close(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+        self._shadow_executor.shutdown(wait=True)
+        if self.cache is not None:
+            self.cache.close()
+        if self.monitor is not None:
+            self.monitor.close()
+        if self.audit is not None:
+            self.audit.close()
@@ -0,0 +1,352 @@
+import asyncio
+import json
+import os
+import sys
+from urllib.parse import parse_qs
+
+from jaga.anomaly import TreeBudget
+from jaga.audit import AuditLog
+from jaga.cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS, ScoreCache, SharedScoreCache
+from jaga.coalescer import DEFAULT_MAX_BATCH, MicroBatcher
+from jaga.drift import DEFAULT_INTERVAL, DriftMonitor
+from jaga.explain import EXPLAIN_DECISIONS
+from jaga.metrics import METRICS
+from jaga.pipeline import validate_record
+from jaga.registry import DEFAULT_VERSION, MODELS_ROOT, SELECTION_FILENAME, ModelRegistry
+
+# ==========================================
+# SCORING SERVICE (ASGI)
+# ==========================================
+# Jalankan dengan:
+#   uvicorn jaga.server:app --host 127.0.0.1 --port 8000 --workers 4
+#
+# Setiap worker memuat preprocessor, iso_forest_layer & model_fraud_xgb SATU kali
+# (saat lifespan startup). Tidak ada rerun script, base64 logo, atau time.sleep
+# seperti di halaman Streamlit. Jika models/vX/native/ tersedia (python -m
+# jaga.artifacts), model dibuka memory-mapped tanpa pickle; JAGA_NATIVE=0
+# memaksa memakai pickle.
+#
+# Endpoint:
+#   POST /score             -> body: 1 objek transaksi atau array transaksi (JSON)
+#        ?explain=K         -> + K fitur dengan kontribusi TreeSHAP terbesar (baris review/block)
+#        &approximate=1     -> kontribusi Saabas (lebih murah dari TreeSHAP exact)
+#   GET  /health            -> status & versi model aktif
+#   GET  /models            -> daftar versi, versi aktif/challenger, statistik shadow & cache
+#   POST /models/active     -> {"version": "v1"}: ganti versi aktif tanpa restart
+#   POST /models/challenger -> {"version": "v1"} atau {"version": null}: shadow scoring
+#   GET  /metrics           -> metrik per tahap (format teks Prometheus, ?format=json untuk dict)
+#   GET  /drift             -> laporan drift terakhir, alert & status monitor
+#
+# Versi model:
+#   JAGA_MODELS_ROOT=models JAGA_MODEL_VERSION=v1_2 JAGA_CHALLENGER=v1 uvicorn jaga.server:app ...
+# Folder model dipantau tiap JAGA_RELOAD_SECONDS detik (0 = nonaktif).
+# POST /models/active & /models/challenger hanya mengganti worker yang menerima
+# request; pilihannya ditulis ke JAGA_MODELS_ROOT/selection.json dan worker lain
+# mengikutinya di putaran watcher berikutnya. File ini menang atas
+# JAGA_MODEL_VERSION/JAGA_CHALLENGER saat start (hapus untuk kembali ke env).
+# Dengan JAGA_RELOAD_SECONDS=0 tidak ada sinkronisasi: pakai --workers 1.
+#
+# Micro-batching (opsional, per worker):
+#   JAGA_MAX_WAIT_MS=2 JAGA_MAX_BATCH=256 uvicorn jaga.server:app ...
+# Request yang datang bersamaan digabung menjadi satu panggilan model.
+#
+# Cache hasil scoring untuk retry/duplikat (jaga/cache.py):
+#   JAGA_CACHE_SIZE=100000 JAGA_CACHE_TTL=300   (JAGA_CACHE_SIZE=0 menonaktifkan)
+#   JAGA_CACHE_PATH=/tmp/jaga_cache.sqlite      (dibagi antar worker; default per proses)
+#
+# Monitor drift (jaga/drift.py), dibandingkan dengan models/vX/drift_baseline.json:
+#   JAGA_DRIFT=1 JAGA_DRIFT_INTERVAL=60   (JAGA_DRIFT=0 menonaktifkan)
+# Alert ditulis ke stderr sebagai satu baris JSON dan diekspor di /metrics.
+#
+# Cascade (jaga/cascade.py): JAGA_CASCADE=1 melewati baris yang jelas aman
+# (tipe di luar gate, allow_rules, prefilter) sebelum model lengkap; pass-through
+# per tahap di GET /models. Baris yang dilewati mendapat anomaly_score null
+# (probability 0 untuk type_gate/rules, null untuk prefilter) dan
+# field stage = tahap keluarnya (type_gate/rules/prefilter; 'model' untuk yang
+# diskor model), serta tidak dihitung oleh monitor drift.
+#
+# Mode pohon terbatas Isolation Forest (jaga/anomaly.py): JAGA_ISO_MIN_TREES=20
+# menghentikan baris yang jelas jauh dari batas anomali setelah >= 20 pohon
+# (0 = semua pohon, default; hanya untuk format native).
+#
+# Audit log (jaga/audit.py, opt-in): JAGA_AUDIT_DIR=audit menulis setiap keputusan
+# lewat thread latar ke audit/date=YYYY-MM-DD/*.parquet; tanpa JAGA_AUDIT_DIR
+# (default) tidak ada yang ditulis ke disk. Statistik di GET /models.
+# Query: python -m jaga.audit audit/
+#
+# Penjelasan (jaga/explain.py): JAGA_EXPLAIN_DECISIONS=review,block menentukan
+# keputusan mana yang dijelaskan saat ?explain=K (tambahkan allow untuk semua baris).
+
+MODELS_ROOT = os.environ.get('JAGA_MODELS_ROOT', MODELS_ROOT)
+MODEL_VERSION = os.environ.get('JAGA_MODEL_VERSION', DEFAULT_VERSION)
+CHALLENGER_VERSION = os.environ.get('JAGA_CHALLENGER') or None
+RELOAD_SECONDS = float(os.environ.get('JAGA_RELOAD_SECONDS', 5))
+PREFER_NATIVE = os.environ.get('JAGA_NATIVE', '1') != '0'
+MAX_WAIT_MS = float(os.environ.get('JAGA_MAX_WAIT_MS', 0))
+MAX_BATCH = int(os.environ.get('JAGA_MAX_BATCH', DEFAULT_MAX_BATCH))
+CACHE_SIZE = int(os.environ.get('JAGA_CACHE_SIZE', DEFAULT_MAX_ENTRIES))
+CACHE_TTL = float(os.environ.get('JAGA_CACHE_TTL', DEFAULT_TTL_SECONDS))
+CACHE_PATH = os.environ.get('JAGA_CACHE_PATH') or None
+DRIFT_ENABLED = os.environ.get('JAGA_DRIFT', '1') != '0'
+DRIFT_INTERVAL = float(os.environ.get('JAGA_DRIFT_INTERVAL', DEFAULT_INTERVAL))
+CASCADE_ENABLED = os.environ.get('JAGA_CASCADE', '0') == '1'
+ISO_MIN_TREES = int(os.environ.get('JAGA_ISO_MIN_TREES', 0))
+AUDIT_DIR = os.environ.get('JAGA_AUDIT_DIR') or None
+EXPLAIN_FOR = tuple(os.environ.get('JAGA_EXPLAIN_DECISIONS', ','.join(EXPLAIN_DECISIONS)).split(','))
+
+# Target latensi per request 1 transaksi (diukur dengan benchmarks/loadtest.py)
+P50_TARGET_MS = 25.0
+P99_TARGET_MS = 50.0
+
+_registry = None
+_batcher = None
+
+
+def make_cache():
+    if CACHE_SIZE <= 0:
+        return None
+    if CACHE_PATH:
+        return SharedScoreCache(CACHE_PATH, CACHE_SIZE, CACHE_TTL)
+    return ScoreCache(CACHE_SIZE, CACHE_TTL)
+
+
+def log_drift_alert(report):
+    print(json.dumps({'drift_alert': report['alerts'], 'version': report['version'], 'rows': report['rows']}),
+          file=sys.stderr, flush=True)
+
+
+def make_monitor():
+    if not DRIFT_ENABLED:
+        return None
+    return DriftMonitor(DRIFT_INTERVAL, on_alert=log_drift_alert)
+
+
+def make_audit():
+    return AuditLog(AUDIT_DIR) if AUDIT_DIR else None
+
+
+def get_registry():
+    global _registry
+    if _registry is None:
+        _registry = ModelRegistry(MODELS_ROOT, MODEL_VERSION, prefer_native=PREFER_NATIVE, cache=make_cache(),
+                                  monitor=make_monitor(), cascade=CASCADE_ENABLED,
+                                  iso_budget=TreeBudget(ISO_MIN_TREES) if ISO_MIN_TREES > 0 else None,
+                                  audit=make_audit(), challenger_version=CHALLENGER_VERSION,
+                                  selection_path=os.path.join(MODELS_ROOT, SELECTION_FILENAME))
+        if RELOAD_SECONDS > 0:
+            _registry.start_watcher(RELOAD_SECONDS)
+    return _registry
+
+
+def get_batcher():
+    global _batcher
+    if _batcher is None and MAX_WAIT_MS > 0:
+        _batcher = MicroBatcher(get_registry().score_records, MAX_WAIT_MS, MAX_BATCH)
+    return _batcher
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def parse_transactions(body):
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise BadRequest(f"JSON tidak valid: {e}")
+
+    single = isinstance(payload, dict)
+    records = [payload] if single else payload
+    if not isinstance(records, list) or not records:
+        raise BadRequest("Body harus berupa objek transaksi atau array transaksi.")
+
+    for i, record in enumerate(records):
+        error = validate_record(record)
+        if error:
+            raise BadRequest(f"Elemen ke-{i}: {error}")
+    return records, single
+
+
+def parse_version(body, allow_none=False):
+    # Body {"version": "v1"}; {"version": null} hanya untuk challenger (matikan shadow)
+    try:
+        version = json.loads(body)['version']
+    except (ValueError, KeyError, TypeError) as e:
+        raise BadRequest(f"Body harus berupa {{\"version\": ...}}: {e}")
+    if version is None and allow_none:
+        return None
+    if not isinstance(version, str):
+        raise BadRequest("Versi tidak valid: version harus string.")
+    return version
+
+
+def parse_explain(query_string):
+    # -> (top_k, approximate); top_k 0 = tanpa penjelasan
+    query = parse_qs(query_string.decode('latin-1'))
+    try:
+        top_k = int(query.get('explain', ['0'])[0])
+    except ValueError:
+        raise BadRequest("Parameter explain harus bilangan bulat.")
+    approximate = query.get('approximate', ['0'])[0] in ('1', 'true')
+    return max(top_k, 0), approximate
+
+
+def explain_outputs(records, outputs, top_k, approximate):
+    # Hanya baris dengan keputusan di EXPLAIN_FOR; baris lain mendapat None
+    _, anomaly_score, decision, version, _ = outputs
+    explanations = [None] * len(records)
+    rows = [i for i, d in enumerate(decision) if d in EXPLAIN_FOR]
+    for v in sorted({str(version[i]) for i in rows}):
+        subset = [i for i in rows if version[i] == v]
+        explanation = get_registry().explain_records(
+            v, [records[i] for i in subset], anomaly_score[subset], approximate
+        )
+        for i, items in zip(subset, explanation.to_records(top_k)):
+            explanations[i] = items
+    return explanations
+
+
+def format_results(single, outputs, explanations=None):
+    # stage: tahap keluar cascade; probability 0 untuk type_gate/rules dan null
+    # untuk prefilter (hanya batas atas yang diketahui, keputusan tetap allow)
+    proba, anomaly_score, decision, version, stage = outputs
+    results = [
+        {'probability': float(p) if p == p else None, 'anomaly_score': float(s) if s == s else None, 'decision': str(d),
+         'model_version': str(v), 'stage': str(st)}
+        for p, s, d, v, st in zip(proba, anomaly_score, decision, version, stage)
+    ]
+    if explanations is not None:
+        for result, items in zip(results, explanations):
+            result['explanation'] = items
+    return results[0] if single else results
+
+
+def score_payload(body, top_k=0, approximate=False):
+    records, single = parse_transactions(body)
+    outputs = get_registry().score_records(records)
+    explanations = explain_outputs(records, outputs, top_k, approximate) if top_k else None
+    return format_results(single, outputs, explanations)
+
+
+async def score_payload_async(body, top_k=0, approximate=False):
+    # Inferensi tidak pernah dijalankan di event loop: tanpa batcher seluruh request
+    # diskor di thread pool, dengan batcher di thread MicroBatcher
+    loop = asyncio.get_running_loop()
+    batcher = get_batcher()
+    if batcher is None:
+        return await loop.run_in_executor(None, score_payload, body, top_k, approximate)
+    records, single = parse_transactions(body)
+    outputs = await asyncio.wrap_future(batcher.submit(records))
+    explanations = None
+    if top_k:
+        explanations = await loop.run_in_executor(None, explain_outputs, records, outputs, top_k, approximate)
+    return format_results(single, outputs, explanations)
+
+
+async def _read_body(receive):
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+    return body
+
+
+async def _send_body(send, status, body, content_type):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', content_type),
+            (b'content-length', str(len(body)).encode()),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _send_json(send, status, data):
+    await _send_body(send, status, json.dumps(data).encode(), b'application/json')
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            try:
+                get_registry()
+                get_batcher()
+            except Exception as e:
+                await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                return
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            if _batcher is not None:
+                _batcher.close()
+            if _registry is not None:
+                _registry.close()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    path, method = scope['path'], scope['method']
+    if path == '/score':
+        if method != 'POST':
+            await _send_json(send, 405, {'error': "Gunakan POST."})
+            return
+        body = await _read_body(receive)
+        try:
+            top_k, approximate = parse_explain(scope.get('query_string', b''))
+            result = await score_payload_async(body, top_k, approximate)
+        except BadRequest as e:
+            await _send_json(send, 400, {'error': str(e)})
+            return
+        await _send_json(send, 200, result)
+    elif path == '/health':
+        await _send_json(send, 200, {'status': 'ok', 'model_version': get_registry().active_version})
+    elif path == '/models':
+        await _send_json(send, 200, get_registry().status())
+    elif path == '/metrics':
+        monitor = get_registry().monitor
+        if b'format=json' in scope.get('query_string', b''):
+            await _send_json(send, 200, METRICS.snapshot())
+        else:
+            text = METRICS.to_prometheus() + (monitor.to_prometheus() if monitor is not None else '')
+            await _send_body(send, 200, text.encode(), b'text/plain; version=0.0.4')
+    elif path == '/drift':
+        monitor = get_registry().monitor
+        if monitor is None:
+            await _send_json(send, 404, {'error': "Monitor drift nonaktif (JAGA_DRIFT=0)."})
+        else:
+            await _send_json(send, 200, monitor.status())
+    elif path in ('/models/active', '/models/challenger'):
+        if method != 'POST':
+            await _send_json(send, 405, {'error': "Gunakan POST."})
+            return
+        try:
+            version = parse_version(await _read_body(receive), allow_none=path == '/models/challenger')
+        except BadRequest as e:
+            await _send_json(send, 400, {'error': str(e)})
+            return
+        registry = get_registry()
+        switch = registry.activate if path == '/models/active' else registry.set_challenger
+        try:
+            # Memuat model (pickle/native) butuh waktu: jangan tahan event loop
+            await asyncio.get_running_loop().run_in_executor(None, switch, version)
+        except KeyError as e:
+            await _send_json(send, 400, {'error': f"Versi tidak valid: {e}"})
+            return
+        except Exception as e:
+            # Folder model ada tetapi rusak/tidak lengkap: versi lama tetap dipakai
+            await _send_json(send, 500, {'error': f"Gagal memuat versi {version}: {type(e).__name__}: {e}"})
+            return
+        await _send_json(send, 200, registry.status())
+    else:
+        await _send_json(send, 404, {'error': "Endpoint tidak ditemukan."})
@@ -0,0 +1,343 @@
+import argparse
+import json
+import os
+import queue
+import select
+import signal
+import socket
+import sys
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from jaga.pipeline import DEFAULT_MODEL_DIR, load_scoring_assets, score_records, validate_record
+from jaga.graph import GRAPH_COLUMNS, AccountGraph
+from jaga.velocity import VELOCITY_COLUMNS, VelocityStore
+
+# ==========================================
+# STREAMING SCORER (NDJSON)
+# ==========================================
+# Sumber transaksi (satu objek JSON per baris):
+#   cat transaksi.ndjson | python -m jaga.stream --stdin
+#   python -m jaga.stream --file feed.ndjson --follow          (seperti tail -f)
+#   python -m jaga.stream --socket 127.0.0.1:9900              (klien TCP mengirim NDJSON)
+#
+# Alur: reader -> antrean terbatas -> scorer (window count/waktu) -> antrean
+# terbatas -> writer. Jika writer/downstream lambat, antrean penuh dan reader
+# berhenti membaca (backpressure), sehingga memori tetap terbatas. Hasil keluar
+# sesuai urutan input; baris rusak diganti objek {"error": ...} di posisinya.
+
+DEFAULT_WINDOW_ROWS = 512
+DEFAULT_WINDOW_MS = 50.0
+DEFAULT_MAX_PENDING = 10_000
+
+_END = object()
+
+
+# ------------------------------------------
+# Sumber input
+# ------------------------------------------
+def iter_lines_file(path, follow=False, poll_seconds=0.1, stop=None):
+    with open(path, 'r') as f:
+        buffer = ''
+        while stop is None or not stop.is_set():
+            line = f.readline()
+            if not line:
+                if not follow:
+                    break
+                time.sleep(poll_seconds)
+                continue
+            buffer += line
+            if buffer.endswith('\n'):
+                yield buffer
+                buffer = ''
+        if buffer:
+            yield buffer
+
+
+def _iter_lines(read, stop=None):
+    # read() -> bytes (b'' = EOF) atau None jika belum ada data; stop diperiksa
+    # di antara pembacaan sehingga sumber yang sepi tetap bisa dihentikan
+    buffer = b''
+    while stop is None or not stop.is_set():
+        chunk = read()
+        if chunk is None:
+            continue
+        if not chunk:
+            break
+        buffer += chunk
+        if b'\n' in chunk:
+            *lines, buffer = buffer.split(b'\n')
+            for line in lines:
+                yield line.decode('utf-8', errors='replace') + '\n'
+    if buffer:
+        yield buffer.decode('utf-8', errors='replace')
+
+
+def iter_lines_stdin(stop=None, poll_seconds=0.1):
+    # select + os.read (bukan sys.stdin) agar SIGTERM tidak tertahan readline
+    fd = sys.stdin.fileno()
+
+    def read():
+        ready, _, _ = select.select([fd], [], [], poll_seconds)
+        return os.read(fd, 1 << 16) if ready else None
+
+    yield from _iter_lines(read, stop)
+
+
+def iter_lines_socket(conn, stop=None, poll_seconds=0.1):
+    conn.settimeout(poll_seconds)
+
+    def read():
+        try:
+            return conn.recv(1 << 16)
+        except socket.timeout:
+            return None
+
+    yield from _iter_lines(read, stop)
+
+
+class StreamStats:
+    # Throughput & lag end-to-end (lag disimpan di ring buffer terbatas)
+
+    def __init__(self, lag_samples=10_000):
+        self.lock = threading.Lock()
+        self.start = time.perf_counter()
+        self.rows = 0
+        self.errors = 0
+        self.windows = 0
+        self.lags = deque(maxlen=lag_samples)
+
+    def record(self, n_rows, n_errors, lags):
+        with self.lock:
+            self.rows += n_rows
+            self.errors += n_errors
+            self.windows += 1
+            self.lags.extend(lags)
+
+    def snapshot(self):
+        with self.lock:
+            elapsed = time.perf_counter() - self.start
+            lags_ms = np.array(self.lags) * 1000
+            return {
+                'rows': self.rows,
+                'errors': self.errors,
+                'windows': self.windows,
+                'seconds': elapsed,
+                'rows_per_sec': self.rows / elapsed if elapsed > 0 else 0.0,
+                'lag_p50_ms': float(np.percentile(lags_ms, 50)) if len(lags_ms) else None,
+                'lag_p99_ms': float(np.percentile(lags_ms, 99)) if len(lags_ms) else None,
+            }
+
+
+class StreamScorer:
+
+    def __init__(self, assets, write, window_rows=DEFAULT_WINDOW_ROWS, window_ms=DEFAULT_WINDOW_MS,
+                 max_pending=DEFAULT_MAX_PENDING, velocity=None, graph=None):
+        self.assets = assets
+        # VelocityStore & AccountGraph opsional; hanya diakses dari thread scorer
+        self.velocity = velocity
+        self.graph = graph
+        self.write = write
+        self.window_rows = window_rows
+        self.window_seconds = window_ms / 1000.0
+
+        # Dua antrean terbatas = sumber backpressure
+        self.inbox = queue.Queue(maxsize=max_pending)
+        self.outbox = queue.Queue(maxsize=max(2, max_pending // window_rows))
+        self.stats = StreamStats()
+        self._threads = []
+
+    # ------------------------------------------
+    # Reader
+    # ------------------------------------------
+    def feed(self, lines):
+        # Memblokir saat inbox penuh -> sumber tidak dibaca lebih lanjut
+        for line in lines:
+            if line.strip():
+                self.inbox.put((time.perf_counter(), line))
+
+    def finish(self):
+        self.inbox.put(_END)
+
+    # ------------------------------------------
+    # Scorer & writer
+    # ------------------------------------------
+    def _next_window(self):
+        first = self.inbox.get()
+        if first is _END:
+            return None, True
+        window = [first]
+        deadline = time.perf_counter() + self.window_seconds
+        while len(window) < self.window_rows:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self.inbox.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _END:
+                return window, True
+            window.append(item)
+        return window, False
+
+    def _score_window(self, window):
+        results = [None] * len(window)
+        valid_idx, valid_records = [], []
+        for i, (_, line) in enumerate(window):
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                results[i] = {'error': f"JSON tidak valid: {e}"}
+                continue
+            error = validate_record(record)
+            if error:
+                results[i] = {'error': error}
+                continue
+            valid_idx.append(i)
+            valid_records.append(record)
+
+        if valid_records:
+            proba, anomaly_score, decision = score_records(self.assets, valid_records)
+            for i, record, p, s, d in zip(valid_idx, valid_records, proba, anomaly_score, decision):
+                results[i] = {**record, 'probability': float(p), 'anomaly_score': float(s), 'decision': str(d)}
+            if self.velocity is not None:
+                self._add_account_features(self.velocity, VELOCITY_COLUMNS, results, valid_idx, valid_records)
+            if self.graph is not None:
+                self._add_account_features(self.graph, GRAPH_COLUMNS, results, valid_idx, valid_records)
+        return results
+
+    def _add_account_features(self, store, columns, results, valid_idx, valid_records):
+        # Hanya transaksi yang membawa nameOrig & nameDest
+        keyed = [(i, r) for i, r in zip(valid_idx, valid_records) if 'nameOrig' in r and 'nameDest' in r]
+        if not keyed:
+            return
+        values = store.update_records([r for _, r in keyed])
+        for (i, _), row in zip(keyed, values.tolist()):
+            results[i].update(zip(columns, row))
+
+    def _scorer_loop(self):
+        # Error tak terduga hanya menggagalkan satu window; _END selalu dikirim
+        # agar writer & join() tidak menunggu selamanya
+        done = False
+        try:
+            while not done:
+                window, done = self._next_window()
+                if window:
+                    try:
+                        results = self._score_window(window)
+                    except Exception as e:
+                        results = [{'error': f"Gagal menskor window: {type(e).__name__}: {e}"}] * len(window)
+                    self.outbox.put((window, results))
+        finally:
+            self.outbox.put(_END)
+
+    def _writer_loop(self):
+        while True:
+            item = self.outbox.get()
+            if item is _END:
+                return
+            window, results = item
+            self.write(''.join(json.dumps(r) + '\n' for r in results))
+            now = time.perf_counter()
+            n_errors = sum('error' in r for r in results)
+            self.stats.record(len(results) - n_errors, n_errors, [now - t_in for t_in, _ in window])
+
+    def start(self):
+        for target, name in ((self._scorer_loop, 'jaga-stream-scorer'), (self._writer_loop, 'jaga-stream-writer')):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+
+
+def serve_socket(scorer, host, port, stop):
+    # Tiap koneksi TCP dibaca di thread sendiri; semuanya masuk inbox yang sama.
+    # Saat stop: listener ditutup dan semua thread koneksi ditunggu selesai, jadi
+    # tidak ada record yang masuk setelah scorer.finish()
+    server = socket.create_server((host, port))
+    server.settimeout(0.5)
+    handlers = []
+    while not stop.is_set():
+        try:
+            conn, _ = server.accept()
+        except socket.timeout:
+            continue
+
+        def handle(conn=conn):
+            with conn:
+                scorer.feed(iter_lines_socket(conn, stop))
+
+        thread = threading.Thread(target=handle, daemon=True)
+        thread.start()
+        handlers = [t for t in handlers if t.is_alive()] + [thread]
+    server.close()
+    for thread in handlers:
+        thread.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming scorer JAGA untuk feed NDJSON")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--stdin', action='store_true')
+    source.add_argument('--file')
+    source.add_argument('--socket', help="host:port untuk listener TCP lokal")
+    parser.add_argument('--follow', action='store_true', help="Terus membaca file yang bertambah (tail -f)")
+    parser.add_argument('--output', default='-', help="File hasil NDJSON (default stdout)")
+    parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR)
+    parser.add_argument('--window-rows', type=int, default=DEFAULT_WINDOW_ROWS)
+    parser.add_argument('--window-ms', type=float, default=DEFAULT_WINDOW_MS)
+    parser.add_argument('--max-pending', type=int, default=DEFAULT_MAX_PENDING)
+    parser.add_argument('--report-seconds', type=float, default=10.0)
+    parser.add_argument('--velocity', action='store_true',
+                        help="Tambahkan fitur velocity per akun (butuh nameOrig/nameDest)")
+    parser.add_argument('--velocity-window', type=int, default=24, help="Window velocity dalam step (jam)")
+    parser.add_argument('--graph', action='store_true',
+                        help="Tambahkan fitur graf akun pengirim -> penerima (butuh nameOrig/nameDest)")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w')
+    velocity = VelocityStore(window_steps=args.velocity_window) if args.velocity else None
+    graph = AccountGraph() if args.graph else None
+    scorer = StreamScorer(load_scoring_assets(args.model_dir), out.write,
+                          args.window_rows, args.window_ms, args.max_pending, velocity, graph)
+    scorer.start()
+
+    stop = threading.Event()
+    # SIGTERM (mis. dari supervisor): berhenti menerima input, kosongkan antrean, lalu keluar
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    def report():
+        while not stop.wait(args.report_seconds):
+            print(json.dumps(scorer.stats.snapshot()), file=sys.stderr, flush=True)
+
+    threading.Thread(target=report, daemon=True).start()
+
+    try:
+        if args.stdin:
+            scorer.feed(iter_lines_stdin(stop))
+        elif args.file:
+            scorer.feed(iter_lines_file(args.file, args.follow, stop=stop))
+        else:
+            host, port = args.socket.rsplit(':', 1)
+            serve_socket(scorer, host, int(port), stop)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        scorer.finish()
+        scorer.join()
+        out.flush()
+        print(json.dumps(scorer.stats.snapshot()), file=sys.stderr)
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# DATA SINTETIS BERPOLA PAYSIM
+# ==========================================
+# Komposisi tipe & jumlah fraud PaySim asli (6.3 juta baris). Konstanta ini
+# juga cadangan angka halaman "Tentang Dataset" selama versi model belum punya
+# dataset_stats.json (jaga/eda.py). Dipakai untuk benchmark & load test lokal,
+# bukan untuk training.
+
+PAYSIM_TYPE_COUNTS = {
+    'CASH_OUT': 2237500,
+    'TRANSFER': 532909,
+    'PAYMENT': 2151495,
+    'CASH_IN': 1399284,
+    'DEBIT': 41432,
+}
+PAYSIM_FRAUD_COUNTS = {
+    'CASH_OUT': 4116,
+    'TRANSFER': 4097,
+    'PAYMENT': 0,
+    'CASH_IN': 0,
+    'DEBIT': 0,
+}
+PAYSIM_STEPS = 744
+
+
+def make_transactions(n, seed=0, fraud_scale=1.0):
+    # fraud_scale > 1 memperbanyak fraud (berguna untuk uji recall)
+    rng = np.random.default_rng(seed)
+    types = np.array(list(PAYSIM_TYPE_COUNTS))
+    counts = np.array([PAYSIM_TYPE_COUNTS[t] for t in types], dtype=float)
+    fraud_rate = np.array([PAYSIM_FRAUD_COUNTS[t] for t in types]) / counts
+
+    type_idx = rng.choice(len(types), size=n, p=counts / counts.sum())
+    tx_type = types[type_idx]
+    is_fraud = rng.random(n) < np.minimum(fraud_rate[type_idx] * fraud_scale, 1.0)
+
+    step = rng.integers(1, PAYSIM_STEPS + 1, size=n)
+    amount = np.round(rng.lognormal(11.0, 1.4, size=n), 2)
+    old_org = np.round(rng.lognormal(10.0, 2.5, size=n) * (rng.random(n) > 0.3), 2)
+    old_dest = np.round(rng.lognormal(12.0, 2.0, size=n) * (rng.random(n) > 0.4), 2)
+
+    # Transaksi normal: saldo bergerak sesuai nominal
+    is_cash_in = tx_type == 'CASH_IN'
+    new_org = np.where(is_cash_in, old_org + amount, np.maximum(old_org - amount, 0.0))
+    new_dest = np.where(is_cash_in, np.maximum(old_dest - amount, 0.0), old_dest + amount)
+    # Merchant (PAYMENT) di PaySim tidak mencatat saldo penerima
+    is_payment = tx_type == 'PAYMENT'
+    old_dest = np.where(is_payment, 0.0, old_dest)
+    new_dest = np.where(is_payment, 0.0, new_dest)
+
+    # Pola fraud: saldo pengirim dikuras habis, saldo penerima tidak bergerak
+    amount = np.where(is_fraud, np.maximum(old_org, amount), amount)
+    old_org = np.where(is_fraud, amount, old_org)
+    new_org = np.where(is_fraud, 0.0, new_org)
+    new_dest = np.where(is_fraud & (tx_type == 'TRANSFER'), old_dest, new_dest)
+
+    orig_id = rng.integers(0, max(n // 2, 1), size=n)
+    dest_id = rng.integers(0, max(n // 4, 1), size=n)
+    dest_prefix = np.where(is_payment, 'M', 'C')
+
+    return pd.DataFrame({
+        'step': step,
+        'type': tx_type,
+        'amount': amount,
+        'nameOrig': np.char.add('C', orig_id.astype(str)),
+        'oldbalanceOrg': old_org,
+        'newbalanceOrig': new_org,
+        'nameDest': np.char.add(dest_prefix, dest_id.astype(str)),
+        'oldbalanceDest': old_dest,
+        'newbalanceDest': new_dest,
+        'isFraud': is_fraud.astype(int),
+    })
@@ -0,0 +1,358 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from jaga.batch import iter_chunks
+from jaga.drift import DriftStats, QuantileSketches, save_baseline
+from jaga.eda import DatasetStats, save_stats
+from jaga.features import RAW_NUMERIC_COLUMNS, FastFeatures
+from jaga.pipeline import RAW_COLUMNS, add_features, load_pipeline, score_model
+from jaga.policy import ProbabilityHistogram
+
+# ==========================================
+# RETRAINING OUT-OF-CORE (FILE TRANSAKSI BESAR)
+# ==========================================
+# Membuat folder models/vX lengkap dari file transaksi berlabel berukuran bebas:
+#
+#   python -m jaga.train paysim.csv --output models/v2
+#
+# File dibaca per chunk dalam tiga pass; memori puncak hanya bergantung pada
+# chunksize, ukuran reservoir & jumlah bucket sketch, bukan jumlah baris:
+#
+#   1. statistik : split train/validasi per baris (seed tetap), sketch kuantil
+#                  kolom numerik per tipe (RobustScaler), reservoir sample untuk
+#                  Isolation Forest, statistik EDA (dataset_stats.json)
+#   2. xgboost   : iterator chunk -> ExtMemQuantileDMatrix (cache di disk),
+#                  tree_method=hist, semua core
+#   3. validasi  : histogram probabilitas per label -> optimal_threshold (F1
+#                  maksimum) & metrik; baseline drift (drift_baseline.json)
+#
+# Secara default hanya tipe yang pernah fraud (TRANSFER & CASH_OUT di PaySim) yang
+# dipakai training, sama seperti model di models/v0..v1_2 (one-hot hanya dua
+# kategori); --all-types memakai semua tipe. Hyperparameter default = v1_2.
+#
+# Hasil: preprocessor.pkl, iso_forest_layer.pkl, model_fraud_xgb.pkl,
+# model_metadata.json (feature_names, optimal_threshold, metrics), native/
+# (jaga/artifacts.py), dataset_stats.json & drift_baseline.json.
+
+NUMERIC_COLUMNS = [
+    'amount', 'oldbalanceOrg', 'newbalanceOrig',
+    'oldbalanceDest', 'newbalanceDest', 'step',
+    'errorBalanceOrig', 'errorBalanceDest', 'hour',
+]
+LABEL_COLUMN = 'isFraud'
+
+DEFAULT_CHUNKSIZE = 200_000
+DEFAULT_VALIDATION = 0.2
+DEFAULT_RESERVOIR = 200_000
+DEFAULT_SEED = 42
+
+XGB_PARAMS = {
+    'objective': 'binary:logistic',
+    'eval_metric': 'aucpr',
+    'tree_method': 'hist',
+    'max_depth': 4,
+    'learning_rate': 0.1,
+    'subsample': 0.7,
+    'colsample_bytree': 0.8,
+    'max_bin': 256,
+}
+XGB_ROUNDS = 100
+ISO_PARAMS = {'n_estimators': 100, 'contamination': 0.01, 'max_samples': 'auto'}
+
+
+def validation_mask(chunk_index, n, fraction, seed):
+    # Deterministik per (seed, chunk): tiap pass memilih baris validasi yang sama
+    return np.random.default_rng([seed, chunk_index]).random(n) < fraction
+
+
+class Reservoir:
+    # Sampel acak seragam berukuran tetap dari aliran baris (algoritma R, per chunk)
+
+    def __init__(self, size, seed):
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.raw = np.empty((size, len(RAW_NUMERIC_COLUMNS)))
+        self.types = np.empty(size, dtype=object)
+        self.seen = 0
+
+    def update(self, raw, types):
+        n = len(raw)
+        position = self.seen + np.arange(n)
+        slot = np.where(position < self.size, position, self.rng.integers(0, position + 1))
+        keep = slot < self.size
+        self.raw[slot[keep]] = raw[keep]
+        self.types[slot[keep]] = types[keep]
+        self.seen += n
+
+    def sample(self):
+        n = min(self.seen, self.size)
+        return self.raw[:n], self.types[:n]
+
+
+class TrainingStats:
+    # Hasil pass 1: semua yang dibutuhkan untuk fit preprocessor & Isolation Forest
+
+    def __init__(self, reservoir_size, seed):
+        self.dataset = DatasetStats()
+        self.sketches = {}  # tipe -> QuantileSketches kolom NUMERIC_COLUMNS (baris train)
+        self.train_counts = {}  # tipe -> [legit, fraud] baris train
+        self.reservoir = Reservoir(reservoir_size, seed)
+
+    def update(self, chunk, is_validation):
+        self.dataset.update(chunk)
+        train = chunk[~is_validation]
+        if train.empty:
+            return
+        derived = add_features(train[RAW_COLUMNS].copy())
+        types = train['type'].astype(str).to_numpy(dtype=object)
+        label = train[LABEL_COLUMN].to_numpy(dtype=np.int64)
+        values = derived[NUMERIC_COLUMNS].to_numpy(dtype=np.float64)
+        for t in np.unique(types):
+            rows = types == t
+            if t not in self.sketches:
+                self.sketches[t] = QuantileSketches(len(NUMERIC_COLUMNS))
+                self.train_counts[t] = np.zeros(2, dtype=np.int64)
+            self.sketches[t].update(values[rows])
+            self.train_counts[t] += np.bincount(label[rows], minlength=2)
+        self.reservoir.update(train[RAW_NUMERIC_COLUMNS].to_numpy(dtype=np.float64), types)
+
+    def fraud_types(self):
+        return sorted(t for t, counts in self.train_counts.items() if counts[1] > 0)
+
+    def scaler_params(self, types):
+        # Median & IQR (kuantil 25/75) per kolom dari sketch tipe terpilih (error relatif 1%)
+        merged = QuantileSketches(len(NUMERIC_COLUMNS))
+        for t in types:
+            merged.merge(self.sketches[t])
+        q25, median, q75 = merged.quantiles((0.25, 0.5, 0.75)).T
+        scale = q75 - q25
+        # Sama dengan sklearn _handle_zeros_in_scale: skala ~0 -> 1
+        scale = np.where(np.abs(scale) < 10 * np.finfo(np.float64).eps, 1.0, scale)
+        return median, scale
+
+
+# ==========================================
+# FIT PER TAHAP
+# ==========================================
+def build_preprocessor(stats, types):
+    # ColumnTransformer sklearn yang sama dengan models/v1_2; center_/scale_
+    # RobustScaler diganti hasil sketch streaming (bukan fit seluruh data di RAM)
+    import pandas as pd
+    from sklearn.compose import ColumnTransformer
+    from sklearn.preprocessing import OneHotEncoder, RobustScaler
+
+    raw, sample_types = stats.reservoir.sample()
+    sample = pd.DataFrame(raw, columns=RAW_NUMERIC_COLUMNS)
+    sample['type'] = sample_types
+    sample = add_features(sample[np.isin(sample_types, types)].reset_index(drop=True))
+
+    preprocessor = ColumnTransformer([
+        ('num', RobustScaler(), NUMERIC_COLUMNS),
+        ('cat', OneHotEncoder(categories=[list(types)], handle_unknown='ignore', sparse_output=False), ['type']),
+    ])
+    preprocessor.fit(sample)
+    center, scale = stats.scaler_params(types)
+    scaler = preprocessor.named_transformers_['num']
+    scaler.center_, scaler.scale_ = center, scale
+    return preprocessor
+
+
+def fit_isolation_forest(stats, features, types, seed):
+    from sklearn.ensemble import IsolationForest
+
+    raw, sample_types = stats.reservoir.sample()
+    keep = np.isin(sample_types, types)
+    X = features.transform(raw[keep], sample_types[keep])[:, :features.n_preprocessed]
+    return IsolationForest(**ISO_PARAMS, n_jobs=-1, random_state=seed).fit(X)
+
+
+def _training_iter(input_path, chunksize, prepare, cache_prefix):
+    import xgboost as xgb
+
+    class ChunkIter(xgb.DataIter):
+        # Satu batch XGBoost = satu chunk file (baris train tipe terpilih)
+
+        def __init__(self):
+            self._chunks = None
+            super().__init__(cache_prefix=cache_prefix)
+
+        def reset(self):
+            self._chunks = enumerate(iter_chunks(input_path, chunksize))
+
+        def next(self, input_data):
+            if self._chunks is None:
+                self.reset()
+            for chunk_index, chunk in self._chunks:
+                X, y = prepare(chunk_index, chunk)
+                if len(X):
+                    input_data(data=X, label=y)
+                    return True
+            return False
+
+    return ChunkIter()
+
+
+def train_xgboost(input_path, chunksize, prepare, params, rounds, cache_dir):
+    import xgboost as xgb
+
+    data = xgb.ExtMemQuantileDMatrix(_training_iter(input_path, chunksize, prepare,
+                                                    os.path.join(cache_dir, 'xgb')),
+                                     max_bin=params['max_bin'], nthread=params['nthread'])
+    booster = xgb.train(params, data, num_boost_round=rounds)
+
+    # Dibungkus XGBClassifier agar model_fraud_xgb.pkl sama dengan versi lama
+    path = os.path.join(cache_dir, 'booster.json')
+    booster.save_model(path)
+    clf = xgb.XGBClassifier(
+        n_estimators=rounds, random_state=params['seed'], n_jobs=-1,
+        **{k: v for k, v in params.items() if k not in ('seed', 'nthread')}
+    )
+    clf.load_model(path)
+    return clf
+
+
+# ==========================================
+# PIPELINE LENGKAP
+# ==========================================
+def _log(log, message):
+    if log is not None:
+        print(message, file=log, flush=True)
+
+
+def train(input_path, output_dir, chunksize=DEFAULT_CHUNKSIZE, validation=DEFAULT_VALIDATION,
+          reservoir_size=DEFAULT_RESERVOIR, all_types=False, rounds=XGB_ROUNDS, seed=DEFAULT_SEED,
+          xgb_params=None, log=sys.stderr):
+    import joblib
+
+    start = time.perf_counter()
+    timings = {}
+
+    # Pass 1: statistik streaming
+    stats = TrainingStats(reservoir_size, seed)
+    for chunk_index, chunk in enumerate(iter_chunks(input_path, chunksize)):
+        stats.update(chunk, validation_mask(chunk_index, len(chunk), validation, seed))
+    timings['stats'] = time.perf_counter() - start
+    types = sorted(stats.sketches) if all_types else stats.fraud_types()
+    if not types:
+        raise ValueError(f"Tidak ada baris fraud ({LABEL_COLUMN} = 1) di data train {input_path}.")
+    legit, fraud = np.sum([stats.train_counts[t] for t in types], axis=0)
+    _log(log, f"[1/3] {stats.dataset.rows:,} baris, tipe training {types}: {legit + fraud:,} baris train "
+              f"({fraud:,} fraud), reservoir {min(stats.reservoir.seen, reservoir_size):,}")
+
+    preprocessor = build_preprocessor(stats, types)
+    features = FastFeatures.from_preprocessor(preprocessor)
+    iso_forest = fit_isolation_forest(stats, features, types, seed)
+    n_pre = features.n_preprocessed
+
+    def prepare(chunk_index, chunk, want_validation=False):
+        mask = validation_mask(chunk_index, len(chunk), validation, seed) == want_validation
+        rows = chunk[mask & chunk['type'].astype(str).isin(types).to_numpy()]
+        X = features.from_frame(rows)
+        X[:, n_pre] = iso_forest.decision_function(X[:, :n_pre])
+        return X, rows[LABEL_COLUMN].to_numpy(dtype=np.float32)
+
+    # Pass 2: XGBoost external memory
+    params = {**XGB_PARAMS, **(xgb_params or {}), 'seed': seed, 'nthread': os.cpu_count() or 1}
+    # Bobot kelas positif seperti model lama: sqrt(legit / fraud) pada data train
+    params.setdefault('scale_pos_weight', float(np.sqrt(legit / max(fraud, 1))))
+    os.makedirs(output_dir, exist_ok=True)
+    step_start = time.perf_counter()
+    with tempfile.TemporaryDirectory(dir=output_dir) as cache_dir:
+        xgb_model = train_xgboost(input_path, chunksize, prepare, params, rounds, cache_dir)
+    timings['xgboost'] = time.perf_counter() - step_start
+    _log(log, f"[2/3] XGBoost {rounds} pohon (hist, {params['nthread']} thread) {timings['xgboost']:.1f} detik")
+
+    joblib.dump(preprocessor, os.path.join(output_dir, 'preprocessor.pkl'))
+    joblib.dump(iso_forest, os.path.join(output_dir, 'iso_forest_layer.pkl'))
+    joblib.dump(xgb_model, os.path.join(output_dir, 'model_fraud_xgb.pkl'))
+
+    # Pass 3: validasi (tipe training) & baseline drift (semua tipe) dengan pipeline scoring
+    step_start = time.perf_counter()
+    assets = load_pipeline(output_dir)
+    hist = ProbabilityHistogram()
+    drift = DriftStats.for_features(assets['features'])
+    for chunk_index, chunk in enumerate(iter_chunks(input_path, chunksize)):
+        rows = chunk[validation_mask(chunk_index, len(chunk), validation, seed)]
+        if rows.empty:
+            continue
+        X = assets['features'].from_frame(rows)
+        proba, _ = score_model(assets, X)
+        drift.update(assets['features'], X, proba)
+        trained = rows['type'].astype(str).isin(types).to_numpy()
+        hist.update(proba[trained], rows[LABEL_COLUMN].to_numpy()[trained])
+    timings['validation'] = time.perf_counter() - step_start
+    best = hist.best_f1()
+
+    metadata = {
+        'optimal_threshold': best['threshold'],
+        'feature_names': features.feature_names,
+        'input_columns': RAW_COLUMNS + ['errorBalanceOrig', 'errorBalanceDest', 'hour'],
+        'metrics': {k: best[k] for k in ('f1_score', 'accuracy', 'precision', 'recall')},
+        'training': {
+            'source': os.path.basename(input_path),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'rows': stats.dataset.rows,
+            'train_rows': int(legit + fraud),
+            'train_fraud': int(fraud),
+            'validation_rows': int(hist.fraud.sum() + hist.legit.sum()),
+            'validation_fraud': int(hist.fraud.sum()),
+            'types': types,
+            'xgb_params': {k: v for k, v in params.items() if k != 'nthread'},
+            'xgb_rounds': rounds,
+            'iso_params': {**ISO_PARAMS, 'random_state': seed},
+            'reservoir_size': reservoir_size,
+            'seconds': {k: round(v, 2) for k, v in timings.items()},
+        },
+    }
+    with open(os.path.join(output_dir, 'model_metadata.json'), 'w') as f:
+        json.dump(metadata, f, indent=4)
+    save_stats(stats.dataset, output_dir)
+    save_baseline(drift, output_dir, source=os.path.basename(input_path))
+
+    from jaga.artifacts import convert
+
+    convert(output_dir)
+    _log(log, f"[3/3] validasi {metadata['training']['validation_rows']:,} baris: threshold "
+              f"{best['threshold']:.4f}, F1 {best['f1_score']:.4f}, precision {best['precision']:.4f}, "
+              f"recall {best['recall']:.4f}")
+    metadata['training']['seconds']['total'] = round(time.perf_counter() - start, 2)
+    return metadata
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Training ulang model JAGA dari file transaksi berlabel (out-of-core)")
+    parser.add_argument('input', help="File berlabel (.csv/.parquet) dengan kolom isFraud")
+    parser.add_argument('--output', required=True, help="Folder versi model baru, mis. models/v2")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument('--validation', type=float, default=DEFAULT_VALIDATION, help="Porsi baris validasi")
+    parser.add_argument('--reservoir', type=int, default=DEFAULT_RESERVOIR,
+                        help="Ukuran sampel (semua tipe) untuk Isolation Forest & struktur preprocessor")
+    parser.add_argument('--all-types', action='store_true', help="Training dengan semua tipe transaksi")
+    parser.add_argument('--rounds', type=int, default=XGB_ROUNDS)
+    parser.add_argument('--max-depth', type=int, default=XGB_PARAMS['max_depth'])
+    parser.add_argument('--learning-rate', type=float, default=XGB_PARAMS['learning_rate'])
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--force', action='store_true', help="Timpa folder output yang sudah berisi model")
+    args = parser.parse_args(argv)
+
+    if os.path.exists(os.path.join(args.output, 'model_fraud_xgb.pkl')):
+        if not args.force:
+            parser.error(f"{args.output} sudah berisi model; gunakan --force untuk menimpa.")
+        shutil.rmtree(os.path.join(args.output, 'native'), ignore_errors=True)
+
+    metadata = train(args.input, args.output, args.chunksize, args.validation, args.reservoir, args.all_types,
+                     args.rounds, args.seed, {'max_depth': args.max_depth, 'learning_rate': args.learning_rate})
+    print(json.dumps({'output': args.output, 'optimal_threshold': metadata['optimal_threshold'],
+                      'metrics': metadata['metrics'], 'seconds': metadata['training']['seconds']}, indent=4))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,228 @@
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# FITUR VELOCITY PER AKUN (SLIDING WINDOW)
+# ==========================================
+# Pola fraud PaySim: TRANSFER dari akun korban yang dikuras habis, lalu akun
+# penerima langsung CASH_OUT. Satu transaksi saja tidak cukup untuk melihatnya,
+# jadi store ini menyimpan aktivitas terbaru per akun (nameOrig & nameDest):
+#
+#   orig_out_count / orig_out_amount : transaksi keluar akun pengirim di window
+#   orig_drained                     : total saldo pengirim yang terkuras (old - new)
+#   orig_in_amount                   : dana yang baru MASUK ke akun pengirim
+#                                      (akun penampung yang langsung cash-out)
+#   dest_in_count / dest_in_amount   : transaksi masuk akun penerima di window
+#
+# Semua fitur = aktivitas SEBELUM transaksi itu sendiri (dalam window_steps).
+#
+# Penyimpanan: array NumPy berkapasitas tetap (capacity akun x n_buckets ring
+# buffer), jadi memori terbatas. Akun yang tidak aktif selama satu window penuh
+# sudah tidak berkontribusi (TTL = window) dan slotnya dipakai ulang; jika
+# kapasitas tetap kurang, akun yang paling lama tidak aktif dikeluarkan.
+# Lookup & update per transaksi O(1), dijalankan vectorized per batch.
+#
+#   store = VelocityStore(window_steps=24, bucket_steps=3)
+#   velocity = store.update_frame(chunk)   # DataFrame berisi VELOCITY_COLUMNS
+
+VELOCITY_COLUMNS = [
+    'orig_out_count', 'orig_out_amount', 'orig_drained', 'orig_in_amount',
+    'dest_in_count', 'dest_in_amount',
+]
+
+# Kanal per akun per bucket
+OUT_COUNT, OUT_AMOUNT, DRAINED, IN_COUNT, IN_AMOUNT = range(5)
+N_CHANNELS = 5
+
+ORIG_CHANNELS = [OUT_COUNT, OUT_AMOUNT, DRAINED, IN_AMOUNT]
+DEST_CHANNELS = [IN_COUNT, IN_AMOUNT]
+
+DEFAULT_CAPACITY = 1_000_000
+
+# Stamp bucket yang tidak pernah valid
+_EMPTY = np.iinfo(np.int32).min // 2
+
+
+def hash_accounts(ids):
+    # ID akun (string) -> uint64; jauh lebih hemat memori untuk key dict
+    return pd.util.hash_array(np.asarray(ids, dtype=object))
+
+
+class VelocityStore:
+
+    def __init__(self, window_steps=24, bucket_steps=3, capacity=DEFAULT_CAPACITY):
+        if window_steps % bucket_steps:
+            raise ValueError(f"window_steps ({window_steps}) harus kelipatan bucket_steps ({bucket_steps})")
+        self.window_steps = window_steps
+        self.bucket_steps = bucket_steps
+        self.n_buckets = window_steps // bucket_steps
+        self.capacity = capacity
+
+        self.values = np.zeros((capacity, self.n_buckets, N_CHANNELS), dtype=np.float32)
+        self.stamps = np.full((capacity, self.n_buckets), _EMPTY, dtype=np.int32)
+        self.last_seen = np.full(capacity, _EMPTY, dtype=np.int32)
+        self.keys = np.zeros(capacity, dtype=np.uint64)
+
+        self._index = {}  # hash akun -> slot
+        self._free = list(range(capacity - 1, -1, -1))
+        self.current_bucket = _EMPTY
+        self.evicted_expired = 0
+        self.evicted_lru = 0
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.stamps.nbytes + self.last_seen.nbytes + self.keys.nbytes
+
+    # ------------------------------------------
+    # Slot akun
+    # ------------------------------------------
+    def _evict(self, n_needed, protected):
+        # 1) akun kedaluwarsa (tidak aktif >= satu window), 2) LRU jika masih kurang
+        in_use = self.last_seen != _EMPTY
+        in_use[protected] = False
+        expired = np.nonzero(in_use & (self.last_seen <= self.current_bucket - self.n_buckets))[0]
+        victims = expired
+        self.evicted_expired += len(expired)
+        short = n_needed - len(expired)
+        if short > 0:
+            in_use[expired] = False
+            candidates = np.nonzero(in_use)[0]
+            if len(candidates) < short:
+                raise ValueError(f"Batch memuat lebih banyak akun unik dari kapasitas store ({self.capacity:,})")
+            # Sekalian bebaskan 1/16 kapasitas agar eviction tidak terjadi tiap batch
+            n_lru = min(len(candidates), max(short, self.capacity // 16))
+            oldest = candidates[np.argpartition(self.last_seen[candidates], n_lru - 1)[:n_lru]]
+            victims = np.concatenate([expired, oldest])
+            self.evicted_lru += len(oldest)
+
+        for key in self.keys[victims].tolist():
+            del self._index[key]
+        self.last_seen[victims] = _EMPTY
+        self.stamps[victims] = _EMPTY
+        self._free.extend(victims.tolist())
+
+    def _slots(self, keys):
+        # keys unik (uint64) -> slot; akun baru mendapat slot kosong
+        index = self._index
+        slots = np.fromiter((index.get(k, -1) for k in keys.tolist()), dtype=np.int64, count=len(keys))
+        new = np.nonzero(slots < 0)[0]
+        if len(new):
+            if len(new) > len(self._free):
+                self._evict(len(new) - len(self._free), slots[slots >= 0])
+            fresh = np.array([self._free.pop() for _ in range(len(new))], dtype=np.int64)
+            slots[new] = fresh
+            self.keys[fresh] = keys[new]
+            self.stamps[fresh] = _EMPTY
+            for key, slot in zip(keys[new].tolist(), fresh.tolist()):
+                index[key] = slot
+        return slots
+
+    # ------------------------------------------
+    # Lookup + update (satu batch transaksi)
+    # ------------------------------------------
+    def update(self, steps, orig_ids, dest_ids, amount, drained):
+        # Mengembalikan matriks (n, 6) urut VELOCITY_COLUMNS, lalu mencatat batch ke store
+        n = len(steps)
+        if n == 0:
+            return np.zeros((0, len(VELOCITY_COLUMNS)))
+        buckets = np.asarray(steps, dtype=np.int64) // self.bucket_steps
+        amount = np.asarray(amount, dtype=np.float64)
+
+        # Tiap transaksi = dua event: keluar dari pengirim, masuk ke penerima
+        keys = np.concatenate([hash_accounts(orig_ids), hash_accounts(dest_ids)])
+        event_bucket = np.concatenate([buckets, buckets])
+        event_values = np.zeros((2 * n, N_CHANNELS))
+        event_values[:n, OUT_COUNT] = 1.0
+        event_values[:n, OUT_AMOUNT] = amount
+        event_values[:n, DRAINED] = np.maximum(np.asarray(drained, dtype=np.float64), 0.0)
+        event_values[n:, IN_COUNT] = 1.0
+        event_values[n:, IN_AMOUNT] = amount
+
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        self.current_bucket = max(self.current_bucket, int(buckets.max()))
+        slots = self._slots(unique_keys)[inverse]
+
+        totals = self._stored_totals(slots, event_bucket) + self._batch_totals(inverse, event_bucket, event_values)
+        self._record(slots, event_bucket, event_values)
+
+        out = np.empty((n, len(VELOCITY_COLUMNS)))
+        out[:, :len(ORIG_CHANNELS)] = totals[:n][:, ORIG_CHANNELS]
+        out[:, len(ORIG_CHANNELS):] = totals[n:][:, DEST_CHANNELS]
+        return out
+
+    def _stored_totals(self, slots, event_bucket):
+        # Aktivitas dari batch sebelumnya yang masih di dalam window event
+        stamps = self.stamps[slots]
+        valid = (stamps > event_bucket[:, None] - self.n_buckets) & (stamps <= event_bucket[:, None])
+        return np.einsum('ij,ijk->ik', valid.astype(np.float32), self.values[slots]).astype(np.float64)
+
+    def _batch_totals(self, group, event_bucket, event_values):
+        # Event lebih awal di batch yang sama (akun sama, masih di dalam window).
+        # Diurutkan per (akun, bucket, posisi); jumlah prefix eksklusif dikurangi
+        # bagian yang sudah keluar window (dicari dengan searchsorted).
+        # Urutan transaksi asli: event pengirim & penerima transaksi ke-i = 2i, 2i+1
+        n = len(group) // 2
+        position = np.concatenate([2 * np.arange(n), 2 * np.arange(n) + 1])
+        order = np.lexsort((position, event_bucket, group))
+        sorted_key = group[order].astype(np.int64) * (1 << 32) + (event_bucket[order] - event_bucket.min())
+        cumulative = np.zeros((len(order) + 1, N_CHANNELS))
+        np.cumsum(event_values[order], axis=0, out=cumulative[1:])
+
+        window_start = sorted_key - (self.n_buckets - 1)
+        first = np.searchsorted(sorted_key, window_start, side='left')
+        totals = np.empty_like(event_values)
+        totals[order] = cumulative[:-1] - cumulative[first]
+        return totals
+
+    def _record(self, slots, event_bucket, event_values):
+        # Agregasi per (slot, bucket), lalu tulis ke sel ring buffer bucket % n_buckets
+        cell_key, inverse = np.unique(slots * (1 << 32) + (event_bucket - event_bucket.min()), return_inverse=True)
+        sums = np.zeros((len(cell_key), N_CHANNELS))
+        np.add.at(sums, inverse, event_values)
+        cell_slot = cell_key >> 32
+        cell_bucket = (cell_key & ((1 << 32) - 1)) + event_bucket.min()
+        ring = cell_bucket % self.n_buckets
+
+        # Dua bucket batch yang jatuh ke sel ring sama: hanya yang terbaru dipakai
+        order = np.lexsort((cell_bucket, ring, cell_slot))
+        cell_slot, cell_bucket, ring, sums = cell_slot[order], cell_bucket[order], ring[order], sums[order]
+        ring_key = cell_slot * self.n_buckets + ring
+        last = np.r_[ring_key[1:] != ring_key[:-1], True]
+        cell_slot, cell_bucket, ring, sums = cell_slot[last], cell_bucket[last], ring[last], sums[last]
+
+        stored = self.stamps[cell_slot, ring]
+        same = stored == cell_bucket
+        newer = stored < cell_bucket
+        self.values[cell_slot[same], ring[same]] += sums[same].astype(np.float32)
+        self.values[cell_slot[newer], ring[newer]] = sums[newer]
+        self.stamps[cell_slot[newer], ring[newer]] = cell_bucket[newer]
+        # Event terlambat yang lebih tua dari isi sel diabaikan
+
+        np.maximum.at(self.last_seen, cell_slot, cell_bucket)
+
+    def update_frame(self, df):
+        # df: kolom PaySim (step, amount, nameOrig, nameDest, oldbalanceOrg, newbalanceOrig)
+        velocity = self.update(
+            df['step'].to_numpy(), df['nameOrig'].to_numpy(), df['nameDest'].to_numpy(),
+            df['amount'].to_numpy(), (df['oldbalanceOrg'] - df['newbalanceOrig']).to_numpy(),
+        )
+        return pd.DataFrame(velocity, columns=VELOCITY_COLUMNS, index=df.index)
+
+    def update_records(self, records):
+        # records: list of dict (NDJSON) yang memiliki nameOrig & nameDest
+        return self.update(
+            [r['step'] for r in records], [r['nameOrig'] for r in records], [r['nameDest'] for r in records],
+            [r['amount'] for r in records], [r['oldbalanceOrg'] - r['newbalanceOrig'] for r in records],
+        )
+
+    def stats(self):
+        return {
+            'accounts': len(self),
+            'capacity': self.capacity,
+            'memory_mb': self.nbytes / 2**20,
+            'evicted_expired': self.evicted_expired,
+            'evicted_lru': self.evicted_lru,
+        }
@@ -0,0 +1,87 @@
+import numpy as np
+
+from jaga.features import RAW_NUMERIC_COLUMNS
+from jaga.pipeline import score_matrix
+
+# ==========================================
+# WHAT-IF: PERMUKAAN RISIKO SATU TRANSAKSI
+# ==========================================
+# Satu transaksi dasar diubah di dua sumbu (mis. nominal x jam) dan seluruh grid
+# diskor dalam SATU panggilan model (FastFeatures.transform + score_matrix),
+# bukan submit form berulang kali:
+#
+#   surface = risk_surface(assets, base, 'amount', 'hour')
+#   surface['proba']  # (len(y_values), len(x_values))
+#
+# Sumbu uang memakai skala log di sekitar nilai sekarang (1% .. 100x) ditambah 0;
+# sumbu jam selalu 0..23. follow_balances=True menjaga saldo konsisten dengan
+# nominal (saldo akhir pengirim = awal - nominal, penerima = awal + nominal)
+# sehingga yang terlihat efek nominal, bukan efek selisih saldo (errorBalance*).
+# Dipakai halaman "Deteksi Fraud" (dashboard/deteksi.py), waktu di
+# benchmarks/bench_whatif.py.
+
+AXES = {
+    'amount': "Nominal Transaksi",
+    'hour': "Jam Transaksi",
+    'oldbalanceOrg': "Saldo Awal Pengirim",
+    'newbalanceOrig': "Saldo Akhir Pengirim",
+    'oldbalanceDest': "Saldo Awal Penerima",
+    'newbalanceDest': "Saldo Akhir Penerima",
+}
+HOURS = 24
+DEFAULT_POINTS = 100
+# Rentang sumbu uang relatif terhadap nilai sekarang
+SPAN = 100.0
+# Nilai tengah minimum agar sumbu uang tetap berarti untuk saldo 0
+MIN_CENTER = 100.0
+
+
+def axis_values(axis, base, n_points=DEFAULT_POINTS):
+    if axis not in AXES:
+        raise ValueError(f"Sumbu {axis!r} tidak dikenal, pilih salah satu dari {list(AXES)}")
+    if axis == 'hour':
+        return np.arange(HOURS, dtype=np.float64)
+    center = max(float(base[axis]), MIN_CENTER)
+    return np.concatenate([[0.0], np.geomspace(center / SPAN, center * SPAN, n_points - 1)])
+
+
+def build_grid(base, x_axis, y_axis, n_points=DEFAULT_POINTS, follow_balances=False):
+    # -> raw (n, 6) urut RAW_NUMERIC_COLUMNS, types (n,), x_values, y_values; baris = y-major
+    if x_axis == y_axis:
+        raise ValueError("Sumbu x dan y harus berbeda")
+    x_values = axis_values(x_axis, base, n_points)
+    y_values = axis_values(y_axis, base, n_points)
+    n = len(x_values) * len(y_values)
+
+    columns = {c: np.full(n, float(base[c])) for c in RAW_NUMERIC_COLUMNS}
+    for axis, values in ((x_axis, np.tile(x_values, len(y_values))),
+                         (y_axis, np.repeat(y_values, len(x_values)))):
+        if axis == 'hour':
+            # step dipertahankan di hari yang sama, hanya jamnya yang berubah
+            columns['step'] = columns['step'] - columns['step'] % HOURS + values
+        else:
+            columns[axis] = values
+    if follow_balances:
+        varied = {x_axis, y_axis}
+        if 'newbalanceOrig' not in varied:
+            columns['newbalanceOrig'] = np.maximum(columns['oldbalanceOrg'] - columns['amount'], 0.0)
+        if 'newbalanceDest' not in varied:
+            columns['newbalanceDest'] = columns['oldbalanceDest'] + columns['amount']
+
+    raw = np.column_stack([columns[c] for c in RAW_NUMERIC_COLUMNS])
+    types = np.full(n, base['type'], dtype=object)
+    return raw, types, x_values, y_values
+
+
+def risk_surface(assets, base, x_axis, y_axis, n_points=DEFAULT_POINTS, follow_balances=False):
+    raw, types, x_values, y_values = build_grid(base, x_axis, y_axis, n_points, follow_balances)
+    proba, _ = score_matrix(assets, assets['features'].transform(raw, types))
+    shape = (len(y_values), len(x_values))
+    return {
+        'x_axis': x_axis,
+        'y_axis': y_axis,
+        'x_values': x_values,
+        'y_values': y_values,
+        'proba': np.asarray(proba, dtype=np.float64).reshape(shape),
+        'band': assets['policy'].band_index(proba).reshape(shape),
+    }
@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip('sklearn')
+
+from jaga.anomaly import IsolationEngine, TreeBudget
+from jaga.compiled import _average_path_length, flatten_isolation_forest
+from jaga.pipeline import ISO_FOREST_FILES, load_pipeline
+
+# ==========================================
+# ISOLATION ENGINE vs SKLEARN
+# ==========================================
+# IsolationEngine (layout pohon sempurna) dengan semua pohon harus identik dengan
+# iso_forest.decision_function, termasuk NaN (arah missing_go_to_left) dan +-inf
+# di tiap kolom, baik lewat score() maupun score_budget() dengan TreeBudget penuh.
+
+MODELS_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models')
+VERSIONS = [v for v in ('v0', 'v1', 'v1_2')
+            if any(os.path.exists(os.path.join(MODELS_ROOT, v, f)) for f in ISO_FOREST_FILES)]
+ATOL = 1e-9
+
+
+def engine_and_forest(version):
+    iso_forest = load_pipeline(os.path.join(MODELS_ROOT, version))['iso_forest']
+    denominator = len(iso_forest.estimators_) * _average_path_length([iso_forest.max_samples_])[0]
+    engine = IsolationEngine.from_forest(flatten_isolation_forest(iso_forest), iso_forest.offset_, denominator)
+    return engine, iso_forest
+
+
+def special_rows(n_features, seed=0):
+    # Satu baris per (kolom, nilai) untuk NaN / inf / -inf, sisanya acak
+    rng = np.random.default_rng(seed)
+    values = [np.nan, np.inf, -np.inf]
+    X = rng.normal(scale=2.0, size=(len(values) * n_features, n_features)).astype(np.float32)
+    for k, value in enumerate(values):
+        for j in range(n_features):
+            X[k * n_features + j, j] = value
+    return X
+
+
+@pytest.mark.parametrize('version', VERSIONS)
+def test_engine_matches_decision_function(version):
+    engine, iso_forest = engine_and_forest(version)
+    X = special_rows(iso_forest.n_features_in_)
+    expected = iso_forest.decision_function(X)
+    np.testing.assert_allclose(engine.score(X), expected, rtol=0, atol=ATOL)
+
+
+@pytest.mark.parametrize('version', VERSIONS)
+def test_full_budget_matches_decision_function(version):
+    engine, iso_forest = engine_and_forest(version)
+    # Cukup banyak baris agar jalur budget benar-benar dipakai (>= BUDGET_MIN_ROWS)
+    X = np.concatenate([special_rows(iso_forest.n_features_in_, seed) for seed in range(20)])
+    expected = iso_forest.decision_function(X)
+    budget = TreeBudget(min_trees=engine.n_trees)
+
+    score, used = engine.score_budget(X, budget)
+    np.testing.assert_array_equal(used, engine.n_trees)
+    np.testing.assert_allclose(score, expected, rtol=0, atol=ATOL)
+    np.testing.assert_allclose(engine.score(X, budget), expected, rtol=0, atol=ATOL)
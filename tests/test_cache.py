@@ -0,0 +1,148 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import jaga.cache
+from jaga.cache import ScoreCache, SharedScoreCache, cache_key
+
+# ==========================================
+# CACHE HASIL SCORING
+# ==========================================
+# Key salah = skor transaksi lain dikembalikan diam-diam, jadi kanonisasi key,
+# invalidasi per model_tag dan trim LRU SQLite (sampai 15/16 batas) diuji di sini.
+
+RECORD = {
+    'step': 1, 'type': 'TRANSFER', 'amount': 100.0,
+    'oldbalanceOrg': 100.0, 'newbalanceOrig': 0.0,
+    'oldbalanceDest': 0.0, 'newbalanceDest': 100.0,
+}
+
+
+def keys(n, tag='v1@1'):
+    return [cache_key({**RECORD, 'step': i}, tag) for i in range(n)]
+
+
+# ------------------------------------------
+# cache_key
+# ------------------------------------------
+def test_key_is_canonical():
+    key = cache_key(RECORD, 'v1@1')
+    assert cache_key({**RECORD, 'step': 1.0, 'amount': 100}, 'v1@1') == key
+    assert cache_key(dict(reversed(list(RECORD.items()))), 'v1@1') == key
+    assert cache_key({**RECORD, 'newbalanceOrig': -0.0}, 'v1@1') == key
+    # Field di luar kolom input (mis. ID akun) tidak ikut key
+    assert cache_key({**RECORD, 'nameOrig': 'C1'}, 'v1@1') == key
+
+
+def test_key_separates_inputs_and_models():
+    key = cache_key(RECORD, 'v1@1')
+    assert cache_key(RECORD, 'v1@2') != key
+    assert cache_key({**RECORD, 'type': 'CASH_OUT'}, 'v1@1') != key
+    assert cache_key({**RECORD, 'amount': np.nextafter(100.0, 101.0)}, 'v1@1') != key
+    assert cache_key({**RECORD, 'amount': 1e-300}, 'v1@1') != cache_key({**RECORD, 'amount': 0.0}, 'v1@1')
+
+
+def test_key_nan_is_stable():
+    nan_key = cache_key({**RECORD, 'amount': float('nan')}, 'v1@1')
+    assert cache_key({**RECORD, 'amount': -float('nan')}, 'v1@1') == nan_key
+    assert nan_key != cache_key({**RECORD, 'amount': 0.0}, 'v1@1')
+    assert nan_key != cache_key({**RECORD, 'amount': float('inf')}, 'v1@1')
+
+
+# ------------------------------------------
+# ScoreCache (memori)
+# ------------------------------------------
+def test_memory_cache_roundtrip_and_invalidation():
+    cache = ScoreCache(max_entries=10, ttl_seconds=60)
+    cache.bind('v1@1')
+    k = keys(3)
+    cache.put_many(k, [0.1, 0.2, 0.3], [-0.1, -0.2, -0.3])
+    assert cache.get_many(k) == [(0.1, -0.1), (0.2, -0.2), (0.3, -0.3)]
+
+    cache.bind('v1@1')
+    assert len(cache) == 3 and cache.invalidations == 0
+    cache.bind('v1@2')
+    assert len(cache) == 0 and cache.invalidations == 1
+    assert cache.get_many(k) == [None] * 3
+
+
+def test_memory_cache_lru_and_ttl():
+    cache = ScoreCache(max_entries=3, ttl_seconds=60)
+    cache.bind('v1@1')
+    k = keys(4)
+    cache.put_many(k[:3], [0.1, 0.2, 0.3], [0.0] * 3)
+    cache.get_many([k[0]])
+    cache.put_many([k[3]], [0.4], [0.0])
+    assert cache.get_many(k) == [(0.1, 0.0), None, (0.3, 0.0), (0.4, 0.0)]
+    assert cache.evictions == 1
+
+    expired = ScoreCache(max_entries=3, ttl_seconds=0)
+    expired.bind('v1@1')
+    expired.put_many(k[:1], [0.1], [0.0])
+    assert expired.get_many(k[:1]) == [None] and expired.expirations == 1
+
+
+# ------------------------------------------
+# SharedScoreCache (SQLite)
+# ------------------------------------------
+@pytest.fixture()
+def clock(monkeypatch):
+    # time.time() naik 1 detik tiap panggilan: urutan last_access deterministik
+    ticks = itertools.count(1_000_000)
+    monkeypatch.setattr(jaga.cache.time, 'time', lambda: float(next(ticks)))
+
+
+def test_shared_cache_between_workers_and_invalidation(tmp_path, clock):
+    path = str(tmp_path / 'cache.sqlite')
+    a, b = SharedScoreCache(path, 100, 3600), SharedScoreCache(path, 100, 3600)
+    a.bind('v1@1')
+    b.bind('v1@1')
+    k = keys(5)
+    a.put_many(k, np.linspace(0, 1, 5), np.zeros(5))
+    assert [entry[0] for entry in b.get_many(k)] == pytest.approx(np.linspace(0, 1, 5))
+
+    # Worker yang pertama melihat tag baru menghapus entri tag lama
+    b.bind('v1@2')
+    assert len(b) == 0 and b.get_many(keys(5, 'v1@2')) == [None] * 5
+    a.bind('v1@2')
+    b.put_many(keys(2, 'v1@2'), [0.5, 0.6], [0.0, 0.0])
+    assert len(a) == 2
+    a.close()
+    b.close()
+
+
+def test_shared_cache_trims_lru_to_fifteen_sixteenths(tmp_path, clock):
+    max_entries = 64
+    cache = SharedScoreCache(str(tmp_path / 'cache.sqlite'), max_entries, 3600)
+    cache.bind('v1@1')
+    k = keys(max_entries + 1)
+    for key in k[:max_entries]:
+        cache.put_many([key], [0.5], [0.0])
+    assert len(cache) == max_entries and cache.evictions == 0
+
+    # Entri tertua disentuh dulu: tidak boleh ikut terbuang
+    cache.get_many([k[0]])
+    cache.put_many([k[-1]], [0.5], [0.0])
+    target = max_entries - max_entries // 16
+    assert len(cache) == target
+    assert cache.evictions == max_entries + 1 - target
+    found = cache.get_many(k)
+    assert found[0] is not None and found[-1] is not None
+    assert found[1:max_entries + 1 - target + 1] == [None] * (max_entries + 1 - target)
+    assert cache._approx_entries == target
+    cache.close()
+
+
+def test_shared_cache_expires_rows(tmp_path, clock):
+    cache = SharedScoreCache(str(tmp_path / 'cache.sqlite'), 100, ttl_seconds=5)
+    cache.bind('v1@1')
+    k = keys(2)
+    cache.put_many(k[:1], [0.1], [0.0])
+    # Tiap panggilan time.time() maju 1 detik: setelah > 5 panggilan entri pertama kedaluwarsa
+    for _ in range(6):
+        cache.get_many(k[1:])
+    cache.put_many(k[1:], [0.2], [0.0])
+    assert cache.get_many(k) == [None, (0.2, 0.0)]
+    assert cache.expirations >= 1
+    cache.close()
@@ -0,0 +1,130 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from jaga.audit import AuditLog, query
+from jaga.cache import ScoreCache
+from jaga.cascade import STAGES, CascadePolicy, attach_cascade
+from jaga.pipeline import RAW_COLUMNS
+from jaga.registry import ModelRegistry
+from jaga.server import format_results
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# CASCADE: TAHAP KELUAR, DRIFT, CACHE & AUDIT
+# ==========================================
+# Baris yang keluar di type_gate/rules/prefilter tidak boleh sampai ke monitor
+# drift maupun cache registry; tahap keluarnya dilaporkan per baris di respons
+# API & audit log, dan proba baris prefilter (hanya batas atas) null.
+
+MODELS_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models')
+VERSION = 'v1_2'
+
+pytestmark = pytest.mark.skipif(not os.path.isdir(os.path.join(MODELS_ROOT, VERSION)),
+                                reason=f"model {VERSION} tidak ada di {MODELS_ROOT}")
+
+
+class SpyMonitor:
+    # Pengganti DriftMonitor: mencatat matriks yang dikirim registry
+
+    def __init__(self):
+        self.submitted = []
+
+    def bind(self, version, features, baseline=None):
+        pass
+
+    def submit(self, X, proba):
+        self.submitted.append((X.copy(), np.array(proba)))
+
+    def status(self, include_report=True):
+        return {}
+
+    def close(self):
+        pass
+
+
+class SpyCache(ScoreCache):
+
+    def __init__(self):
+        super().__init__()
+        self.put_keys = []
+
+    def put_many(self, keys, proba, anomaly_score):
+        self.put_keys += list(keys)
+        super().put_many(keys, proba, anomaly_score)
+
+
+@pytest.fixture()
+def registry(tmp_path):
+    monitor, cache = SpyMonitor(), SpyCache()
+    registry = ModelRegistry(MODELS_ROOT, VERSION, cache=cache, monitor=monitor, cascade=True,
+                             audit=AuditLog(str(tmp_path / 'audit')))
+    # Rule eksplisit agar keempat tahap muncul
+    policy = CascadePolicy(['TRANSFER', 'CASH_OUT'], [{'column': 'amount', 'op': '<=', 'value': 5000}])
+    attach_cascade(registry.get(VERSION), registry.describe(VERSION)['path'], policy)
+    yield registry
+    registry.close()
+
+
+@pytest.fixture(scope='module')
+def records():
+    df = make_transactions(600, seed=3, fraud_scale=50)[RAW_COLUMNS]
+    return df.to_dict('records')
+
+
+def test_stage_reported_per_row(registry, records):
+    proba, anomaly_score, decision, _, stage = registry.score_records(records)
+    assert set(stage) == set(STAGES)
+
+    skipped = stage != 'model'
+    assert np.isnan(anomaly_score[skipped]).all()
+    assert not np.isnan(anomaly_score[~skipped]).any()
+    assert (proba[np.isin(stage, ['type_gate', 'rules'])] == 0).all()
+    assert np.isnan(proba[stage == 'prefilter']).all()
+    assert (decision[skipped] == 'allow').all()
+
+    results = format_results(False, registry.score_records(records))
+    assert [r['stage'] for r in results] == list(stage)
+    for r in results:
+        if r['stage'] == 'prefilter':
+            assert r['probability'] is None and r['anomaly_score'] is None
+        elif r['stage'] == 'model':
+            assert 0.0 <= r['probability'] <= 1.0 and r['anomaly_score'] is not None
+
+
+def test_skipped_rows_never_reach_drift_or_cache(registry, records):
+    _, _, _, _, stage = registry.score_records(records)
+    n_model = int((stage == 'model').sum())
+
+    monitor, cache = registry.monitor, registry.cache
+    assert sum(len(X) for X, _ in monitor.submitted) == n_model
+    n_pre = registry.get(VERSION)['features'].n_preprocessed
+    for X, proba in monitor.submitted:
+        assert not np.isnan(X[:, n_pre]).any() and not np.isnan(proba).any()
+    assert len(cache.put_keys) == n_model
+
+    # Retry: baris model dari cache, baris yang dilewati dihitung ulang dengan tahap yang sama
+    _, _, _, _, stage_again = registry.score_records(records)
+    np.testing.assert_array_equal(stage_again, stage)
+    assert cache.hits == n_model
+    assert len(cache.put_keys) == n_model
+    assert sum(len(X) for X, _ in monitor.submitted) == n_model
+
+
+def test_stage_in_audit_log(registry, records, tmp_path):
+    proba, _, _, _, stage = registry.score_records(records)
+    registry.audit.close()
+    registry.audit = None
+
+    table = query(str(tmp_path / 'audit'), columns=['stage', 'fraud_probability', 'anomaly_score']).to_pandas()
+    assert list(table['stage'].astype(str)) == list(stage)
+    prefilter = table['stage'] == 'prefilter'
+    assert table.loc[prefilter, 'fraud_probability'].isna().all()
+    assert table.loc[table['stage'] != 'model', 'anomaly_score'].isna().all()
+    assert table.loc[table['stage'] == 'model', 'fraud_probability'].notna().all()
+
+    model_only = query(str(tmp_path / 'audit'), stages=['model'], columns=['stage'])
+    assert model_only.num_rows == int((stage == 'model').sum())
@@ -0,0 +1,107 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('sklearn')
+pytest.importorskip('xgboost')
+
+from jaga.artifacts import has_native, load_native
+from jaga.compiled import CompiledModel
+from jaga.pipeline import RAW_COLUMNS, add_features, load_pipeline, score_frame, score_records
+from jaga.synthetic import make_transactions
+
+# ==========================================
+# PARITY JALUR CEPAT vs PIPELINE ASLI
+# ==========================================
+# FastFeatures, CompiledModel dan load_native harus memberi fitur, anomaly_score
+# dan probabilitas yang sama (toleransi 1e-6) dengan preprocessor.pkl +
+# iso_forest.decision_function + xgb_model.predict_proba, termasuk untuk input
+# NaN dan inf.
+#
+#   python -m pytest -q tests/
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models', 'v1_2')
+ATOL = 1e-6
+
+pytestmark = pytest.mark.skipif(not os.path.exists(os.path.join(MODEL_DIR, 'preprocessor.pkl')),
+                                reason=f"model tidak ada di {MODEL_DIR}")
+
+
+@pytest.fixture(scope='module')
+def pipeline():
+    return load_pipeline(MODEL_DIR)
+
+
+@pytest.fixture(scope='module')
+def frame():
+    # Transaksi sintetis + baris dengan NaN / inf / -inf di tiap kolom numerik
+    df = make_transactions(2000, seed=7, fraud_scale=50)[RAW_COLUMNS].reset_index(drop=True)
+    df = df.astype({c: np.float64 for c in RAW_COLUMNS if c != 'type'})
+    special = []
+    for k, value in enumerate([np.nan, np.inf, -np.inf]):
+        for j, column in enumerate(c for c in RAW_COLUMNS if c != 'type'):
+            row = df.iloc[k * 10 + j].copy()
+            row[column] = value
+            special.append(row)
+    return pd.concat([df, pd.DataFrame(special)], ignore_index=True)
+
+
+def reference_features(assets, df):
+    # preprocessor.transform menolak inf; baris inf di-scale manual dengan
+    # parameter RobustScaler/OneHotEncoder yang sama
+    preprocessor = assets['preprocessor']
+    frame = add_features(df.copy())
+    has_inf = np.isinf(frame.select_dtypes('number').to_numpy()).any(axis=1)
+
+    transformers = {name: (trans, cols) for name, trans, cols in preprocessor.transformers_}
+    scaler, numeric_columns = transformers['num']
+    encoder, cat_columns = transformers['cat']
+    X = np.hstack([
+        (frame[numeric_columns].to_numpy(dtype=np.float64) - scaler.center_) / scaler.scale_,
+        encoder.transform(frame[cat_columns]),
+    ])
+    X[~has_inf] = preprocessor.transform(frame[~has_inf])
+    return X
+
+
+def reference_scores(assets, df):
+    X = reference_features(assets, df)
+    anomaly_score = assets['iso_forest'].decision_function(X)
+    proba = assets['xgb_model'].predict_proba(np.column_stack([X, anomaly_score]))[:, 1]
+    return X, anomaly_score, proba
+
+
+def test_fast_features_match_preprocessor(pipeline, frame):
+    expected = reference_features(pipeline, frame)
+    features = pipeline['features']
+    for X in (features.from_frame(frame), features.from_records(frame.to_dict('records'))):
+        np.testing.assert_allclose(X[:, :features.n_preprocessed], expected, rtol=0, atol=ATOL)
+
+
+def test_compiled_model_matches_pipeline(pipeline, frame):
+    _, anomaly_expected, proba_expected = reference_scores(pipeline, frame)
+    proba, anomaly_score = CompiledModel.from_assets(pipeline).predict_frame(frame)
+    np.testing.assert_allclose(anomaly_score, anomaly_expected, rtol=0, atol=ATOL)
+    np.testing.assert_allclose(proba, proba_expected, rtol=0, atol=ATOL)
+
+
+def test_score_frame_matches_pipeline(pipeline, frame):
+    _, anomaly_expected, proba_expected = reference_scores(pipeline, frame)
+    proba, anomaly_score = score_frame(pipeline, frame)
+    np.testing.assert_allclose(anomaly_score, anomaly_expected, rtol=0, atol=ATOL)
+    np.testing.assert_allclose(proba, proba_expected, rtol=0, atol=ATOL)
+
+
+@pytest.mark.skipif(not has_native(MODEL_DIR), reason="format native belum dikonversi (python -m jaga.artifacts)")
+def test_native_matches_pipeline(pipeline, frame):
+    _, anomaly_expected, proba_expected = reference_scores(pipeline, frame)
+    native = load_native(MODEL_DIR)
+    proba, anomaly_score = score_frame(native, frame)
+    np.testing.assert_allclose(anomaly_score, anomaly_expected, rtol=0, atol=ATOL)
+    np.testing.assert_allclose(proba, proba_expected, rtol=0, atol=ATOL)
+
+    proba_records, _, decision = score_records(native, frame.to_dict('records'))
+    np.testing.assert_allclose(proba_records, proba_expected, rtol=0, atol=ATOL)
+    np.testing.assert_array_equal(decision, pipeline['policy'].decide(proba_expected))